@@ -0,0 +1,96 @@
+"""Benchmark ``POST /api/sessions/{id}/games`` across player counts.
+
+Shows that the scoring-config lookup no longer scales with the number of
+players: the settings query count stays flat and per-game latency only
+grows with the (unavoidable) per-player point calculation.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_add_game [--games 200]
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import StaticPool, create_engine, event
+from sqlalchemy.orm import sessionmaker
+from starlette.testclient import TestClient
+
+from database.connection import Base, get_db
+from main import app
+
+PLAYER_COUNTS = (4, 16, 64, 256)
+
+
+def _make_client() -> tuple[TestClient, object]:
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+
+    def _override():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _override
+    return TestClient(app), engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=200)
+    args = parser.parse_args()
+
+    client, engine = _make_client()
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *rest: statements.append(statement),
+    )
+
+    client.post("/api/import", json={"teams": [
+        {"id": "t1", "name": "Team 1"}, {"id": "t2", "name": "Team 2"},
+    ]})
+    client.put("/api/settings", json={"league_name": "Benchmark"})
+    session_id = client.post(
+        "/api/sessions", json={"name": "Bench", "team_ids": ["t1", "t2"]}
+    ).json()["id"]
+
+    print(f"{'players':>8} {'p50 ms':>8} {'p99 ms':>8} {'settings q/game':>16}")
+    for count in PLAYER_COUNTS:
+        players = [f"P{i}" for i in range(count)]
+        body = {
+            "name": f"{count} players",
+            "player_placements": {p: i + 1 for i, p in enumerate(players)},
+            "team_player_map": {
+                "t1": players[: count // 2],
+                "t2": players[count // 2:],
+            },
+        }
+        timings = []
+        statements.clear()
+        for _ in range(args.games):
+            start = time.perf_counter()
+            client.post(f"/api/sessions/{session_id}/games", json=body)
+            timings.append((time.perf_counter() - start) * 1000)
+        settings_queries = sum("FROM settings" in s for s in statements)
+        timings.sort()
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(
+            f"{count:>8} {statistics.median(timings):>8.2f} {p99:>8.2f} "
+            f"{settings_queries / args.games:>16.2f}"
+        )
+
+    app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    main()
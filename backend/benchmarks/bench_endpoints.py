@@ -0,0 +1,229 @@
+"""Benchmark the main endpoints at several league sizes.
+
+For each scale point a deterministic league (``benchmarks.league``) is
+imported into a temporary file database with the production SQLite profile,
+then the leaderboard, session scores, export, import and add-game endpoints
+are timed. Each endpoint reports p50/p95/p99 latency, SQL statements per
+request and the peak Python memory allocated while serving one request.
+
+Results are written as JSON (with the git commit, when known) so runs on
+different commits can be diffed.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_endpoints [--scales small,medium] \\
+        [--requests 50] [--output bench_endpoints.json]
+"""
+
+import argparse
+import json
+import platform
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from starlette.testclient import TestClient
+
+from benchmarks.league import LeagueSpec, generate_league
+from database.connection import Base, build_engine, get_db
+from main import app
+
+SCALES = {
+    "small": LeagueSpec(teams=8, sessions=10, games_per_session=10),
+    "medium": LeagueSpec(teams=16, sessions=100, games_per_session=20),
+    "large": LeagueSpec(teams=32, sessions=1000, games_per_session=20),
+}
+# Whole-archive endpoints are much slower; time fewer of them.
+HEAVY_ENDPOINTS = {"export_data", "import_data"}
+
+
+class _Database:
+    """A fresh file database wired into the app, counting its statements."""
+
+    def __init__(self, path: Path):
+        self.engine = build_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=self.engine)
+        self.statements = 0
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        factory = sessionmaker(bind=self.engine)
+
+        def _override():
+            db = factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = _override
+
+    def _count(self, *args) -> None:
+        self.statements += 1
+
+    def dispose(self) -> None:
+        self.engine.dispose()
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _measure(request, requests: int, setup=None) -> dict:
+    """Time ``request()``; ``setup()`` runs untimed before each call.
+
+    The last call is not timed; it runs under ``tracemalloc`` for peak memory.
+    """
+    timings, queries = [], []
+    for i in range(requests + 1):
+        if setup:
+            setup()
+        traced = i == requests
+        if traced:
+            tracemalloc.start()
+        start = time.perf_counter()
+        before = request.database.statements
+        resp = request()
+        elapsed = time.perf_counter() - start
+        if traced:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        else:
+            timings.append(elapsed * 1000)
+            queries.append(request.database.statements - before)
+        assert resp.status_code < 300, resp.text
+    return {
+        "requests": requests,
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(_percentile(timings, 0.95), 3),
+        "p99_ms": round(_percentile(timings, 0.99), 3),
+        "max_ms": round(max(timings), 3),
+        "queries_per_request": round(statistics.mean(queries), 2),
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+class _Request:
+    """A bound request against whichever database is currently installed."""
+
+    def __init__(self, client: TestClient, method: str, url: str, **kwargs):
+        self.client = client
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+        self.database: _Database | None = None
+
+    def __call__(self):
+        return self.client.request(self.method, self.url, **self.kwargs)
+
+
+def _run_scale(name: str, spec: LeagueSpec, requests: int, tmp: Path) -> dict:
+    archive = generate_league(spec)
+    client = TestClient(app)
+    heavy = max(3, requests // 10)
+    databases: list[_Database] = []
+
+    def fresh_database() -> None:
+        databases.append(_Database(tmp / f"{name}-{len(databases)}.db"))
+        import_request.database = databases[-1]
+
+    results = {}
+    import_request = _Request(client, "POST", "/api/import", json=archive)
+    results["import_data"] = _measure(import_request, heavy, setup=fresh_database)
+
+    # Read endpoints run against the last imported database.
+    database = databases[-1]
+    completed = [s for s in archive["sessions"] if s["status"] == "completed"]
+    active = archive["sessions"][-1]
+    sample = active["games"][0]
+    game_body = {
+        "name": "Bench game",
+        "player_placements": sample["playerPlacements"],
+        "team_player_map": sample["teamPlayerMap"],
+    }
+    endpoints = {
+        "get_leaderboard": _Request(client, "GET", "/api/stats/leaderboard"),
+        "get_session_scores": _Request(
+            client, "GET", f"/api/sessions/{completed[-1]['id']}/scores"
+        ),
+        "export_data": _Request(client, "GET", "/api/export"),
+        "add_game": _Request(
+            client, "POST", f"/api/sessions/{active['id']}/games", json=game_body
+        ),
+    }
+    for endpoint, request in endpoints.items():
+        request.database = database
+        count = heavy if endpoint in HEAVY_ENDPOINTS else requests
+        request()  # warm up
+        results[endpoint] = _measure(request, count)
+
+    for db in databases:
+        db.dispose()
+    return {
+        "scale": name,
+        "spec": spec.as_dict(),
+        "games": spec.sessions * spec.games_per_session,
+        "endpoints": results,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="small,medium",
+                        help=f"comma-separated subset of {', '.join(SCALES)}")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--output", type=Path, default=Path("bench_endpoints.json"))
+    args = parser.parse_args()
+
+    scales = [scale.strip() for scale in args.scales.split(",") if scale.strip()]
+    unknown = set(scales) - set(SCALES)
+    if unknown:
+        parser.error(f"unknown scale(s): {', '.join(sorted(unknown))}")
+
+    runs = []
+    print(
+        f"{'scale':>8} {'endpoint':>20} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'queries':>8} {'peak KiB':>10}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            run = _run_scale(scale, SCALES[scale], args.requests, Path(tmp))
+            runs.append(run)
+            for endpoint, r in run["endpoints"].items():
+                print(
+                    f"{scale:>8} {endpoint:>20} {r['p50_ms']:>9.2f} "
+                    f"{r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f} "
+                    f"{r['queries_per_request']:>8.1f} {r['peak_memory_kib']:>10.1f}"
+                )
+    app.dependency_overrides.clear()
+
+    report = {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "runs": runs,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
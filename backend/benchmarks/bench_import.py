@@ -0,0 +1,115 @@
+"""Benchmark the bulk import engine on a multi-season archive.
+
+Builds an export-shaped payload (100k games by default), validates it with
+the import schema, and imports it into a temporary file database with the
+production SQLite profile. Prints per-phase timings and the number of SQL
+statements issued, which stays proportional to batches rather than rows.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_import [--games 100000] [--games-per-session 20]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from database.connection import Base, build_engine
+from database.orm_models import Game
+from models.schemas import ImportDataPayload
+from services.bulk_import import BulkImporter
+
+TEAMS = 8
+PLAYERS_PER_TEAM = 4
+
+
+def _build_archive(games: int, games_per_session: int) -> dict:
+    teams = [
+        {
+            "id": f"t{i}",
+            "name": f"Team {i}",
+            "players": [f"P{i}-{j}" for j in range(PLAYERS_PER_TEAM)],
+        }
+        for i in range(TEAMS)
+    ]
+    sessions = []
+    for s in range(-(-games // games_per_session)):
+        # Four teams per session, rotating through the league.
+        team_ids = [f"t{(s + k) % TEAMS}" for k in range(4)]
+        session_games = []
+        for g in range(min(games_per_session, games - s * games_per_session)):
+            order = team_ids[g % 4:] + team_ids[:g % 4]
+            session_games.append({
+                "id": f"s{s}g{g}",
+                "name": f"Game {g + 1}",
+                "teamPlayerMap": {tid: [f"P{tid[1:]}-0"] for tid in team_ids},
+                "playerPlacements": {
+                    f"{tid}::P{tid[1:]}-0": rank + 1
+                    for rank, tid in enumerate(order)
+                },
+                "points": {tid: 4 - rank for rank, tid in enumerate(order)},
+                "placements": {tid: rank + 1 for rank, tid in enumerate(order)},
+            })
+        sessions.append({
+            "id": f"s{s}",
+            "name": f"Session {s + 1}",
+            "teamIds": team_ids,
+            "status": "completed",
+            "games": session_games,
+            "penalties": [{"id": f"s{s}p", "teamId": team_ids[-1], "value": -1}],
+        })
+    return {"teams": teams, "sessions": sessions}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--games-per-session", type=int, default=20)
+    args = parser.parse_args()
+
+    raw = _build_archive(args.games, args.games_per_session)
+    start = time.perf_counter()
+    payload = ImportDataPayload.model_validate(raw)
+    parse_ms = (time.perf_counter() - start) * 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        statements = 0
+
+        def _count(*_):
+            nonlocal statements
+            statements += 1
+
+        event.listen(engine, "before_cursor_execute", _count)
+        db = sessionmaker(bind=engine)()
+
+        start = time.perf_counter()
+        importer = BulkImporter(db)
+        importer.add_teams(payload.teams)
+        importer.add_sessions(payload.sessions)
+        importer.finish()
+        db.commit()
+        total_ms = (time.perf_counter() - start) * 1000
+        imported_games = db.query(Game).count()
+        db.close()
+        engine.dispose()
+
+    print(
+        f"{len(payload.sessions)} sessions, {imported_games} games, "
+        f"{TEAMS} teams"
+    )
+    print(f"{'phase':>12} {'ms':>10}")
+    print(f"{'parse':>12} {parse_ms:>10.0f}")
+    for phase, ms in importer.timings_ms().items():
+        print(f"{phase:>12} {ms:>10.0f}")
+    print(f"{'total':>12} {total_ms:>10.0f}")
+    print(f"{statements} SQL statements")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Load-test the kiosk scoreboard with many simultaneous viewers.
+
+Runs the app in-process (ASGI transport, no sockets) against a temporary
+file database. ``--viewers`` clients poll concurrently for ``--seconds``
+while one scorekeeper records a game every ``--write-interval`` seconds.
+The kiosk snapshot is compared with what a screen had to poll before:
+the leaderboard plus the scores of every active session (one row of
+"req/s" there is one full screen refresh).
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_kiosk [--viewers 200] [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy.orm import sessionmaker
+
+from database.connection import Base, build_engine, get_db
+from main import app
+
+TEAMS = 8
+ACTIVE_SESSIONS = 3
+
+
+def _game(team_ids: list[str], n: int) -> dict:
+    order = team_ids[n % len(team_ids):] + team_ids[:n % len(team_ids)]
+    return {
+        "name": f"Game {n}",
+        "player_placements": {f"P{tid}": i + 1 for i, tid in enumerate(order)},
+        "team_player_map": {tid: [f"P{tid}"] for tid in team_ids},
+    }
+
+
+async def _seed(client: httpx.AsyncClient) -> list[tuple[str, list[str]]]:
+    await client.post("/api/import", json={"teams": [
+        {"id": f"t{i}", "name": f"Team {i}", "players": [f"Pt{i}"]}
+        for i in range(TEAMS)
+    ]})
+    sessions = []
+    for s in range(ACTIVE_SESSIONS):
+        team_ids = [f"t{(s + k) % TEAMS}" for k in range(4)]
+        resp = await client.post(
+            "/api/sessions", json={"name": f"Live {s}", "team_ids": team_ids}
+        )
+        sid = resp.json()["id"]
+        for n in range(10):
+            await client.post(f"/api/sessions/{sid}/games", json=_game(team_ids, n))
+        sessions.append((sid, team_ids))
+    return sessions
+
+
+async def _poll_kiosk(client: httpx.AsyncClient, _sessions) -> int:
+    resp = await client.get("/api/kiosk/scoreboard")
+    return resp.status_code
+
+
+async def _poll_endpoints(client: httpx.AsyncClient, sessions) -> int:
+    responses = await asyncio.gather(
+        client.get("/api/stats/leaderboard"),
+        *(client.get(f"/api/sessions/{sid}/scores") for sid, _ in sessions),
+    )
+    return max(resp.status_code for resp in responses)
+
+
+async def _run(client, sessions, poll, viewers: int, seconds: float,
+               write_interval: float) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    async def viewer() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if await poll(client, sessions) != 200:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    async def scorekeeper() -> int:
+        writes = 0
+        while time.perf_counter() < deadline:
+            sid, team_ids = sessions[writes % len(sessions)]
+            await client.post(
+                f"/api/sessions/{sid}/games", json=_game(team_ids, writes)
+            )
+            writes += 1
+            await asyncio.sleep(write_interval)
+        return writes
+
+    started = time.perf_counter()
+    *_, writes = await asyncio.gather(
+        *(viewer() for _ in range(viewers)), scorekeeper()
+    )
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+        "writes": writes,
+    }
+
+
+async def _main(args) -> None:
+    # A sync route keeps its session's connection until its response has been
+    # serialized on a worker thread. With fewer pooled connections than
+    # in-flight requests, every worker ends up waiting on the pool and the
+    # polling baseline deadlocks, so give it one connection per request.
+    os.environ.setdefault(
+        "DB_MAX_OVERFLOW", str(args.viewers * (ACTIVE_SESSIONS + 1))
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine)
+
+        def _override():
+            db = factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = _override
+        transport = httpx.ASGITransport(app=app)
+        limits = httpx.Limits(max_connections=None)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", limits=limits
+        ) as client:
+            sessions = await _seed(client)
+            print(
+                f"{args.viewers} viewers, {args.seconds:g}s, "
+                f"one game every {args.write_interval:g}s"
+            )
+            print(
+                f"{'endpoint':>22} {'req/s':>8} {'p50 ms':>8} "
+                f"{'p99 ms':>8} {'errors':>7} {'writes':>7}"
+            )
+            for label, poll in (
+                ("kiosk snapshot", _poll_kiosk),
+                ("leaderboard+scores", _poll_endpoints),
+            ):
+                result = await _run(
+                    client, sessions, poll,
+                    args.viewers, args.seconds, args.write_interval,
+                )
+                print(
+                    f"{label:>22} {result['rps']:>8.0f} {result['p50']:>8.1f} "
+                    f"{result['p99']:>8.1f} {result['errors']:>7} "
+                    f"{result['writes']:>7}"
+                )
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--viewers", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--write-interval", type=float, default=0.5)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""Load-test one app instance with a tournament-night traffic mix.
+
+Starts ``uvicorn`` in a subprocess against a temporary SQLite file, imports
+a synthetic league (``benchmarks.league``) and then, for each concurrency
+level, runs that many virtual users for ``--seconds``. Each user loops over
+a weighted mix: mostly leaderboard, session, scores, dashboard and kiosk
+polls, with bursts of ``POST /games``, the odd penalty, and occasionally a
+session being completed (and a new one started in its place).
+
+For every level it reports throughput, error rate, how many server errors
+were ``database is locked`` (counted in the server's log, since a 500
+response does not carry the cause) and p50/p95/p99 latency. ``--output``
+also writes the results, per endpoint, as JSON.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_load [--concurrency 1,8,32,64] [--seconds 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import httpx
+
+from benchmarks.league import LeagueSpec, generate_league
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+LOCKED = "database is locked"
+
+# (action, weight): reads dominate, writes arrive in bursts.
+TRAFFIC_MIX = (
+    ("leaderboard", 30),
+    ("session", 20),
+    ("scores", 20),
+    ("dashboard", 8),
+    ("kiosk", 10),
+    ("game_burst", 9),
+    ("penalty", 2),
+    ("complete_session", 1),
+)
+GAME_BURST = (1, 4)  # games posted back to back by one scorekeeper
+
+
+class Tournament:
+    """Active sessions shared by every virtual user."""
+
+    def __init__(self, archive: dict, rng: random.Random):
+        self.rosters = {team["id"]: team["players"] for team in archive["teams"]}
+        self.active = {
+            s["id"]: s["teamIds"]
+            for s in archive["sessions"]
+            if s["status"] == "active"
+        }
+        self.rng = rng
+        self.started = 0
+
+    def pick(self) -> tuple[str, list[str]]:
+        session_id = self.rng.choice(list(self.active))
+        return session_id, self.active[session_id]
+
+    def game_body(self, team_ids: list[str]) -> dict:
+        team_player_map = {tid: self.rosters[tid][:2] for tid in team_ids}
+        keys = [f"{tid}::{p}" for tid, names in team_player_map.items() for p in names]
+        positions = list(range(1, len(keys) + 1))
+        self.rng.shuffle(positions)
+        return {
+            "name": "Load game",
+            "player_placements": dict(zip(keys, positions)),
+            "team_player_map": team_player_map,
+        }
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, Counter] = defaultdict(Counter)
+
+    def add(self, label: str, seconds: float, status: int | str) -> None:
+        self.latencies[label].append(seconds * 1000)
+        self.statuses[label][status] += 1
+
+
+async def _request(
+    client: httpx.AsyncClient, recorder: Recorder, label: str, method: str,
+    url: str, **kwargs,
+) -> httpx.Response | None:
+    start = time.perf_counter()
+    try:
+        resp = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as exc:
+        recorder.add(label, time.perf_counter() - start, type(exc).__name__)
+        return None
+    recorder.add(label, time.perf_counter() - start, resp.status_code)
+    return resp
+
+
+async def _act(
+    client: httpx.AsyncClient, recorder: Recorder, tournament: Tournament,
+    action: str,
+) -> None:
+    session_id, team_ids = tournament.pick()
+    if action == "leaderboard":
+        await _request(client, recorder, action, "GET", "/api/stats/leaderboard")
+    elif action == "session":
+        await _request(client, recorder, action, "GET", f"/api/sessions/{session_id}")
+    elif action == "scores":
+        url = f"/api/sessions/{session_id}/scores"
+        await _request(client, recorder, action, "GET", url)
+    elif action == "dashboard":
+        await _request(client, recorder, action, "GET", "/api/dashboard")
+    elif action == "kiosk":
+        await _request(client, recorder, action, "GET", "/api/kiosk/scoreboard")
+    elif action == "game_burst":
+        for _ in range(tournament.rng.randint(*GAME_BURST)):
+            await _request(
+                client, recorder, "add_game", "POST",
+                f"/api/sessions/{session_id}/games",
+                json=tournament.game_body(team_ids),
+            )
+    elif action == "penalty":
+        await _request(
+            client, recorder, "add_penalty", "POST",
+            f"/api/sessions/{session_id}/penalties",
+            json={"team_id": tournament.rng.choice(team_ids), "value": -1},
+        )
+    elif action == "complete_session" and len(tournament.active) > 1:
+        del tournament.active[session_id]
+        await _request(
+            client, recorder, action, "PUT", f"/api/sessions/{session_id}",
+            json={"status": "completed"},
+        )
+        tournament.started += 1
+        resp = await _request(
+            client, recorder, "create_session", "POST", "/api/sessions",
+            json={"name": f"Late session {tournament.started}", "team_ids": team_ids},
+        )
+        if resp is not None and resp.status_code == 201:
+            tournament.active[resp.json()["id"]] = team_ids
+
+
+async def _user(
+    client: httpx.AsyncClient, recorder: Recorder, tournament: Tournament,
+    deadline: float,
+) -> None:
+    actions = [action for action, _ in TRAFFIC_MIX]
+    weights = [weight for _, weight in TRAFFIC_MIX]
+    while time.perf_counter() < deadline:
+        action = tournament.rng.choices(actions, weights)[0]
+        await _act(client, recorder, tournament, action)
+
+
+async def _run_level(
+    base_url: str, tournament: Tournament, users: int, seconds: float
+) -> tuple[Recorder, float]:
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        recorder = Recorder()
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            _user(client, recorder, tournament, start + seconds)
+            for _ in range(users)
+        ))
+        return recorder, time.perf_counter() - start
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _summary(latencies: list[float], statuses: Counter, elapsed: float) -> dict:
+    requests = sum(statuses.values())
+    errors = sum(
+        count for status, count in statuses.items()
+        if not isinstance(status, int) or status >= 500
+    )
+    return {
+        "requests": requests,
+        "throughput_rps": round(requests / elapsed, 1),
+        "error_rate": round(errors / requests, 4) if requests else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.50), 2) if latencies else None,
+        "p95_ms": round(_percentile(latencies, 0.95), 2) if latencies else None,
+        "p99_ms": round(_percentile(latencies, 0.99), 2) if latencies else None,
+        "statuses": {str(status): count for status, count in statuses.items()},
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(db_path: Path, port: int, log_path: Path) -> subprocess.Popen:
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}"}
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=log_path.open("w"),
+    )
+
+
+def _wait_until_ready(base_url: str, server: subprocess.Popen) -> None:
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit("server exited during startup; see its log")
+        try:
+            httpx.get(f"{base_url}/api/settings", timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise SystemExit("server did not start within 30 seconds")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,8,32,64",
+                        help="comma-separated virtual user counts")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--sessions", type=int, default=200,
+                        help="completed sessions in the seeded league")
+    parser.add_argument("--active-sessions", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    spec = LeagueSpec(
+        teams=16,
+        sessions=args.sessions + args.active_sessions,
+        games_per_session=10,
+        active_sessions=args.active_sessions,
+        seed=args.seed,
+    )
+    archive = generate_league(spec)
+    tournament = Tournament(archive, random.Random(args.seed))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        log_path = Path(tmp) / "server.log"
+        server = _start_server(Path(tmp) / "load.db", port, log_path)
+        try:
+            _wait_until_ready(base_url, server)
+            resp = httpx.post(f"{base_url}/api/import", json=archive, timeout=300)
+            resp.raise_for_status()
+
+            print(
+                f"{'users':>6} {'req/s':>8} {'requests':>9} {'errors':>7} "
+                f"{'locked':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+            )
+            results = []
+            for users in levels:
+                log_offset = log_path.stat().st_size
+                recorder, elapsed = asyncio.run(
+                    _run_level(base_url, tournament, users, args.seconds)
+                )
+                with log_path.open() as log:
+                    log.seek(log_offset)
+                    locked = log.read().count(LOCKED)
+
+                overall = _summary(
+                    [ms for values in recorder.latencies.values() for ms in values],
+                    sum(recorder.statuses.values(), Counter()),
+                    elapsed,
+                )
+                results.append({
+                    "users": users,
+                    "database_locked": locked,
+                    **overall,
+                    "endpoints": {
+                        label: _summary(values, recorder.statuses[label], elapsed)
+                        for label, values in sorted(recorder.latencies.items())
+                    },
+                })
+                print(
+                    f"{users:>6} {overall['throughput_rps']:>8.1f} "
+                    f"{overall['requests']:>9} {overall['error_rate']:>7.2%} "
+                    f"{locked:>7} {overall['p50_ms']:>8.2f} "
+                    f"{overall['p95_ms']:>8.2f} {overall['p99_ms']:>8.2f}"
+                )
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+    if args.output:
+        report = {"spec": spec.as_dict(), "seconds": args.seconds, "levels": results}
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark ``GET /api/sessions/{id}`` with and without ``fast=true``.
+
+Seeds one session with hundreds of games (imported in bulk) and times the
+default path (ORM objects validated by ``SessionResponse``, stdlib JSON)
+against the fast path (column rows encoded by ``services.fast_json``, JSON
+columns spliced in as stored). Reports p50/p99 wall latency and CPU time
+per request; the fast body is larger only because stored JSON keeps the
+stdlib's ", " separators.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_serialization [--games 500] [--requests 200]
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import StaticPool, create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.testclient import TestClient
+
+from database.connection import Base, get_db
+from main import app
+from services.fast_json import JSON_ENCODER
+
+TEAMS = 4
+PLAYERS_PER_TEAM = 4
+
+
+def _make_client() -> TestClient:
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+
+    def _override():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _override
+    return TestClient(app)
+
+
+def _archive(games: int) -> dict:
+    team_ids = [f"t{i}" for i in range(TEAMS)]
+    players = {
+        tid: [f"{tid}-p{j}" for j in range(PLAYERS_PER_TEAM)] for tid in team_ids
+    }
+    session_games = []
+    for g in range(games):
+        order = team_ids[g % TEAMS:] + team_ids[:g % TEAMS]
+        session_games.append({
+            "id": f"g{g}",
+            "name": f"Game {g + 1}",
+            "teamPlayerMap": players,
+            "playerPlacements": {
+                f"{tid}::{player}": rank * PLAYERS_PER_TEAM + j + 1
+                for rank, tid in enumerate(order)
+                for j, player in enumerate(players[tid])
+            },
+            "points": {tid: TEAMS - rank for rank, tid in enumerate(order)},
+            "placements": {tid: rank + 1 for rank, tid in enumerate(order)},
+        })
+    return {
+        "teams": [
+            {"id": tid, "name": f"Team {tid}", "players": players[tid]}
+            for tid in team_ids
+        ],
+        "sessions": [{
+            "id": "bench",
+            "name": "Bench",
+            "teamIds": team_ids,
+            "games": session_games,
+            "penalties": [
+                {"id": f"p{i}", "teamId": team_ids[i % TEAMS], "value": -1}
+                for i in range(games // 10)
+            ],
+        }],
+    }
+
+
+def _measure(client: TestClient, params: dict, requests: int) -> dict:
+    walls, cpus = [], []
+    for _ in range(requests):
+        wall, cpu = time.perf_counter(), time.process_time()
+        resp = client.get("/api/sessions/bench", params=params)
+        cpus.append(time.process_time() - cpu)
+        walls.append(time.perf_counter() - wall)
+        assert resp.status_code == 200
+    walls.sort()
+    return {
+        "p50": statistics.median(walls) * 1000,
+        "p99": walls[int(len(walls) * 0.99) - 1] * 1000,
+        "cpu": statistics.mean(cpus) * 1000,
+        "bytes": len(resp.content),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    client = _make_client()
+    client.post("/api/import", json=_archive(args.games))
+    default = client.get("/api/sessions/bench").json()
+    assert client.get("/api/sessions/bench", params={"fast": True}).json() == default
+
+    print(f"{args.games} games, {args.requests} requests, encoder: {JSON_ENCODER}")
+    print(f"{'path':>8} {'p50 ms':>8} {'p99 ms':>8} {'cpu ms/req':>11} {'bytes':>9}")
+    for label, params in (("default", {}), ("fast", {"fast": True})):
+        _measure(client, params, 10)  # warm up
+        result = _measure(client, params, args.requests)
+        print(
+            f"{label:>8} {result['p50']:>8.2f} {result['p99']:>8.2f} "
+            f"{result['cpu']:>11.2f} {result['bytes']:>9}"
+        )
+    app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    main()
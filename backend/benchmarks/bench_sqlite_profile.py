@@ -0,0 +1,130 @@
+"""Concurrency benchmark comparing SQLite engine profiles on a file DB.
+
+Runs parallel reader threads (session scores + leaderboard reads) and
+writer threads (penalty inserts with their score-total updates) for a
+fixed duration against each profile, then reports throughput and how many
+operations failed with "database is locked".
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_sqlite_profile [--readers 8] [--writers 4]
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from database.connection import Base, build_engine
+from database.orm_models import Penalty, Session, Team, TeamStanding
+from services.projections import (
+    apply_penalty_totals,
+    get_session_totals,
+    init_session_totals,
+)
+
+
+def _seed(factory) -> str:
+    db = factory()
+    db.add_all([Team(id="t1", name="Team 1"), Team(id="t2", name="Team 2")])
+    session = Session(id="bench", name="Bench", team_ids=["t1", "t2"])
+    db.add(session)
+    db.flush()
+    init_session_totals(db, session)
+    db.commit()
+    db.close()
+    return "bench"
+
+
+def _run_profile(profile: str, args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", profile)
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine, autoflush=False)
+        session_id = _seed(factory)
+
+        counts = {"reads": 0, "writes": 0, "locked": 0, "errors": 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def _record(key: str) -> None:
+            with lock:
+                counts[key] += 1
+
+        def reader() -> None:
+            while not stop.is_set():
+                db = factory()
+                try:
+                    get_session_totals(db, session_id)
+                    db.query(TeamStanding).order_by(
+                        TeamStanding.total_points.desc()
+                    ).all()
+                    _record("reads")
+                except OperationalError as exc:
+                    _record("locked" if "locked" in str(exc) else "errors")
+                finally:
+                    db.close()
+
+        def writer() -> None:
+            while not stop.is_set():
+                db = factory()
+                try:
+                    penalty = Penalty(session_id=session_id, team_id="t1", value=-1)
+                    db.add(penalty)
+                    apply_penalty_totals(db, penalty)
+                    db.commit()
+                    _record("writes")
+                except OperationalError as exc:
+                    db.rollback()
+                    _record("locked" if "locked" in str(exc) else "errors")
+                finally:
+                    db.close()
+
+        threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+        threads += [threading.Thread(target=writer) for _ in range(args.writers)]
+        for t in threads:
+            t.start()
+        time.sleep(args.duration)
+        stop.set()
+        for t in threads:
+            t.join()
+        engine.dispose()
+
+    return {
+        "profile": profile,
+        "reads_per_s": counts["reads"] / args.duration,
+        "writes_per_s": counts["writes"] / args.duration,
+        "locked": counts["locked"],
+        "errors": counts["errors"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(
+        f"{args.readers} readers, {args.writers} writers, "
+        f"{args.duration:.0f}s per profile"
+    )
+    print(
+        f"{'profile':>12} {'reads/s':>10} {'writes/s':>10} "
+        f"{'locked':>8} {'errors':>8}"
+    )
+    for profile in ("legacy", "production"):
+        r = _run_profile(profile, args)
+        print(
+            f"{r['profile']:>12} {r['reads_per_s']:>10.0f} "
+            f"{r['writes_per_s']:>10.0f} {r['locked']:>8} {r['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
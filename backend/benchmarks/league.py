@@ -0,0 +1,116 @@
+"""Deterministic synthetic league for benchmarks.
+
+``generate_league`` builds an archive in the ``POST /api/import`` format:
+N teams, M sessions of K games with P players each, and penalties at a
+given rate per game. Points and placements are computed with the default
+scoring tables, exactly as ``add_game`` would. The same spec and seed always
+produce the same archive, so runs on different commits see identical data.
+"""
+
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+
+from models.schemas import ScoringConfig, ScoringConfig2P
+from services.scoring import calculate_points
+
+_SCORING_TABLES = (
+    dict(enumerate(ScoringConfig().model_dump().values(), 1)),
+    dict(enumerate(ScoringConfig2P().model_dump().values(), 1)),
+)
+_FIRST_DATE = datetime(2024, 1, 1, 18, 0)
+
+
+@dataclass(frozen=True)
+class LeagueSpec:
+    teams: int = 8
+    sessions: int = 20
+    games_per_session: int = 10
+    players_per_game: int = 8
+    penalty_rate: float = 0.1  # expected penalties per game
+    teams_per_session: int = 4
+    active_sessions: int = 1  # the latest sessions stay active
+    seed: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _game(rng: random.Random, number: int, rosters: dict[str, list[str]],
+          players_per_game: int) -> dict:
+    team_ids = list(rosters)
+    # Deal seats round-robin, so every team fields a player when it can.
+    team_player_map: dict[str, list[str]] = {tid: [] for tid in team_ids}
+    for seat in range(players_per_game):
+        tid = team_ids[seat % len(team_ids)]
+        team_player_map[tid].append(rosters[tid][len(team_player_map[tid])])
+    team_player_map = {tid: names for tid, names in team_player_map.items() if names}
+
+    keys = [
+        f"{tid}::{name}" for tid, names in team_player_map.items() for name in names
+    ]
+    positions = list(range(1, len(keys) + 1))
+    rng.shuffle(positions)
+    player_placements = dict(zip(keys, positions))
+    player_points = {
+        key: calculate_points(pos, len(keys), _SCORING_TABLES)
+        for key, pos in player_placements.items()
+    }
+    return {
+        "name": f"Game {number}",
+        "teamPlayerMap": team_player_map,
+        "playerPlacements": player_placements,
+        "playerPoints": player_points,
+        "points": {
+            tid: sum(player_points[f"{tid}::{name}"] for name in names)
+            for tid, names in team_player_map.items()
+        },
+        "placements": {
+            tid: min(player_placements[f"{tid}::{name}"] for name in names)
+            for tid, names in team_player_map.items()
+        },
+    }
+
+
+def generate_league(spec: LeagueSpec) -> dict:
+    rng = random.Random(spec.seed)
+    per_session = min(spec.teams_per_session, spec.teams)
+    roster_size = -(-spec.players_per_game // per_session)
+    teams = [
+        {
+            "id": f"t{i}",
+            "name": f"Team {i}",
+            "players": [f"T{i}P{j}" for j in range(roster_size)],
+        }
+        for i in range(spec.teams)
+    ]
+    rosters = {team["id"]: team["players"] for team in teams}
+
+    sessions = []
+    for s in range(spec.sessions):
+        team_ids = sorted(rng.sample(list(rosters), per_session))
+        session_rosters = {tid: rosters[tid] for tid in team_ids}
+        games = []
+        penalties = []
+        for g in range(spec.games_per_session):
+            game = _game(rng, g + 1, session_rosters, spec.players_per_game)
+            game["id"] = f"s{s}g{g}"
+            games.append(game)
+            if rng.random() < spec.penalty_rate:
+                penalties.append({
+                    "id": f"s{s}p{len(penalties)}",
+                    "teamId": rng.choice(team_ids),
+                    "value": -rng.choice((1, 2, 3)),
+                    "reason": "Synthetic",
+                })
+        active = s >= spec.sessions - spec.active_sessions
+        sessions.append({
+            "id": f"s{s}",
+            "name": f"Session {s + 1}",
+            "date": (_FIRST_DATE + timedelta(days=s)).isoformat(),
+            "teamIds": team_ids,
+            "status": "active" if active else "completed",
+            "games": games,
+            "penalties": penalties,
+        })
+    return {"teams": teams, "sessions": sessions}
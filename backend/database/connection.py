@@ -1,7 +1,7 @@
 import os
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
@@ -11,7 +11,89 @@ DATABASE_URL = os.getenv(
     "DATABASE_URL", f"sqlite:///{DATA_DIR / 'tournament.db'}"
 )
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Per-connection PRAGMAs applied by each engine profile. "production" lets
+# readers proceed during writes (WAL), waits on locks instead of failing with
+# "database is locked", and trades a little durability on power loss
+# (synchronous=NORMAL) for far fewer fsyncs. "legacy" keeps SQLite defaults.
+SQLITE_PROFILES: dict[str, dict[str, str | int]] = {
+    "production": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -64000,  # negative = KiB, i.e. 64 MiB
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    "legacy": {},
+}
+
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "production")
+
+# Statements slower than this are logged with their query plan and kept for
+# GET /api/debug/slow-queries; 0 disables the log.
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
+
+def _sqlite_pragmas(profile: str) -> dict[str, str | int]:
+    """Resolve a profile's PRAGMAs, applying ``SQLITE_PRAGMA_<NAME>`` overrides."""
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile: {profile}")
+    pragmas = dict(SQLITE_PROFILES[profile])
+    prefix = "SQLITE_PRAGMA_"
+    for key, value in os.environ.items():
+        if key.startswith(prefix):
+            pragmas[key[len(prefix):].lower()] = value
+    return pragmas
+
+
+def _is_memory_url(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
+def build_engine(
+    url: str, profile: str | None = None, slow_query_ms: float | None = None
+) -> Engine:
+    """Create an engine for ``url`` configured with a SQLite tuning profile.
+
+    File databases also get a larger connection pool (``DB_POOL_SIZE``,
+    ``DB_MAX_OVERFLOW``, ``DB_POOL_TIMEOUT``) so concurrent scorekeepers
+    and viewers are not serialized on five pooled connections. Statements
+    slower than ``slow_query_ms`` (default ``SLOW_QUERY_MS``) are recorded
+    by ``services.slow_queries``.
+    """
+    if not url.startswith("sqlite"):
+        return create_engine(url)
+
+    pragmas = _sqlite_pragmas(profile or SQLITE_PROFILE)
+    kwargs: dict = {"connect_args": {"check_same_thread": False}}
+    if not _is_memory_url(url):
+        kwargs.update(
+            pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        )
+    new_engine = create_engine(url, **kwargs)
+
+    if pragmas:
+
+        @event.listens_for(new_engine, "connect")
+        def _apply_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
+    threshold = SLOW_QUERY_MS if slow_query_ms is None else slow_query_ms
+    if threshold > 0:
+        from services.slow_queries import install_slow_query_log
+
+        install_slow_query_log(new_engine, threshold)
+    return new_engine
+
+
+engine = build_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
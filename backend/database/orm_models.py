@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, Integer, JSON, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.connection import Base
@@ -22,6 +22,11 @@ class Team(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc)
     )
+    change_version: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, index=True
+    )
+
+    __table_args__ = (Index("ix_teams_created_at_id", "created_at", "id"),)
 
 
 class Session(Base):
@@ -33,7 +38,16 @@ class Session(Base):
         DateTime, default=lambda: datetime.now(timezone.utc)
     )
     team_ids: Mapped[list] = mapped_column(JSON, default=list)
-    status: Mapped[str] = mapped_column(String, default="active")
+    status: Mapped[str] = mapped_column(String, default="active", index=True)
+    change_version: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, index=True
+    )
+
+    # Keyset pages order by (date, id), with or without a status filter.
+    __table_args__ = (
+        Index("ix_sessions_date_id", "date", "id"),
+        Index("ix_sessions_status_date_id", "status", "date", "id"),
+    )
 
     games: Mapped[list["Game"]] = relationship(
         back_populates="session", cascade="all, delete-orphan"
@@ -41,6 +55,9 @@ class Session(Base):
     penalties: Mapped[list["Penalty"]] = relationship(
         back_populates="session", cascade="all, delete-orphan"
     )
+    team_totals: Mapped[list["SessionTeamTotal"]] = relationship(
+        cascade="all, delete-orphan"
+    )
 
 
 class Game(Base):
@@ -48,7 +65,10 @@ class Game(Base):
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=_generate_id)
     session_id: Mapped[str] = mapped_column(
-        String, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False
+        String,
+        ForeignKey("sessions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     player_placements: Mapped[dict] = mapped_column(JSON, default=dict)
@@ -56,8 +76,17 @@ class Game(Base):
     team_player_map: Mapped[dict] = mapped_column(JSON, default=dict)
     points: Mapped[dict] = mapped_column(JSON, default=dict)
     placements: Mapped[dict] = mapped_column(JSON, default=dict)
+    change_version: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, index=True
+    )
 
     session: Mapped["Session"] = relationship(back_populates="games")
+    team_results: Mapped[list["GameResult"]] = relationship(
+        cascade="all, delete-orphan"
+    )
+    player_results: Mapped[list["GamePlayerResult"]] = relationship(
+        cascade="all, delete-orphan"
+    )
 
 
 class Penalty(Base):
@@ -65,11 +94,17 @@ class Penalty(Base):
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=_generate_id)
     session_id: Mapped[str] = mapped_column(
-        String, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False
+        String,
+        ForeignKey("sessions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
-    team_id: Mapped[str] = mapped_column(String, nullable=False)
+    team_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
     value: Mapped[int] = mapped_column(Integer, nullable=False)
     reason: Mapped[str] = mapped_column(String, default="")
+    change_version: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, index=True
+    )
 
     session: Mapped["Session"] = relationship(back_populates="penalties")
 
@@ -79,3 +114,151 @@ class Setting(Base):
 
     key: Mapped[str] = mapped_column(String, primary_key=True)
     value: Mapped[str] = mapped_column(String, nullable=False, default="")
+    change_version: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, index=True
+    )
+
+
+class TeamStanding(Base):
+    """All-time leaderboard projection over completed sessions.
+
+    Maintained incrementally by the session, game, penalty and import
+    routers; see ``services.projections`` for the update rules.
+    """
+
+    __tablename__ = "team_standings"
+    __table_args__ = (Index("ix_team_standings_total_points", "total_points"),)
+
+    team_id: Mapped[str] = mapped_column(String, primary_key=True)
+    total_points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sessions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class SessionTeamTotal(Base):
+    """Running per-team score totals for one session.
+
+    One row per team in ``Session.team_ids``; ``position`` preserves that
+    order so ties resolve the same way as the original list. Updated in the
+    same transaction as every game and penalty write.
+    """
+
+    __tablename__ = "session_team_totals"
+
+    session_id: Mapped[str] = mapped_column(
+        String, ForeignKey("sessions.id", ondelete="CASCADE"), primary_key=True
+    )
+    team_id: Mapped[str] = mapped_column(String, primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    game_points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    penalty_points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    games: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class DataVersion(Base):
+    """Opaque version token per resource, replaced on every write.
+
+    Lets per-process caches (and HTTP validators) detect changes made by
+    other workers with a single primary-key lookup.
+    """
+
+    __tablename__ = "data_versions"
+
+    resource: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[str] = mapped_column(String, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+
+
+class GameResult(Base):
+    """Normalized per-(game, team) result mirrored from ``Game.points``."""
+
+    __tablename__ = "game_results"
+    __table_args__ = (
+        Index("ix_game_results_session_team", "session_id", "team_id"),
+        Index("ix_game_results_team", "team_id"),
+    )
+
+    game_id: Mapped[str] = mapped_column(
+        String, ForeignKey("games.id", ondelete="CASCADE"), primary_key=True
+    )
+    team_id: Mapped[str] = mapped_column(String, primary_key=True)
+    session_id: Mapped[str] = mapped_column(
+        String, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False
+    )
+    points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    placement: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+
+class GamePlayerResult(Base):
+    """Normalized per-(game, player) result mirrored from ``Game.player_*``.
+
+    ``player_key`` is the key used in ``player_placements`` (either
+    ``teamId::playerName`` or a legacy plain name).
+    """
+
+    __tablename__ = "game_player_results"
+    __table_args__ = (
+        Index("ix_game_player_results_session_team", "session_id", "team_id"),
+        Index("ix_game_player_results_team", "team_id"),
+    )
+
+    game_id: Mapped[str] = mapped_column(
+        String, ForeignKey("games.id", ondelete="CASCADE"), primary_key=True
+    )
+    player_key: Mapped[str] = mapped_column(String, primary_key=True)
+    session_id: Mapped[str] = mapped_column(
+        String, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False
+    )
+    team_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    player_name: Mapped[str] = mapped_column(String, nullable=False)
+    placement: Mapped[int] = mapped_column(Integer, nullable=False)
+    points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class Job(Base):
+    """A background operation run by ``services.jobs``.
+
+    The row is written when the job is queued, started and finished; live
+    progress in between is kept in memory by the runner.
+    """
+
+    __tablename__ = "jobs"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=_generate_id)
+    kind: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(String, default="queued", index=True)
+    progress: Mapped[int] = mapped_column(Integer, default=0)
+    total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    result: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    error: Mapped[str | None] = mapped_column(String, nullable=True)
+    timings_ms: Mapped[dict] = mapped_column(JSON, default=dict)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc), index=True
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class ChangeCounter(Base):
+    """Source of change versions; see ``services.changes``."""
+
+    __tablename__ = "change_counter"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class ChangeTombstone(Base):
+    """A deleted row (or, with ``row_id`` NULL, a whole reset resource)."""
+
+    __tablename__ = "change_tombstones"
+
+    version: Mapped[int] = mapped_column(Integer, primary_key=True)
+    resource: Mapped[str] = mapped_column(String, nullable=False)
+    row_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
@@ -6,8 +6,24 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
-from database.connection import create_tables
-from routers import data, games, sessions, stats, teams, settings
+from database.connection import SessionLocal, create_tables, engine
+from routers import (
+    changes,
+    dashboard,
+    data,
+    debug,
+    games,
+    jobs,
+    kiosk,
+    metrics,
+    sessions,
+    settings,
+    stats,
+    teams,
+)
+from services.changes import track_changes
+from services.metrics import RequestMetricsMiddleware, instrument_engine
+from services.profiler import ProfilerMiddleware
 
 # Default team colors matching the frontend ct-color-picker palette
 TEAM_COLOR_PALETTE = [
@@ -24,6 +40,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(RequestMetricsMiddleware)
+app.add_middleware(ProfilerMiddleware)
+instrument_engine(engine)
+track_changes(SessionLocal)
 
 
 def _generate_default_tag(name: str) -> str:
@@ -89,6 +109,55 @@ def _migrate_team_identity():
         db.close()
 
 
+def _migrate_change_versions():
+    """Add and backfill ``change_version`` on tables that predate it."""
+    from sqlalchemy import inspect as sa_inspect, text
+
+    from database.connection import SessionLocal, engine
+    from services.changes import CHANGE_RESOURCES, backfill_change_versions
+
+    inspector = sa_inspect(engine)
+    with engine.begin() as conn:
+        for model in CHANGE_RESOURCES.values():
+            table = model.__tablename__
+            existing_cols = {c["name"] for c in inspector.get_columns(table)}
+            if "change_version" not in existing_cols:
+                conn.execute(
+                    text(f"ALTER TABLE {table} ADD COLUMN change_version INTEGER")
+                )
+
+    db = SessionLocal()
+    try:
+        if backfill_change_versions(db):
+            db.commit()
+    finally:
+        db.close()
+
+
+# Indexes older databases may still have that a composite index replaced.
+_RETIRED_INDEXES = ("ix_sessions_date",)
+
+
+def _migrate_indexes():
+    """Create indexes declared on the ORM models that existing DBs lack.
+
+    ``create_all()`` only creates indexes together with new tables, so
+    databases from before an index was declared need it added explicitly.
+    Retired indexes are dropped.
+    """
+    from sqlalchemy import text
+
+    from database.connection import Base, engine
+    from database.orm_models import Base as _  # noqa: F401
+
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+        for name in _RETIRED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
 DEFAULT_SETTINGS = {
     "league_name": "Pro League",
     "season": "Season 4",
@@ -99,9 +168,15 @@ DEFAULT_SETTINGS = {
 
 
 def _seed_default_settings():
-    """Seed default settings if the settings table is empty."""
+    """Seed default settings if the settings table is empty.
+
+    Also gives settings a data version if they have none yet (databases
+    seeded before versions existed), so the scoring cache can be used.
+    """
     from database.connection import SessionLocal
     from database.orm_models import Setting
+    from services.data_versions import bump_data_version, get_data_version
+    from services.scoring import SETTINGS_RESOURCE
 
     db = SessionLocal()
     try:
@@ -109,16 +184,63 @@ def _seed_default_settings():
         if existing == 0:
             for key, value in DEFAULT_SETTINGS.items():
                 db.add(Setting(key=key, value=value))
+        if existing == 0 or get_data_version(db, SETTINGS_RESOURCE) is None:
+            bump_data_version(db, SETTINGS_RESOURCE)
             db.commit()
     finally:
         db.close()
 
 
+def _backfill_projections():
+    """Populate score projections for databases that predate them."""
+    from database.connection import SessionLocal
+    from database.orm_models import (
+        Game as GameModel,
+        GameResult,
+        Session as SessionModel,
+        SessionTeamTotal,
+    )
+    from services.projections import rebuild_all
+
+    db = SessionLocal()
+    try:
+        missing_totals = (
+            db.query(SessionTeamTotal.session_id).first() is None
+            and db.query(SessionModel.id).first() is not None
+        )
+        missing_results = (
+            db.query(GameResult.game_id).first() is None
+            and db.query(GameModel.id).first() is not None
+        )
+        if not (missing_totals or missing_results):
+            return
+        rebuild_all(db)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _fail_interrupted_jobs():
+    """Jobs cannot survive a restart; mark any left queued or running failed."""
+    from database.connection import SessionLocal
+    from services.jobs import fail_interrupted_jobs
+
+    db = SessionLocal()
+    try:
+        fail_interrupted_jobs(db)
+    finally:
+        db.close()
+
+
 @app.on_event("startup")
 def on_startup():
     create_tables()
+    _migrate_change_versions()
     _migrate_team_identity()
+    _migrate_indexes()
     _seed_default_settings()
+    _backfill_projections()
+    _fail_interrupted_jobs()
 
 
 app.include_router(teams.router)
@@ -127,6 +249,12 @@ app.include_router(games.router)
 app.include_router(stats.router)
 app.include_router(data.router)
 app.include_router(settings.router)
+app.include_router(dashboard.router)
+app.include_router(jobs.router)
+app.include_router(changes.router)
+app.include_router(kiosk.router)
+app.include_router(metrics.router)
+app.include_router(debug.router)
 
 # --- Static frontend serving ---
 FRONTEND_DIR = Path(__file__).resolve().parent.parent
@@ -230,6 +230,44 @@ class SessionScoreEntry(BaseModel):
     game_points: int
     penalty_points: int
     total: int
+    games_played: int = 0
+
+
+# --- Dashboard ---
+
+
+class DashboardSessionCounts(BaseModel):
+    total: int
+    active: int
+    completed: int
+
+
+class DashboardSessionSummary(BaseModel):
+    id: str
+    name: str
+    date: datetime
+    status: SessionStatus
+    number: int
+    team_ids: list[str]
+    games: int
+    winner_team_id: str | None = None
+    game_points: int
+    penalty_points: int
+    scores: list[SessionScoreEntry] = Field(default_factory=list)
+
+
+class DashboardResponse(BaseModel):
+    team_count: int
+    session_counts: DashboardSessionCounts
+    total_games: int
+    completed_points: int
+    leaderboard: list[LeaderboardEntry]
+    recent_sessions: list[DashboardSessionSummary]
+    recent_matching: int
+
+
+class HistorySessionEntry(SessionResponse):
+    scores: list[SessionScoreEntry] = Field(default_factory=list)
 
 
 # --- Settings ---
@@ -355,3 +393,70 @@ class ImportDataPayload(BaseModel):
     teams: list[ImportTeam] = Field(default_factory=list)
     sessions: list[ImportSession] = Field(default_factory=list)
     settings: ImportSettings | None = None
+
+
+# --- Jobs ---
+
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class JobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    kind: str
+    status: JobStatus
+    progress: int = 0
+    total: int | None = None
+    result: dict | None = None
+    error: str | None = None
+    timings_ms: dict[str, float] = Field(default_factory=dict)
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+# --- Changes ---
+
+ChangeResource = Literal["team", "session", "game", "penalty", "setting"]
+
+
+class ChangeEntry(BaseModel):
+    resource: ChangeResource
+    op: Literal["upsert", "delete", "reset"]
+    version: int
+    id: str | None = None
+    data: dict | None = None
+
+
+class ChangesResponse(BaseModel):
+    changes: list[ChangeEntry]
+    cursor: int
+    has_more: bool
+
+
+# --- Debug ---
+
+class ProfileInfo(BaseModel):
+    id: str
+    method: str
+    path: str
+    status: int
+    duration_ms: float
+    created_at: datetime
+
+
+class SlowQueryEntry(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    statement: str
+    duration_ms: float
+    params_shape: str
+    route: str | None = None
+    plan: list[str] | None = None
+    recorded_at: datetime
+
+
+class SlowQueriesResponse(BaseModel):
+    threshold_ms: float | None
+    queries: list[SlowQueryEntry]
@@ -0,0 +1,97 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session as DBSession
+
+from database.connection import get_db
+from database.orm_models import ChangeTombstone, Game, Penalty, Setting
+from models.schemas import ChangeEntry, ChangesResponse
+from services.changes import CHANGE_RESOURCES, row_id
+from services.export_records import (
+    game_record,
+    penalty_record,
+    session_record,
+    team_record,
+)
+from services.pagination import MAX_PAGE_SIZE
+from services.profiler import ProfiledRoute
+
+router = APIRouter(prefix="/api/changes", tags=["changes"], route_class=ProfiledRoute)
+
+
+def _game_data(g: Game) -> dict:
+    return {**game_record(g), "sessionId": g.session_id}
+
+
+def _penalty_data(p: Penalty) -> dict:
+    return {**penalty_record(p), "sessionId": p.session_id}
+
+
+def _setting_data(s: Setting) -> dict:
+    return {"key": s.key, "value": s.value}
+
+
+# Same field names as /api/export; games and penalties carry their sessionId.
+_SERIALIZERS = {
+    "team": team_record,
+    "session": session_record,
+    "game": _game_data,
+    "penalty": _penalty_data,
+    "setting": _setting_data,
+}
+
+
+@router.get("", response_model=ChangesResponse)
+def get_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=MAX_PAGE_SIZE),
+    db: DBSession = Depends(get_db),
+) -> ChangesResponse:
+    """Rows created, updated or deleted after version ``since``, oldest first.
+
+    Pass the returned ``cursor`` as the next ``since``; keep paging while
+    ``has_more`` is true. A ``reset`` entry means every earlier row of that
+    resource was deleted.
+    """
+    # The first ``limit`` changes overall are among the first ``limit`` of
+    # each source, so each source query is bounded too.
+    entries: list[ChangeEntry] = []
+    for resource, model in CHANGE_RESOURCES.items():
+        rows = (
+            db.query(model)
+            .filter(model.change_version > since)
+            .order_by(model.change_version)
+            .limit(limit + 1)
+        )
+        serialize = _SERIALIZERS[resource]
+        entries.extend(
+            ChangeEntry(
+                resource=resource,
+                op="upsert",
+                version=row.change_version,
+                id=row_id(row),
+                data=serialize(row),
+            )
+            for row in rows
+        )
+    tombstones = (
+        db.query(ChangeTombstone)
+        .filter(ChangeTombstone.version > since)
+        .order_by(ChangeTombstone.version)
+        .limit(limit + 1)
+    )
+    entries.extend(
+        ChangeEntry(
+            resource=t.resource,
+            op="delete" if t.row_id is not None else "reset",
+            version=t.version,
+            id=t.row_id,
+        )
+        for t in tombstones
+    )
+
+    entries.sort(key=lambda entry: entry.version)
+    page = entries[:limit]
+    return ChangesResponse(
+        changes=page,
+        cursor=page[-1].version if page else since,
+        has_more=len(entries) > limit,
+    )
@@ -0,0 +1,142 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session as DBSession, subqueryload
+
+from database.connection import get_db
+from database.orm_models import Game, Session, SessionTeamTotal, Team
+from models.schemas import (
+    DashboardResponse,
+    DashboardSessionCounts,
+    DashboardSessionSummary,
+    HistorySessionEntry,
+)
+from routers.games import session_score_entries
+from routers.stats import load_leaderboard
+from services.pagination import MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, paginate
+from services.profiler import ProfiledRoute
+from services.projections import get_totals_for_sessions
+
+router = APIRouter(
+    prefix="/api/dashboard", tags=["dashboard"], route_class=ProfiledRoute
+)
+
+
+@router.get("", response_model=DashboardResponse)
+def get_dashboard(
+    recent_status: Literal["all", "active", "completed"] = Query("all"),
+    recent_limit: int = Query(6, ge=1, le=50),
+    db: DBSession = Depends(get_db),
+) -> DashboardResponse:
+    """Everything the dashboard renders, in a fixed number of queries."""
+    team_count = db.query(func.count(Team.id)).scalar()
+    status_counts = dict(
+        db.query(Session.status, func.count(Session.id)).group_by(Session.status)
+    )
+    total_games = db.query(func.count(Game.id)).scalar()
+    completed_points = (
+        db.query(func.coalesce(func.sum(SessionTeamTotal.total), 0))
+        .join(Session, Session.id == SessionTeamTotal.session_id)
+        .filter(Session.status == "completed")
+        .scalar()
+    )
+
+    # Session number = 1-based position by date across *all* sessions, so
+    # numbering is stable whichever status filter is applied.
+    numbered = db.query(
+        Session.id.label("id"),
+        func.row_number().over(order_by=(Session.date, Session.id)).label("number"),
+    ).subquery()
+    recent_query = db.query(Session, numbered.c.number).join(
+        numbered, numbered.c.id == Session.id
+    )
+    if recent_status != "all":
+        recent_query = recent_query.filter(Session.status == recent_status)
+    recent = (
+        recent_query.order_by(Session.date.desc(), Session.id.desc())
+        .limit(recent_limit)
+        .all()
+    )
+    recent_ids = [session.id for session, _ in recent]
+
+    totals = get_totals_for_sessions(db, recent_ids)
+    game_counts = dict(
+        db.query(Game.session_id, func.count(Game.id))
+        .filter(Game.session_id.in_(recent_ids))
+        .group_by(Game.session_id)
+    ) if recent_ids else {}
+
+    recent_sessions = []
+    for session, number in recent:
+        scores = session_score_entries(totals[session.id])
+        recent_sessions.append(
+            DashboardSessionSummary(
+                id=session.id,
+                name=session.name,
+                date=session.date,
+                status=session.status,
+                number=number,
+                team_ids=session.team_ids,
+                games=game_counts.get(session.id, 0),
+                winner_team_id=scores[0].team_id if scores else None,
+                game_points=sum(s.game_points for s in scores),
+                penalty_points=sum(s.penalty_points for s in scores),
+                scores=scores,
+            )
+        )
+
+    active = status_counts.get("active", 0)
+    completed = status_counts.get("completed", 0)
+    recent_matching = {
+        "all": active + completed,
+        "active": active,
+        "completed": completed,
+    }[recent_status]
+
+    return DashboardResponse(
+        team_count=team_count,
+        session_counts=DashboardSessionCounts(
+            total=active + completed, active=active, completed=completed
+        ),
+        total_games=total_games,
+        completed_points=completed_points,
+        leaderboard=load_leaderboard(db),
+        recent_sessions=recent_sessions,
+        recent_matching=recent_matching,
+    )
+
+
+@router.get("/history", response_model=list[HistorySessionEntry])
+def get_history(
+    response: Response,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+    db: DBSession = Depends(get_db),
+) -> list[HistorySessionEntry]:
+    """Completed sessions with games, penalties and scores, newest first.
+
+    Returns one page of ``limit`` sessions; ``X-Next-Cursor`` carries the
+    cursor for the next one.
+    """
+    query = (
+        db.query(Session)
+        .options(subqueryload(Session.games), subqueryload(Session.penalties))
+        .filter(Session.status == "completed")
+    )
+    try:
+        sessions, next_cursor = paginate(
+            query, Session.date, Session.id, limit, cursor, descending=True
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    totals = get_totals_for_sessions(db, [s.id for s in sessions])
+
+    result = []
+    for session in sessions:
+        entry = HistorySessionEntry.model_validate(session)
+        entry.scores = session_score_entries(totals[session.id])
+        result.append(entry)
+    return result
@@ -1,19 +1,63 @@
 import json
-
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy.orm import Session as DBSession
+import pickle
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from typing import IO, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import Session as DBSession, selectinload, subqueryload
 
 from database.connection import get_db
-from database.orm_models import Game, Penalty, Session, Setting, Team
+from database.orm_models import (
+    Game,
+    GamePlayerResult,
+    GameResult,
+    Penalty,
+    Session,
+    SessionTeamTotal,
+    Setting,
+    Team,
+    TeamStanding,
+)
 from models.schemas import (
     ImportDataPayload,
+    ImportSession,
     ImportSettings,
+    ImportTeam,
     ScoringConfig,
     ScoringConfig2P,
 )
+from services.bulk_import import BulkImporter, ImportValidationError
+from services.changes import record_resets
+from services.data_versions import (
+    LEADERBOARD_RESOURCE,
+    SESSIONS_RESOURCE,
+    TEAMS_RESOURCE,
+    bump_data_version,
+    bump_data_versions,
+    get_data_versions,
+)
+from services.export_records import (
+    game_record,
+    penalty_record,
+    session_record,
+    team_record,
+)
+from services.jobs import JobContext, start_job
+from services.profiler import ProfiledRoute
+from services.scoreboard import invalidate_scoreboard
+from services.single_flight import single_flight
+from services.scoring import SETTINGS_RESOURCE, invalidate_scoring_cache
 
-router = APIRouter(prefix="/api", tags=["data"])
+router = APIRouter(prefix="/api", tags=["data"], route_class=ProfiledRoute)
 
 class ResetRequest(BaseModel):
     teams: bool = False
@@ -21,19 +65,6 @@ class ResetRequest(BaseModel):
     settings: bool = False
 
 
-def _validate_team_ids_exist(team_ids: list[str], db: DBSession) -> None:
-    if not team_ids:
-        return
-    existing_team_ids = {
-        team_id
-        for (team_id,) in db.query(Team.id).filter(Team.id.in_(team_ids)).all()
-    }
-    missing_team_ids = sorted(set(team_ids) - existing_team_ids)
-    if missing_team_ids:
-        missing = ", ".join(missing_team_ids)
-        raise HTTPException(status_code=422, detail=f"Unknown team_ids: {missing}")
-
-
 def _build_settings_export(db: DBSession) -> dict:
     raw_settings = {row.key: row.value for row in db.query(Setting).all()}
     scoring = (
@@ -77,176 +108,433 @@ def _upsert_import_settings(settings: ImportSettings, db: DBSession) -> int:
     return len(updates)
 
 
+def _session_export(s: Session) -> dict:
+    return {
+        **session_record(s),
+        "games": [game_record(g) for g in s.games],
+        "penalties": [penalty_record(p) for p in s.penalties],
+    }
+
+
+# --- Streaming export ---
+
+_EXPORT_BATCH_SIZE = 200
+
+
+def _iter_team_exports(db: DBSession) -> Iterator[dict]:
+    for team in db.query(Team).order_by(Team.id).yield_per(_EXPORT_BATCH_SIZE):
+        yield team_record(team)
+
+
+def _iter_session_exports(db: DBSession) -> Iterator[dict]:
+    # yield_per keeps one batch of sessions, plus its selectin-loaded games
+    # and penalties, alive at a time.
+    sessions = (
+        db.query(Session)
+        .options(selectinload(Session.games), selectinload(Session.penalties))
+        .order_by(Session.id)
+        .yield_per(_EXPORT_BATCH_SIZE)
+    )
+    for session in sessions:
+        yield _session_export(session)
+
+
+def _json_array_items(records: Iterator[dict]) -> Iterator[str]:
+    for i, record in enumerate(records):
+        yield (", " if i else "") + json.dumps(record)
+
+
+def _json_export_parts(db: DBSession) -> Iterator[str]:
+    yield '{"teams": ['
+    yield from _json_array_items(_iter_team_exports(db))
+    yield '], "sessions": ['
+    yield from _json_array_items(_iter_session_exports(db))
+    yield '], "settings": '
+    yield json.dumps(_build_settings_export(db))
+    yield "}"
+
+
+def _ndjson_export_parts(db: DBSession) -> Iterator[str]:
+    for team in _iter_team_exports(db):
+        yield json.dumps({"type": "team", "data": team}) + "\n"
+    for session in _iter_session_exports(db):
+        yield json.dumps({"type": "session", "data": session}) + "\n"
+    settings = _build_settings_export(db)
+    yield json.dumps({"type": "settings", "data": settings}) + "\n"
+
+
+def _stream_export(bind, fmt: str) -> Iterator[bytes]:
+    # The request-scoped session may be closed before the body is sent, so
+    # the stream reads through its own session on the same engine. Records
+    # are written in batch-sized chunks rather than one write per record.
+    db = DBSession(bind=bind)
+    try:
+        if fmt == "ndjson":
+            parts = _ndjson_export_parts(db)
+        else:
+            parts = _json_export_parts(db)
+        chunk: list[str] = []
+        for part in parts:
+            chunk.append(part)
+            if len(chunk) >= _EXPORT_BATCH_SIZE:
+                yield "".join(chunk).encode()
+                chunk.clear()
+        yield "".join(chunk).encode()
+    finally:
+        db.close()
+
+
 @router.get("/export")
-def export_data(db: DBSession = Depends(get_db)) -> dict:
+def export_data(
+    stream: bool = Query(False),
+    format: Literal["json", "ndjson"] = Query("json"),
+    db: DBSession = Depends(get_db),
+):
+    """Export the league in the format accepted by ``POST /api/import``.
+
+    ``stream=true`` (implied by ``format=ndjson``) writes the document as it
+    is read, in batches, so memory stays flat however long the history.
+    NDJSON emits one ``{"type": "team"|"session"|"settings", "data": ...}``
+    object per line.
+    """
+    if stream or format == "ndjson":
+        media_type = (
+            "application/x-ndjson" if format == "ndjson" else "application/json"
+        )
+        return StreamingResponse(
+            _stream_export(db.get_bind(), format), media_type=media_type
+        )
+
+    body = single_flight.run(
+        "export", _export_versions(db), lambda: _export_body(db)
+    )
+    return Response(body, media_type="application/json")
+
+
+def _export_versions(db: DBSession) -> tuple[str | None, ...]:
+    """Versions covering everything an export reads.
+
+    Concurrent exports with the same versions share one read and one
+    serialized document. Game and penalty writes bump only the leaderboard
+    version, so it is part of the key.
+    """
+    return get_data_versions(
+        db, TEAMS_RESOURCE, SESSIONS_RESOURCE, LEADERBOARD_RESOURCE, SETTINGS_RESOURCE
+    )
+
+
+def _export_body(db: DBSession) -> bytes:
     teams = db.query(Team).all()
-    sessions = db.query(Session).all()
-
-    teams_out = []
-    for t in teams:
-        teams_out.append({
-            "id": t.id,
-            "name": t.name,
-            "players": t.players,
-            "color": t.color,
-            "tag": t.tag,
-            "createdAt": t.created_at.isoformat() if t.created_at else None,
-        })
-
-    sessions_out = []
-    for s in sessions:
-        games_out = []
-        for g in s.games:
-            games_out.append({
-                "id": g.id,
-                "name": g.name,
-                "playerPlacements": g.player_placements,
-                "playerPoints": g.player_points,
-                "teamPlayerMap": g.team_player_map,
-                "points": g.points,
-                "placements": g.placements,
-            })
-
-        penalties_out = []
-        for p in s.penalties:
-            penalties_out.append({
-                "id": p.id,
-                "teamId": p.team_id,
-                "value": p.value,
-                "reason": p.reason,
-            })
-
-        sessions_out.append({
-            "id": s.id,
-            "name": s.name,
-            "date": s.date.isoformat() if s.date else None,
-            "teamIds": s.team_ids,
-            "status": s.status,
-            "games": games_out,
-            "penalties": penalties_out,
-        })
+    # subqueryload reads each collection in one statement; selectinload would
+    # add one per 500 sessions.
+    sessions = (
+        db.query(Session)
+        .options(subqueryload(Session.games), subqueryload(Session.penalties))
+        .all()
+    )
+    return JSONResponse(jsonable_encoder({
+        "teams": [team_record(t) for t in teams],
+        "sessions": [_session_export(s) for s in sessions],
+        "settings": _build_settings_export(db),
+    })).body
+
 
+def _bump_imported_versions(db: DBSession, importer: BulkImporter) -> None:
+    if importer.counts["teams"]:
+        bump_data_version(db, TEAMS_RESOURCE)
+    if importer.counts["sessions"]:
+        bump_data_versions(db, SESSIONS_RESOURCE, LEADERBOARD_RESOURCE)
+
+
+def _run_import(
+    db: DBSession, body: ImportDataPayload, context: JobContext | None = None
+) -> dict:
+    """Import ``body`` and commit; raises ``ImportValidationError``."""
+    importer = BulkImporter(db)
+    importer.add_teams(body.teams)
+    total = len(body.sessions)
+    for done, session in enumerate(body.sessions, 1):
+        importer.add_session(session)
+        if context is not None:
+            context.check_cancelled()
+            context.report(done, total)
+
+    settings_count = (
+        _upsert_import_settings(body.settings, db) if body.settings is not None else 0
+    )
+    if settings_count:
+        bump_data_version(db, SETTINGS_RESOURCE)
+
+    importer.finish()
+    _bump_imported_versions(db, importer)
+    if context is not None:
+        context.check_cancelled()
+        context.timings_ms.update(importer.timings_ms())
+    db.commit()
+    invalidate_scoreboard(db)
+    if settings_count:
+        invalidate_scoring_cache()
     return {
-        "teams": teams_out,
-        "sessions": sessions_out,
-        "settings": _build_settings_export(db),
+        "imported": {
+            "teams": importer.counts["teams"],
+            "sessions": importer.counts["sessions"],
+            "settings": settings_count,
+        },
+        "timings_ms": importer.timings_ms(),
     }
 
 
 @router.post("/import", status_code=201)
-def import_data(body: ImportDataPayload, db: DBSession = Depends(get_db)) -> dict:
+def import_data(
+    body: ImportDataPayload,
+    background: bool = Query(False),
+    db: DBSession = Depends(get_db),
+):
+    """Import an export document; ``background=true`` runs it as a job (202)."""
     if not body.teams and not body.sessions and body.settings is None:
         raise HTTPException(status_code=422, detail="No data to import")
-
-    teams_count = 0
-    for t in body.teams:
-        team = Team(
-            id=t.id,
-            name=t.name,
-            players=t.players,
-            color=t.color,
-            tag=t.tag,
-            created_at=t.createdAt,
-        )
-        db.merge(team)
-        teams_count += 1
-
-    db.flush()
-
-    sessions_count = 0
-    for s in body.sessions:
-        _validate_team_ids_exist(s.teamIds, db)
-
-        session = Session(
-            id=s.id,
-            name=s.name,
-            date=s.date,
-            team_ids=s.teamIds,
-            status=s.status,
+    if background:
+        return start_job(
+            db, "import", lambda job_db, context: _run_import(job_db, body, context)
         )
-        db.merge(session)
-        db.flush()
 
-        for g in s.games:
-            unknown_game_team_ids = sorted(
-                set(g.teamPlayerMap.keys()) - set(s.teamIds)
+    try:
+        return _run_import(db, body)
+    except ImportValidationError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+# --- Streaming import ---
+
+_STREAM_RECORD_BATCH = 500
+_STREAM_RECORD_TYPES: dict[str, type[BaseModel]] = {
+    "team": ImportTeam,
+    "session": ImportSession,
+    "settings": ImportSettings,
+}
+_MAX_TRACKED_IMPORTS = 50
+
+# Progress of recent streaming imports, oldest first, for polling clients.
+_import_progress: OrderedDict[str, dict] = OrderedDict()
+_import_progress_lock = threading.Lock()
+
+
+def _update_import_progress(import_id: str, **fields) -> None:
+    with _import_progress_lock:
+        entry = _import_progress.setdefault(import_id, {"import_id": import_id})
+        entry.update(fields)
+        _import_progress.move_to_end(import_id)
+        while len(_import_progress) > _MAX_TRACKED_IMPORTS:
+            _import_progress.popitem(last=False)
+
+
+async def _iter_ndjson_lines(request: Request) -> AsyncIterator[tuple[int, bytes]]:
+    """Yield ``(line_number, line)`` for non-blank lines as the body arrives."""
+    buffer = b""
+    line_no = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line
+    if buffer.strip():
+        yield line_no + 1, buffer
+
+
+def _stage_record_batch(spool: IO[bytes], batch: list[tuple[int, bytes]]) -> None:
+    """Validate one batch of NDJSON records and append them to ``spool``."""
+    for line_no, line in batch:
+        try:
+            record = json.loads(line)
+            kind, data = record["type"], record["data"]
+        except (ValueError, TypeError, KeyError):
+            raise HTTPException(
+                status_code=422,
+                detail=f"Line {line_no}: expected a {{type, data}} JSON object",
             )
-            if unknown_game_team_ids:
-                unknown = ", ".join(unknown_game_team_ids)
-                raise HTTPException(
-                    status_code=422,
-                    detail=(
-                        "Game teamPlayerMap contains team ids not in session: "
-                        f"{unknown}"
-                    ),
-                )
-
-            game = Game(
-                id=g.id,
-                session_id=session.id,
-                name=g.name,
-                player_placements=g.playerPlacements,
-                player_points=g.playerPoints,
-                team_player_map=g.teamPlayerMap,
-                points=g.points,
-                placements=g.placements,
+        model = _STREAM_RECORD_TYPES.get(kind)
+        if model is None:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Line {line_no}: unknown record type {kind!r}",
             )
-            db.merge(game)
-
-        for p in s.penalties:
-            if p.teamId not in set(s.teamIds):
-                raise HTTPException(
-                    status_code=422,
-                    detail="Penalty teamId must belong to the session teamIds",
-                )
-
-            penalty = Penalty(
-                id=p.id,
-                session_id=session.id,
-                team_id=p.teamId,
-                value=p.value,
-                reason=p.reason,
+        try:
+            pickle.dump((line_no, model.model_validate(data)), spool)
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", line_no, *error["loc"])}
+                    for error in exc.errors(include_url=False)
+                ]
             )
-            db.merge(penalty)
-
-        sessions_count += 1
 
-    settings_count = (
-        _upsert_import_settings(body.settings, db) if body.settings is not None else 0
-    )
 
-    db.commit()
+def _write_staged_records(
+    importer: BulkImporter, spool: IO[bytes]
+) -> ImportSettings | None:
+    """Feed every staged record to ``importer``; returns any settings."""
+    settings = None
+    spool.seek(0)
+    while True:
+        try:
+            line_no, record = pickle.load(spool)
+        except EOFError:
+            return settings
+        try:
+            if isinstance(record, ImportTeam):
+                importer.add_team(record)
+            elif isinstance(record, ImportSession):
+                importer.add_session(record)
+            else:
+                settings = record
+        except ImportValidationError as exc:
+            raise HTTPException(status_code=422, detail=f"Line {line_no}: {exc}")
+
+
+def _claim_import_id(import_id: str) -> bool:
+    """Start tracking ``import_id``; False if another import already uses it."""
+    with _import_progress_lock:
+        if import_id in _import_progress:
+            return False
+        _import_progress[import_id] = {"import_id": import_id}
+    _update_import_progress(import_id, status="running", records=0)
+    return True
+
+
+@router.post("/import/stream", status_code=201)
+async def import_stream(
+    request: Request,
+    import_id: str | None = Query(None),
+    db: DBSession = Depends(get_db),
+) -> dict:
+    """Import an NDJSON export (``GET /api/export?format=ndjson``) as it uploads.
+
+    Records are validated as they arrive and staged in a temporary file, so
+    memory does not grow with the upload and no database lock is held while
+    it is in flight. Once the whole stream is valid, everything is written
+    in one transaction. Poll ``GET /api/import/progress/{import_id}`` while
+    it runs; an ``import_id`` already in use is rejected with 409.
+    """
+    import_id = import_id or uuid.uuid4().hex
+    if not _claim_import_id(import_id):
+        raise HTTPException(status_code=409, detail="Import id already in use")
+    importer = BulkImporter(db)
+    received = 0
+
+    with tempfile.TemporaryFile() as spool:
+
+        async def _stage(batch: list[tuple[int, bytes]]) -> None:
+            nonlocal received
+            await run_in_threadpool(_stage_record_batch, spool, batch)
+            received += len(batch)
+            _update_import_progress(import_id, records=received)
+
+        def _finish() -> int:
+            settings = _write_staged_records(importer, spool)
+            settings_count = (
+                _upsert_import_settings(settings, db) if settings is not None else 0
+            )
+            if settings_count:
+                bump_data_version(db, SETTINGS_RESOURCE)
+            importer.finish()
+            _bump_imported_versions(db, importer)
+            db.commit()
+            invalidate_scoreboard(db)
+            if settings_count:
+                invalidate_scoring_cache()
+            return settings_count
+
+        try:
+            batch: list[tuple[int, bytes]] = []
+            async for line in _iter_ndjson_lines(request):
+                batch.append(line)
+                if len(batch) >= _STREAM_RECORD_BATCH:
+                    await _stage(batch)
+                    batch = []
+            await _stage(batch)
+            if not received:
+                raise HTTPException(status_code=422, detail="No data to import")
+
+            _update_import_progress(import_id, status="writing")
+            settings_count = await run_in_threadpool(_finish)
+        except Exception as exc:
+            error = getattr(exc, "detail", None) or type(exc).__name__
+            _update_import_progress(import_id, status="failed", error=error)
+            raise
+
+    _update_import_progress(import_id, status="completed", **importer.counts)
     return {
+        "import_id": import_id,
         "imported": {
-            "teams": teams_count,
-            "sessions": sessions_count,
+            "teams": importer.counts["teams"],
+            "sessions": importer.counts["sessions"],
             "settings": settings_count,
-        }
+        },
+        "timings_ms": importer.timings_ms(),
     }
 
 
-@router.delete("/data/reset")
-def reset_data(body: ResetRequest, db: DBSession = Depends(get_db)) -> dict:
-    """Selectively reset data categories."""
-    if not body.teams and not body.sessions and not body.settings:
-        raise HTTPException(status_code=422, detail="No reset categories selected")
+@router.get("/import/progress/{import_id}")
+def get_import_progress(import_id: str) -> dict:
+    with _import_progress_lock:
+        progress = _import_progress.get(import_id)
+        if progress is None:
+            raise HTTPException(status_code=404, detail="Import not found")
+        return dict(progress)
 
+
+def _run_reset(
+    db: DBSession, body: ResetRequest, context: JobContext | None = None
+) -> dict:
     deleted = {}
 
     if body.sessions:
         # Delete games and penalties first (cascade), then sessions
         db.query(Penalty).delete()
+        db.query(GamePlayerResult).delete()
+        db.query(GameResult).delete()
         db.query(Game).delete()
+        db.query(SessionTeamTotal).delete()
         db.query(Session).delete()
+        db.query(TeamStanding).delete()
+        record_resets(db, ("session", "game", "penalty"))
+        bump_data_versions(db, SESSIONS_RESOURCE, LEADERBOARD_RESOURCE)
         deleted["sessions"] = True
 
     if body.teams:
         db.query(Team).delete()
+        record_resets(db, ("team",))
+        bump_data_version(db, TEAMS_RESOURCE)
         deleted["teams"] = True
 
     if body.settings:
         db.query(Setting).delete()
+        record_resets(db, ("setting",))
+        bump_data_version(db, SETTINGS_RESOURCE)
         deleted["settings"] = True
 
+    if context is not None:
+        context.check_cancelled()
     db.commit()
+    invalidate_scoreboard(db)
+    if body.settings:
+        invalidate_scoring_cache()
     return {"reset": deleted}
+
+
+@router.delete("/data/reset")
+def reset_data(
+    body: ResetRequest,
+    background: bool = Query(False),
+    db: DBSession = Depends(get_db),
+):
+    """Selectively reset data categories; ``background=true`` runs it as a job."""
+    if not body.teams and not body.sessions and not body.settings:
+        raise HTTPException(status_code=422, detail="No reset categories selected")
+    if background:
+        return start_job(
+            db, "reset", lambda job_db, context: _run_reset(job_db, body, context)
+        )
+    return _run_reset(db, body)
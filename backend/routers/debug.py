@@ -0,0 +1,52 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, PlainTextResponse, Response
+from sqlalchemy.orm import Session as DBSession
+
+from database.connection import get_db
+from models.schemas import ProfileInfo, SlowQueriesResponse
+from services.admin import require_admin
+from services.profiler import get_profile_path, list_profiles, render_profile
+from services.slow_queries import slow_query_log, slow_query_threshold
+
+router = APIRouter(
+    prefix="/api/debug", tags=["debug"], dependencies=[Depends(require_admin)]
+)
+
+
+@router.get("/profiles", response_model=list[ProfileInfo])
+def get_profiles() -> list[dict]:
+    """Stored request profiles, newest first."""
+    return list_profiles()
+
+
+@router.get("/profiles/{profile_id}")
+def download_profile(
+    profile_id: str,
+    format: Literal["pstats", "text"] = Query("pstats"),
+    sort: Literal["cumulative", "tottime", "calls"] = Query("cumulative"),
+) -> Response:
+    """The raw pstats file, or with ``format=text`` its report."""
+    path = get_profile_path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == "text":
+        return PlainTextResponse(render_profile(path, sort))
+    return FileResponse(
+        path, media_type="application/octet-stream", filename=path.name
+    )
+
+
+@router.get("/slow-queries", response_model=SlowQueriesResponse)
+def get_slow_queries(db: DBSession = Depends(get_db)) -> SlowQueriesResponse:
+    """The slowest statements recorded since startup, slowest first."""
+    return SlowQueriesResponse(
+        threshold_ms=slow_query_threshold(db.get_bind()),
+        queries=slow_query_log.entries(),
+    )
+
+
+@router.delete("/slow-queries", status_code=204)
+def reset_slow_queries() -> None:
+    slow_query_log.reset()
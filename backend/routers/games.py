@@ -1,10 +1,8 @@
-import json
-
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session as DBSession
 
 from database.connection import get_db
-from database.orm_models import Game, Penalty, Session, Setting, Team
+from database.orm_models import Game, Penalty, Session, SessionTeamTotal, Team
 from models.schemas import (
     GameCreate,
     GameResponse,
@@ -12,43 +10,22 @@ from models.schemas import (
     PenaltyResponse,
     SessionScoreEntry,
 )
+from services.data_versions import LEADERBOARD_RESOURCE, bump_data_version
+from services.game_results import attach_game_results
+from services.live_events import live_events
+from services.profiler import ProfiledRoute
+from services.projections import (
+    apply_game_totals,
+    apply_penalty_totals,
+    get_session_totals,
+    track_session_standings,
+)
+from services.scoreboard import refresh_scoreboard
+from services.scoring import calculate_points, get_scoring_config
 
-router = APIRouter(prefix="/api/sessions", tags=["games", "penalties"])
-
-
-def _get_scoring_config(db: DBSession) -> tuple[dict[int, int], dict[int, int]]:
-    """Read scoring configuration from settings table.
-
-    Returns (standard_scoring, two_player_scoring) as {position: points} dicts.
-    Falls back to defaults if not configured.
-    """
-    default_std = {1: 4, 2: 3, 3: 2, 4: 1}
-    default_2p = {1: 4, 2: 1}
-
-    scoring_row = db.query(Setting).filter(Setting.key == "scoring").first()
-    scoring_2p_row = db.query(Setting).filter(Setting.key == "scoring_2p").first()
-
-    if scoring_row:
-        raw = json.loads(scoring_row.value)
-        std = {1: raw.get("first", 4), 2: raw.get("second", 3),
-               3: raw.get("third", 2), 4: raw.get("fourth", 1)}
-    else:
-        std = default_std
-
-    if scoring_2p_row:
-        raw = json.loads(scoring_2p_row.value)
-        two_p = {1: raw.get("first", 4), 2: raw.get("second", 1)}
-    else:
-        two_p = default_2p
-
-    return std, two_p
-
-
-def _calculate_points(position: int, num_players: int, db: DBSession) -> int:
-    std, two_p = _get_scoring_config(db)
-    if num_players <= 2:
-        return two_p.get(position, two_p.get(2, 1))
-    return std.get(position, std.get(4, 1))
+router = APIRouter(
+    prefix="/api/sessions", tags=["games", "penalties"], route_class=ProfiledRoute
+)
 
 
 def _get_session_or_404(session_id: str, db: DBSession) -> Session:
@@ -86,6 +63,23 @@ def _validate_session_team_ids(
         )
 
 
+def session_score_entries(rows: list[SessionTeamTotal]) -> list[SessionScoreEntry]:
+    """Convert totals rows (in session team order) to ranked score entries."""
+    result = [
+        SessionScoreEntry(
+            team_id=row.team_id,
+            game_points=row.game_points,
+            penalty_points=row.penalty_points,
+            total=row.total,
+            games_played=row.games,
+        )
+        for row in rows
+    ]
+    # Stable sort keeps session team order for ties.
+    result.sort(key=lambda x: x.total, reverse=True)
+    return result
+
+
 # --- Games ---
 
 
@@ -100,9 +94,10 @@ def add_game(
     )
 
     total_players = len(body.player_placements)
+    scoring_tables = get_scoring_config(db)
 
     player_points = {
-        key: _calculate_points(pos, total_players, db)
+        key: calculate_points(pos, total_players, scoring_tables)
         for key, pos in body.player_placements.items()
     }
 
@@ -136,9 +131,17 @@ def add_game(
         points=points,
         placements=placements,
     )
-    db.add(game)
+    attach_game_results(game)
+    with track_session_standings(db, session):
+        db.add(game)
+        apply_game_totals(db, game)
+    bump_data_version(db, LEADERBOARD_RESOURCE)
     db.commit()
     db.refresh(game)
+    refresh_scoreboard(db)
+    live_events.publish(
+        session_id, "game.added", GameResponse.model_validate(game).model_dump()
+    )
     return game
 
 
@@ -153,8 +156,13 @@ def remove_game(
     )
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
-    db.delete(game)
+    with track_session_standings(db, game.session):
+        apply_game_totals(db, game, -1)
+        db.delete(game)
+    bump_data_version(db, LEADERBOARD_RESOURCE)
     db.commit()
+    refresh_scoreboard(db)
+    live_events.publish(session_id, "game.removed", {"id": game_id})
 
 
 # --- Penalties ---
@@ -180,9 +188,18 @@ def add_penalty(
         value=body.value,
         reason=body.reason,
     )
-    db.add(penalty)
+    with track_session_standings(db, session):
+        db.add(penalty)
+        apply_penalty_totals(db, penalty)
+    bump_data_version(db, LEADERBOARD_RESOURCE)
     db.commit()
     db.refresh(penalty)
+    refresh_scoreboard(db)
+    live_events.publish(
+        session_id,
+        "penalty.added",
+        PenaltyResponse.model_validate(penalty).model_dump(),
+    )
     return penalty
 
 
@@ -197,8 +214,13 @@ def remove_penalty(
     )
     if not penalty:
         raise HTTPException(status_code=404, detail="Penalty not found")
-    db.delete(penalty)
+    with track_session_standings(db, penalty.session):
+        apply_penalty_totals(db, penalty, -1)
+        db.delete(penalty)
+    bump_data_version(db, LEADERBOARD_RESOURCE)
     db.commit()
+    refresh_scoreboard(db)
+    live_events.publish(session_id, "penalty.removed", {"id": penalty_id})
 
 
 # --- Scores ---
@@ -208,25 +230,5 @@ def remove_penalty(
 def get_session_scores(
     session_id: str, db: DBSession = Depends(get_db)
 ) -> list[SessionScoreEntry]:
-    session = _get_session_or_404(session_id, db)
-
-    scores: dict[str, dict[str, int]] = {}
-    for tid in session.team_ids:
-        scores[tid] = {"game_points": 0, "penalty_points": 0, "total": 0}
-
-    for game in session.games:
-        for team_id, pts in game.points.items():
-            if team_id in scores:
-                scores[team_id]["game_points"] += pts
-
-    for penalty in session.penalties:
-        if penalty.team_id in scores:
-            scores[penalty.team_id]["penalty_points"] += penalty.value
-
-    result = []
-    for tid, s in scores.items():
-        s["total"] = s["game_points"] + s["penalty_points"]
-        result.append(SessionScoreEntry(team_id=tid, **s))
-
-    result.sort(key=lambda x: x.total, reverse=True)
-    return result
+    _get_session_or_404(session_id, db)
+    return session_score_entries(get_session_totals(db, session_id))
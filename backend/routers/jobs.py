@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session as DBSession
+
+from database.connection import get_db
+from database.orm_models import Job
+from models.schemas import JobResponse
+from services.jobs import job_runner
+from services.profiler import ProfiledRoute
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"], route_class=ProfiledRoute)
+
+
+def _get_job_or_404(job_id: str, db: DBSession) -> Job:
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("", response_model=list[JobResponse])
+def list_jobs(
+    limit: int = Query(20, ge=1, le=100), db: DBSession = Depends(get_db)
+) -> list[JobResponse]:
+    """Most recent jobs first."""
+    jobs = db.query(Job).order_by(Job.created_at.desc(), Job.id).limit(limit).all()
+    return [job_runner.overlay(job) for job in jobs]
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: str, db: DBSession = Depends(get_db)) -> JobResponse:
+    return job_runner.overlay(_get_job_or_404(job_id, db))
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse, status_code=202)
+def cancel_job(job_id: str, db: DBSession = Depends(get_db)) -> JobResponse:
+    """Request cancellation; the job rolls back at its next checkpoint."""
+    job = _get_job_or_404(job_id, db)
+    if not job_runner.cancel(job_id):
+        raise HTTPException(status_code=409, detail="Job is not active")
+    return job_runner.overlay(job)
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.orm import Session as DBSession
+
+from database.connection import get_db
+from services.http_cache import etag_matches
+from services.profiler import ProfiledRoute
+from services.scoreboard import get_scoreboard
+
+router = APIRouter(prefix="/api/kiosk", tags=["kiosk"], route_class=ProfiledRoute)
+
+
+@router.get("/scoreboard")
+def get_kiosk_scoreboard(request: Request, db: DBSession = Depends(get_db)) -> Response:
+    """Leaderboard plus live scores of active sessions, for read-only screens.
+
+    Serves the pre-serialized snapshot as-is; see ``services.scoreboard``.
+    """
+    snapshot = get_scoreboard(db)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(snapshot.body, media_type="application/json", headers=headers)
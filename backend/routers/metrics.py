@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from services.metrics import metrics_registry
+from services.profiler import ProfiledRoute
+
+router = APIRouter(prefix="/api", tags=["metrics"], route_class=ProfiledRoute)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> PlainTextResponse:
+    """Route latency histograms, request, query and DB-time counters.
+
+    Prometheus text exposition format, for scraping.
+    """
+    return PlainTextResponse(
+        metrics_registry.render(), media_type="text/plain; version=0.0.4"
+    )
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session as DBSession
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session as DBSession, selectinload
 
 from database.connection import get_db
-from database.orm_models import Session, Team
+from database.orm_models import Game, Penalty, Session, Team
 from models.schemas import (
     SessionCreate,
     SessionListResponse,
@@ -10,8 +16,39 @@ from models.schemas import (
     SessionStatus,
     SessionUpdate,
 )
+from services.data_versions import (
+    LEADERBOARD_RESOURCE,
+    SESSIONS_RESOURCE,
+    bump_data_version,
+    bump_data_versions,
+)
+from services.fast_json import encode_object, encode_rows, raw_json
+from services.http_cache import not_modified
+from services.live_events import LIVE_KEEPALIVE_SECONDS, encode_event, live_events
+from services.pagination import (
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    paginate,
+    parse_fields,
+    projected_response,
+)
+from services.profiler import ProfiledRoute
+from services.projections import init_session_totals, track_session_standings
+from services.scoreboard import invalidate_scoreboard
 
-router = APIRouter(prefix="/api/sessions", tags=["sessions"])
+router = APIRouter(prefix="/api/sessions", tags=["sessions"], route_class=ProfiledRoute)
+
+# Batched eager loads: one extra query per relationship, however many rows.
+_SESSION_DETAIL_OPTIONS = (
+    selectinload(Session.games),
+    selectinload(Session.penalties),
+)
+_SESSION_DELETE_OPTIONS = (
+    selectinload(Session.games).selectinload(Game.team_results),
+    selectinload(Session.games).selectinload(Game.player_results),
+    selectinload(Session.penalties),
+    selectinload(Session.team_totals),
+)
 
 
 def _validate_team_ids_exist(team_ids: list[str], db: DBSession) -> None:
@@ -27,25 +64,162 @@ def _validate_team_ids_exist(team_ids: list[str], db: DBSession) -> None:
 
 @router.get("", response_model=list[SessionListResponse])
 def list_sessions(
+    request: Request,
+    response: Response,
     status: SessionStatus | None = Query(None),
+    date_from: datetime | None = Query(None),
+    date_to: datetime | None = Query(None),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+    fields: str | None = Query(None),
     db: DBSession = Depends(get_db),
-) -> list[SessionListResponse]:
-    query = db.query(Session)
+):
+    """List sessions ordered by ``(date, id)``.
+
+    With ``limit`` the result is one page and ``X-Next-Cursor`` carries the
+    cursor for the next one. ``fields=id,name`` selects only those columns.
+    """
+    cached = not_modified(request, response, db, SESSIONS_RESOURCE)
+    if cached is not None:
+        return cached
+
+    try:
+        columns = parse_fields(fields, tuple(SessionListResponse.model_fields))
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    if columns is None:
+        query = db.query(Session)
+    else:
+        # The sort key is always selected so the next cursor can be built.
+        selected = dict.fromkeys([*columns, "date"])
+        query = db.query(*(getattr(Session, name) for name in selected))
     if status:
         query = query.filter(Session.status == status)
-    return query.all()
+    if date_from is not None:
+        query = query.filter(Session.date >= date_from)
+    if date_to is not None:
+        query = query.filter(Session.date <= date_to)
+
+    try:
+        rows, next_cursor = paginate(query, Session.date, Session.id, limit, cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    if columns is not None:
+        return projected_response(rows, columns, next_cursor, response.headers)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows
+
+
+_GAME_JSON_FIELDS = (
+    "player_placements",
+    "player_points",
+    "team_player_map",
+    "points",
+    "placements",
+)
+_GAME_COLUMNS = (
+    Game.id,
+    Game.session_id,
+    Game.name,
+    *(raw_json(getattr(Game, field)) for field in _GAME_JSON_FIELDS),
+)
+_PENALTY_COLUMNS = (
+    Penalty.id,
+    Penalty.session_id,
+    Penalty.team_id,
+    Penalty.value,
+    Penalty.reason,
+)
+
+
+def _fast_session_response(session_id: str, db: DBSession) -> Response:
+    """``SessionResponse`` encoded straight from column rows."""
+    row = (
+        db.query(
+            Session.id, Session.name, Session.date, Session.team_ids, Session.status
+        )
+        .filter(Session.id == session_id)
+        .first()
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    games = db.query(*_GAME_COLUMNS).filter(Game.session_id == session_id)
+    penalties = db.query(*_PENALTY_COLUMNS).filter(Penalty.session_id == session_id)
+    body = encode_object(
+        row._asdict(),
+        games=encode_rows(games, raw=_GAME_JSON_FIELDS),
+        penalties=encode_rows(penalties),
+    )
+    return Response(body, media_type="application/json")
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
 def get_session(
-    session_id: str, db: DBSession = Depends(get_db)
+    session_id: str,
+    fast: bool = Query(False),
+    db: DBSession = Depends(get_db),
 ) -> SessionResponse:
-    session = db.query(Session).filter(Session.id == session_id).first()
+    """One session with its games and penalties.
+
+    ``fast=true`` skips model validation and encodes the rows directly;
+    see ``services.fast_json``.
+    """
+    if fast:
+        return _fast_session_response(session_id, db)
+    session = (
+        db.query(Session)
+        .options(*_SESSION_DETAIL_OPTIONS)
+        .filter(Session.id == session_id)
+        .first()
+    )
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     return session
 
 
+async def _stream_session_events(session_id: str) -> AsyncIterator[bytes]:
+    subscriber = live_events.subscribe(session_id)
+    try:
+        yield encode_event("ready", {"session_id": session_id})
+        while True:
+            try:
+                frame = await asyncio.wait_for(
+                    subscriber.queue.get(), LIVE_KEEPALIVE_SECONDS
+                )
+            except TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if frame is None:
+                yield encode_event("dropped", {"reason": "client too slow"})
+                return
+            yield frame
+    finally:
+        live_events.unsubscribe(session_id, subscriber)
+
+
+@router.get("/{session_id}/events")
+async def session_events(
+    session_id: str, db: DBSession = Depends(get_db)
+) -> StreamingResponse:
+    """Server-Sent Events for one session: game, penalty and status changes.
+
+    Events carry the changed row; viewers re-render instead of polling.
+    """
+    exists = await run_in_threadpool(db.get, Session, session_id)
+    # The stream can stay open for hours; do not hold a pooled connection.
+    db.close()
+    if exists is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return StreamingResponse(
+        _stream_session_events(session_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("", response_model=SessionResponse, status_code=201)
 def create_session(
     body: SessionCreate, db: DBSession = Depends(get_db)
@@ -57,8 +231,12 @@ def create_session(
         team_ids=body.team_ids,
     )
     db.add(session)
+    db.flush()
+    init_session_totals(db, session)
+    bump_data_version(db, SESSIONS_RESOURCE)
     db.commit()
     db.refresh(session)
+    invalidate_scoreboard(db)
     return session
 
 
@@ -69,12 +247,20 @@ def update_session(
     session = db.query(Session).filter(Session.id == session_id).first()
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    if body.name is not None:
-        session.name = body.name
-    if body.status is not None:
-        session.status = body.status
+    with track_session_standings(db, session):
+        if body.name is not None:
+            session.name = body.name
+        if body.status is not None:
+            session.status = body.status
+    bump_data_versions(db, SESSIONS_RESOURCE, LEADERBOARD_RESOURCE)
     db.commit()
     db.refresh(session)
+    invalidate_scoreboard(db)
+    live_events.publish(
+        session.id,
+        "session.updated",
+        {"id": session.id, "name": session.name, "status": session.status},
+    )
     return session
 
 
@@ -82,8 +268,17 @@ def update_session(
 def delete_session(
     session_id: str, db: DBSession = Depends(get_db)
 ) -> None:
-    session = db.query(Session).filter(Session.id == session_id).first()
+    session = (
+        db.query(Session)
+        .options(*_SESSION_DELETE_OPTIONS)
+        .filter(Session.id == session_id)
+        .first()
+    )
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    db.delete(session)
+    with track_session_standings(db, session):
+        db.delete(session)
+    bump_data_versions(db, SESSIONS_RESOURCE, LEADERBOARD_RESOURCE)
     db.commit()
+    invalidate_scoreboard(db)
+    live_events.publish(session_id, "session.deleted", {"id": session_id})
@@ -1,6 +1,6 @@
 import json
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session as DBSession
 
 from database.connection import get_db
@@ -11,8 +11,12 @@ from models.schemas import (
     SettingsResponse,
     SettingsUpdate,
 )
+from services.data_versions import bump_data_version
+from services.http_cache import not_modified
+from services.profiler import ProfiledRoute
+from services.scoring import SETTINGS_RESOURCE, invalidate_scoring_cache
 
-router = APIRouter(prefix="/api", tags=["settings"])
+router = APIRouter(prefix="/api", tags=["settings"], route_class=ProfiledRoute)
 
 
 def _get_all_settings(db: DBSession) -> dict[str, str]:
@@ -39,7 +43,12 @@ def _build_settings_response(raw: dict[str, str]) -> SettingsResponse:
 
 
 @router.get("/settings", response_model=SettingsResponse)
-def get_settings(db: DBSession = Depends(get_db)) -> SettingsResponse:
+def get_settings(
+    request: Request, response: Response, db: DBSession = Depends(get_db)
+) -> SettingsResponse:
+    cached = not_modified(request, response, db, SETTINGS_RESOURCE)
+    if cached is not None:
+        return cached
     raw = _get_all_settings(db)
     return _build_settings_response(raw)
 
@@ -68,7 +77,10 @@ def update_settings(
         else:
             db.add(Setting(key=key, value=value))
 
+    if updates:
+        bump_data_version(db, SETTINGS_RESOURCE)
     db.commit()
+    invalidate_scoring_cache()
 
     raw = _get_all_settings(db)
     return _build_settings_response(raw)
@@ -1,52 +1,85 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session as DBSession
 
 from database.connection import get_db
-from database.orm_models import Game, Penalty, Session
+from database.orm_models import TeamStanding
 from models.schemas import LeaderboardEntry
+from services.data_versions import LEADERBOARD_RESOURCE, bump_data_version
+from services.http_cache import not_modified
+from services.jobs import JobContext, start_job
+from services.profiler import ProfiledRoute
+from services.projections import rebuild_all
+from services.scoreboard import invalidate_scoreboard
+from services.single_flight import single_flight
 
-router = APIRouter(prefix="/api/stats", tags=["stats"])
+router = APIRouter(prefix="/api/stats", tags=["stats"], route_class=ProfiledRoute)
+
+
+def load_leaderboard(db: DBSession) -> list[LeaderboardEntry]:
+    """Read the all-time leaderboard from the standings projection."""
+    standings = (
+        db.query(TeamStanding)
+        .filter(TeamStanding.sessions > 0)
+        .order_by(TeamStanding.total_points.desc(), TeamStanding.team_id)
+        .all()
+    )
+    return [
+        LeaderboardEntry(
+            team_id=row.team_id,
+            total_points=row.total_points,
+            wins=row.wins,
+            sessions=row.sessions,
+        )
+        for row in standings
+    ]
 
 
 @router.get("/leaderboard", response_model=list[LeaderboardEntry])
 def get_leaderboard(
+    request: Request,
+    response: Response,
     db: DBSession = Depends(get_db),
 ) -> list[LeaderboardEntry]:
-    completed = (
-        db.query(Session).filter(Session.status == "completed").all()
+    cached = not_modified(request, response, db, LEADERBOARD_RESOURCE)
+    if cached is not None:
+        return cached
+    # The ETag just set is the data version; concurrent requests for the
+    # same one share a single read and serialization.
+    body = single_flight.run(
+        "leaderboard",
+        response.headers.get("etag"),
+        lambda: JSONResponse(jsonable_encoder(load_leaderboard(db))).body,
     )
+    return Response(body, media_type="application/json", headers=response.headers)
 
-    scores: dict[str, dict[str, int]] = {}
 
-    for session in completed:
-        session_scores: dict[str, int] = {}
+@router.get("/coalescing")
+def get_coalescing_metrics() -> dict[str, dict[str, int]]:
+    """How many requests per endpoint were computed vs. served a shared result."""
+    return single_flight.metrics()
 
-        for tid in session.team_ids:
-            session_scores[tid] = 0
-            if tid not in scores:
-                scores[tid] = {"total_points": 0, "wins": 0, "sessions": 0}
 
-        for game in session.games:
-            for team_id, pts in game.points.items():
-                if team_id in session_scores:
-                    session_scores[team_id] += pts
+def _run_rebuild(db: DBSession, context: JobContext | None = None) -> dict:
+    checkpoint = context.check_cancelled if context is not None else None
+    counts = rebuild_all(db, checkpoint)
+    bump_data_version(db, LEADERBOARD_RESOURCE)
+    if context is not None:
+        context.check_cancelled()
+    db.commit()
+    invalidate_scoreboard(db)
+    return {"rebuilt": counts}
 
-        for penalty in session.penalties:
-            if penalty.team_id in session_scores:
-                session_scores[penalty.team_id] += penalty.value
 
-        for tid, total in session_scores.items():
-            if tid in scores:
-                scores[tid]["total_points"] += total
-                scores[tid]["sessions"] += 1
+@router.post("/rebuild")
+def rebuild_stats(
+    background: bool = Query(False), db: DBSession = Depends(get_db)
+):
+    """Regenerate session totals and the leaderboard from source rows.
 
-        if session_scores:
-            winner = max(session_scores, key=session_scores.get)
-            if winner in scores:
-                scores[winner]["wins"] += 1
-
-    return sorted(
-        [LeaderboardEntry(team_id=tid, **s) for tid, s in scores.items()],
-        key=lambda x: x.total_points,
-        reverse=True,
-    )
+    ``background=true`` runs the rebuild as a job and answers 202.
+    """
+    if background:
+        return start_job(db, "rebuild", _run_rebuild)
+    return _run_rebuild(db)
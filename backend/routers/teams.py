@@ -1,16 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session as DBSession
 
 from database.connection import get_db
 from database.orm_models import Team
 from models.schemas import TeamCreate, TeamResponse, TeamUpdate
+from services.data_versions import TEAMS_RESOURCE, bump_data_version
+from services.http_cache import not_modified
+from services.pagination import (
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    paginate,
+    parse_fields,
+    projected_response,
+)
+from services.profiler import ProfiledRoute
+from services.scoreboard import invalidate_scoreboard
 
-router = APIRouter(prefix="/api/teams", tags=["teams"])
+router = APIRouter(prefix="/api/teams", tags=["teams"], route_class=ProfiledRoute)
 
 
 @router.get("", response_model=list[TeamResponse])
-def list_teams(db: DBSession = Depends(get_db)) -> list[TeamResponse]:
-    return db.query(Team).all()
+def list_teams(
+    request: Request,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+    fields: str | None = Query(None),
+    db: DBSession = Depends(get_db),
+):
+    """List teams ordered by ``(created_at, id)``; paging as for sessions."""
+    cached = not_modified(request, response, db, TEAMS_RESOURCE)
+    if cached is not None:
+        return cached
+
+    try:
+        columns = parse_fields(fields, tuple(TeamResponse.model_fields))
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    if columns is None:
+        query = db.query(Team)
+    else:
+        selected = dict.fromkeys([*columns, "created_at"])
+        query = db.query(*(getattr(Team, name) for name in selected))
+
+    try:
+        rows, next_cursor = paginate(
+            query, Team.created_at, Team.id, limit, cursor
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    if columns is not None:
+        return projected_response(rows, columns, next_cursor, response.headers)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows
 
 
 @router.get("/{team_id}", response_model=TeamResponse)
@@ -30,8 +75,10 @@ def create_team(body: TeamCreate, db: DBSession = Depends(get_db)) -> TeamRespon
         tag=body.tag,
     )
     db.add(team)
+    bump_data_version(db, TEAMS_RESOURCE)
     db.commit()
     db.refresh(team)
+    invalidate_scoreboard(db)
     return team
 
 
@@ -46,8 +93,10 @@ def update_team(
     team.players = body.players
     team.color = body.color
     team.tag = body.tag
+    bump_data_version(db, TEAMS_RESOURCE)
     db.commit()
     db.refresh(team)
+    invalidate_scoreboard(db)
     return team
 
 
@@ -57,4 +106,6 @@ def delete_team(team_id: str, db: DBSession = Depends(get_db)) -> None:
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     db.delete(team)
+    bump_data_version(db, TEAMS_RESOURCE)
     db.commit()
+    invalidate_scoreboard(db)
@@ -0,0 +1,26 @@
+"""Shared-secret gate for operator-only endpoints and request options.
+
+Set ``ADMIN_TOKEN`` to enable them; callers send it as ``X-Admin-Token``.
+Without the variable every admin check fails, so debug features are off by
+default.
+"""
+
+import hmac
+import os
+
+from fastapi import Header, HTTPException
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN") or None
+ADMIN_TOKEN_HEADER = "x-admin-token"
+
+
+def is_admin_token(value: str | None) -> bool:
+    if ADMIN_TOKEN is None or value is None:
+        return False
+    return hmac.compare_digest(value.encode(), ADMIN_TOKEN.encode())
+
+
+def require_admin(x_admin_token: str | None = Header(None)) -> None:
+    """Dependency rejecting requests without the admin token."""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
@@ -0,0 +1,249 @@
+"""Set-based import of teams, sessions, games and penalties.
+
+Replaces per-row ``db.merge()`` (a SELECT before every write) with batched
+``INSERT ... ON CONFLICT DO UPDATE`` executemany statements. Team references
+are validated in memory against one read of the existing team ids. Nothing
+is committed here: callers commit once at the end, so an import is still
+all-or-nothing.
+
+Records can be fed incrementally, which lets a streaming upload write in
+bounded batches while a buffered payload simply feeds everything at once.
+"""
+
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session as DBSession
+
+from database.orm_models import Game, Penalty, Session, Team, _generate_id
+from models.schemas import ImportSession, ImportTeam
+from services.changes import allocate_versions
+from services.game_results import delete_game_results, rebuild_game_results
+from services.projections import rebuild_session_totals, rebuild_team_standings
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Projection rebuilds filter with ``IN``; keep each under SQLite's
+# bound-parameter limit.
+_REBUILD_CHUNK_SIZE = 500
+
+
+class ImportValidationError(ValueError):
+    """An import record references data that does not exist."""
+
+
+def _previous_session_ids(db: DBSession, model: type, rows: list[dict]) -> set[str]:
+    """Sessions that existing ``rows`` are about to be moved out of."""
+    new_session = {row["id"]: row["session_id"] for row in rows}
+    ids = list(new_session)
+    moved = set()
+    for start in range(0, len(ids), _REBUILD_CHUNK_SIZE):
+        chunk = ids[start:start + _REBUILD_CHUNK_SIZE]
+        for row_id, session_id in db.query(model.id, model.session_id).filter(
+            model.id.in_(chunk)
+        ):
+            if session_id != new_session[row_id]:
+                moved.add(session_id)
+    return moved
+
+
+def _upsert(db: DBSession, model: type, rows: list[dict]) -> None:
+    if not rows:
+        return
+    first_version = allocate_versions(db, len(rows))
+    for offset, row in enumerate(rows):
+        row["change_version"] = first_version + offset
+    # Core insert on the table: the ORM bulk path adds per-row overhead
+    # without doing anything these plain dict rows need.
+    stmt = sqlite_insert(model.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[model.__table__.c.id],
+        set_={
+            name: stmt.excluded[name] for name in rows[0] if name != "id"
+        },
+    )
+    db.execute(stmt, rows)
+    rows.clear()
+
+
+class BulkImporter:
+    """Validate and upsert import records in batches of ``batch_size`` rows.
+
+    Feed teams before the sessions that reference them, then call
+    ``finish()`` to flush the remaining rows and rebuild the projections of
+    every imported session.
+    """
+
+    def __init__(self, db: DBSession, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+        self.counts = {"teams": 0, "sessions": 0, "games": 0, "penalties": 0}
+        self.timings: dict[str, float] = {}
+        self._pending_session_ids: list[str] = []
+        self._pending_game_ids: list[str] = []
+        self._known_team_ids: set[str] | None = None
+        self._teams: list[dict] = []
+        self._sessions: list[dict] = []
+        self._games: list[dict] = []
+        self._penalties: list[dict] = []
+
+    @contextmanager
+    def _phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+
+    def _team_ids(self) -> set[str]:
+        if self._known_team_ids is None:
+            with self._phase("validate"):
+                self._known_team_ids = {
+                    team_id for (team_id,) in self.db.query(Team.id)
+                }
+        return self._known_team_ids
+
+    # --- Feeding records ---
+
+    def add_teams(self, teams: Iterable[ImportTeam]) -> None:
+        for team in teams:
+            self.add_team(team)
+
+    def add_team(self, t: ImportTeam) -> None:
+        team_id = t.id or _generate_id()
+        self._teams.append({
+            "id": team_id,
+            "name": t.name,
+            "players": t.players,
+            "color": t.color,
+            "tag": t.tag,
+            "created_at": t.createdAt or datetime.now(timezone.utc),
+        })
+        self._team_ids().add(team_id)
+        self.counts["teams"] += 1
+        if len(self._teams) >= self.batch_size:
+            self.flush()
+
+    def add_sessions(self, sessions: Iterable[ImportSession]) -> None:
+        for session in sessions:
+            self.add_session(session)
+
+    def add_session(self, s: ImportSession) -> None:
+        """Validate one session with its games and penalties and buffer it.
+
+        Raises ``ImportValidationError`` on an unknown team reference.
+        """
+        known_team_ids = self._team_ids()
+        with self._phase("validate"):
+            missing_team_ids = sorted(set(s.teamIds) - known_team_ids)
+            if missing_team_ids:
+                missing = ", ".join(missing_team_ids)
+                raise ImportValidationError(f"Unknown team_ids: {missing}")
+            session_team_ids = set(s.teamIds)
+            for g in s.games:
+                unknown_game_team_ids = sorted(
+                    set(g.teamPlayerMap) - session_team_ids
+                )
+                if unknown_game_team_ids:
+                    unknown = ", ".join(unknown_game_team_ids)
+                    raise ImportValidationError(
+                        "Game teamPlayerMap contains team ids not in session: "
+                        f"{unknown}"
+                    )
+            for p in s.penalties:
+                if p.teamId not in session_team_ids:
+                    raise ImportValidationError(
+                        "Penalty teamId must belong to the session teamIds"
+                    )
+
+        session_id = s.id or _generate_id()
+        self._sessions.append({
+            "id": session_id,
+            "name": s.name,
+            "date": s.date or datetime.now(timezone.utc),
+            "team_ids": s.teamIds,
+            "status": s.status,
+        })
+        for g in s.games:
+            game_id = g.id or _generate_id()
+            self._pending_game_ids.append(game_id)
+            self._games.append({
+                "id": game_id,
+                "session_id": session_id,
+                "name": g.name,
+                "player_placements": g.playerPlacements,
+                "player_points": g.playerPoints,
+                "team_player_map": g.teamPlayerMap,
+                "points": g.points,
+                "placements": g.placements,
+            })
+        for p in s.penalties:
+            self._penalties.append({
+                "id": p.id or _generate_id(),
+                "session_id": session_id,
+                "team_id": p.teamId,
+                "value": p.value,
+                "reason": p.reason,
+            })
+        self._pending_session_ids.append(session_id)
+        self.counts["sessions"] += 1
+        self.counts["games"] += len(s.games)
+        self.counts["penalties"] += len(s.penalties)
+
+        buffered = len(self._sessions) + len(self._games) + len(self._penalties)
+        if buffered >= self.batch_size:
+            self.flush()
+
+    # --- Writing ---
+
+    def flush(self) -> None:
+        """Write every buffered row, parents before children.
+
+        Per-session projections of the flushed sessions are rebuilt straight
+        away, so memory use is bounded by the batch, not the whole import.
+        """
+        # A game or penalty id may already exist in another session; that
+        # session loses it and needs its projections rebuilt too.
+        moved_from: set[str] = set()
+        for phase, model, rows in (
+            ("teams", Team, self._teams),
+            ("sessions", Session, self._sessions),
+            ("games", Game, self._games),
+            ("penalties", Penalty, self._penalties),
+        ):
+            if rows:
+                with self._phase(phase):
+                    if model in (Game, Penalty):
+                        moved_from |= _previous_session_ids(self.db, model, rows)
+                    _upsert(self.db, model, rows)
+
+        game_ids = self._pending_game_ids
+        session_ids = list(dict.fromkeys([*self._pending_session_ids, *moved_from]))
+        if not session_ids:
+            return
+        with self._phase("projections"):
+            # Sessions may have overwritten existing ones, so recompute them.
+            for start in range(0, len(game_ids), _REBUILD_CHUNK_SIZE):
+                delete_game_results(
+                    self.db, game_ids[start:start + _REBUILD_CHUNK_SIZE]
+                )
+            for start in range(0, len(session_ids), _REBUILD_CHUNK_SIZE):
+                chunk = session_ids[start:start + _REBUILD_CHUNK_SIZE]
+                rebuild_game_results(self.db, chunk)
+                rebuild_session_totals(self.db, chunk)
+        game_ids.clear()
+        self._pending_session_ids.clear()
+
+    def finish(self) -> None:
+        """Flush remaining rows and rebuild the leaderboard if sessions changed."""
+        self.flush()
+        if self.counts["sessions"]:
+            with self._phase("projections"):
+                rebuild_team_standings(self.db)
+
+    def timings_ms(self) -> dict[str, float]:
+        return {name: round(secs * 1000, 1) for name, secs in self.timings.items()}
@@ -0,0 +1,133 @@
+"""Monotonic change versions behind the ``GET /api/changes`` feed.
+
+Every insert or update of a team, session, game, penalty or setting stamps
+the row's ``change_version`` with the next value of a counter, and every
+delete records a ``change_tombstones`` row with its own version. A reset
+records one tombstone per resource with ``row_id`` NULL, meaning "every row
+of this resource up to here is gone". Clients keep the highest version they
+have seen and ask for everything after it.
+
+ORM writes are stamped by a ``before_flush`` hook that ``track_changes``
+attaches to the app's session factory; other sessions (benchmarks, ad hoc
+scripts) are left alone. Bulk statements bypass
+the ORM, so their callers stamp rows themselves with ``allocate_versions``
+or ``record_resets``. Versions follow commit order because SQLite admits
+one writer at a time and the counter update makes a transaction a writer
+until it commits.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import event, func, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session as DBSession, sessionmaker
+
+from database.orm_models import (
+    ChangeCounter,
+    ChangeTombstone,
+    Game,
+    Penalty,
+    Session,
+    Setting,
+    Team,
+)
+
+CHANGE_RESOURCES: dict[str, type] = {
+    "team": Team,
+    "session": Session,
+    "game": Game,
+    "penalty": Penalty,
+    "setting": Setting,
+}
+_RESOURCE_BY_MODEL = {model: name for name, model in CHANGE_RESOURCES.items()}
+
+_COUNTER = "changes"
+
+
+def allocate_versions(db: DBSession, count: int) -> int:
+    """Reserve ``count`` consecutive versions; returns the first one."""
+    table = ChangeCounter.__table__
+    stmt = sqlite_insert(table).values(name=_COUNTER, value=count)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.name], set_={"value": table.c.value + count}
+    ).returning(table.c.value)
+    last = db.connection().execute(stmt).scalar_one()
+    return last - count + 1
+
+
+def row_id(obj) -> str:
+    return obj.key if isinstance(obj, Setting) else obj.id
+
+
+def record_resets(db: DBSession, resources: Iterable[str]) -> None:
+    """Record that every row of ``resources`` was deleted in bulk."""
+    resources = list(resources)
+    version = allocate_versions(db, len(resources))
+    db.execute(
+        ChangeTombstone.__table__.insert(),
+        [
+            {"version": version + offset, "resource": resource, "row_id": None}
+            for offset, resource in enumerate(resources)
+        ],
+    )
+
+
+def _stamp_changes(session: DBSession, flush_context, instances) -> None:
+    changed = [obj for obj in session.new if type(obj) in _RESOURCE_BY_MODEL]
+    changed += [
+        obj
+        for obj in session.dirty
+        if type(obj) in _RESOURCE_BY_MODEL
+        and session.is_modified(obj, include_collections=False)
+    ]
+    deleted = [obj for obj in session.deleted if type(obj) in _RESOURCE_BY_MODEL]
+    if not changed and not deleted:
+        return
+
+    version = allocate_versions(session, len(changed) + len(deleted))
+    for obj in changed:
+        obj.change_version = version
+        version += 1
+    for obj in deleted:
+        session.add(
+            ChangeTombstone(
+                version=version,
+                resource=_RESOURCE_BY_MODEL[type(obj)],
+                row_id=row_id(obj),
+            )
+        )
+        version += 1
+
+
+def track_changes(factory: sessionmaker) -> sessionmaker:
+    """Stamp change versions on every flush of sessions made by ``factory``."""
+    if not event.contains(factory, "before_flush", _stamp_changes):
+        event.listen(factory, "before_flush", _stamp_changes)
+    return factory
+
+
+def backfill_change_versions(db: DBSession) -> int:
+    """Give rows written before change tracking existed a version.
+
+    Each table gets a block of versions offset by ``rowid``, so the
+    backfill is one UPDATE per table. Returns the number of rows stamped.
+    """
+    stamped = 0
+    for model in CHANGE_RESOURCES.values():
+        table = model.__table__
+        pending = db.execute(
+            select(func.count()).where(table.c.change_version.is_(None))
+        ).scalar()
+        if not pending:
+            continue
+        max_rowid = db.execute(text(f"SELECT MAX(rowid) FROM {table.name}")).scalar()
+        base = allocate_versions(db, max_rowid) - 1
+        db.execute(
+            text(
+                f"UPDATE {table.name} SET change_version = :base + rowid "
+                "WHERE change_version IS NULL"
+            ),
+            {"base": base},
+        )
+        stamped += pending
+    return stamped
@@ -0,0 +1,72 @@
+"""Per-resource data version tokens stored in the ``data_versions`` table.
+
+Writers call ``bump_data_version`` inside their transaction; readers compare
+``get_data_version`` against the token their cached value was built from.
+Tokens are random rather than counters so that a reset table (or a fresh
+test database) can never reproduce a token some process already cached.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session as DBSession
+
+from database.orm_models import DataVersion
+
+# Resources whose GET responses carry HTTP validators; settings' token is
+# ``services.scoring.SETTINGS_RESOURCE``.
+TEAMS_RESOURCE = "teams"
+SESSIONS_RESOURCE = "sessions"
+LEADERBOARD_RESOURCE = "leaderboard"
+
+
+def get_data_version(db: DBSession, resource: str) -> str | None:
+    """Return the current version token for ``resource``, if any."""
+    return (
+        db.query(DataVersion.version)
+        .filter(DataVersion.resource == resource)
+        .scalar()
+    )
+
+
+def get_data_versions(db: DBSession, *resources: str) -> tuple[str | None, ...]:
+    """Current tokens for several resources in one query, in argument order."""
+    found = dict(
+        db.query(DataVersion.resource, DataVersion.version).filter(
+            DataVersion.resource.in_(resources)
+        )
+    )
+    return tuple(found.get(resource) for resource in resources)
+
+
+def get_data_version_info(
+    db: DBSession, resource: str
+) -> tuple[str, datetime] | None:
+    """Return ``(version, updated_at)`` for ``resource``, if it has one."""
+    row = (
+        db.query(DataVersion.version, DataVersion.updated_at)
+        .filter(DataVersion.resource == resource)
+        .first()
+    )
+    return tuple(row) if row else None
+
+
+def bump_data_version(db: DBSession, resource: str) -> str:
+    """Assign ``resource`` a fresh version token in the caller's transaction."""
+    version = uuid.uuid4().hex
+    now = datetime.now(timezone.utc)
+    stmt = sqlite_insert(DataVersion).values(
+        resource=resource, version=version, updated_at=now
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DataVersion.resource],
+        set_={"version": version, "updated_at": now},
+    )
+    db.execute(stmt)
+    return version
+
+
+def bump_data_versions(db: DBSession, *resources: str) -> None:
+    for resource in resources:
+        bump_data_version(db, resource)
@@ -0,0 +1,50 @@
+"""Row serializers shared by ``GET /api/export`` and ``GET /api/changes``.
+
+Both feeds use the export's camelCase field names, so a client can apply
+a change entry to a record it restored from an export.
+"""
+
+from database.orm_models import Game, Penalty, Session, Team
+
+
+def team_record(t: Team) -> dict:
+    return {
+        "id": t.id,
+        "name": t.name,
+        "players": t.players,
+        "color": t.color,
+        "tag": t.tag,
+        "createdAt": t.created_at.isoformat() if t.created_at else None,
+    }
+
+
+def session_record(s: Session) -> dict:
+    """The session's own fields, without its games and penalties."""
+    return {
+        "id": s.id,
+        "name": s.name,
+        "date": s.date.isoformat() if s.date else None,
+        "teamIds": s.team_ids,
+        "status": s.status,
+    }
+
+
+def game_record(g: Game) -> dict:
+    return {
+        "id": g.id,
+        "name": g.name,
+        "playerPlacements": g.player_placements,
+        "playerPoints": g.player_points,
+        "teamPlayerMap": g.team_player_map,
+        "points": g.points,
+        "placements": g.placements,
+    }
+
+
+def penalty_record(p: Penalty) -> dict:
+    return {
+        "id": p.id,
+        "teamId": p.team_id,
+        "value": p.value,
+        "reason": p.reason,
+    }
@@ -0,0 +1,74 @@
+"""Fast JSON responses encoded straight from SQL rows.
+
+The default path validates ORM objects through Pydantic models and
+encodes the result with the stdlib encoder. Routes offering ``fast=true``
+instead select the columns they need and encode the rows directly, with
+``orjson`` when it is installed and ``json`` otherwise. JSON columns read
+through ``raw_json`` are copied into the output as stored, so they are
+never decoded and re-encoded. The document is the same either way.
+"""
+
+import json
+from collections.abc import Collection, Iterable
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Row, Text, type_coerce
+from sqlalchemy.orm import InstrumentedAttribute
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JSON_ENCODER = "orjson" if orjson is not None else "json"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def raw_json(column: InstrumentedAttribute):
+    """Select a JSON column as its stored text instead of decoding it."""
+    return type_coerce(column, Text).label(column.key)
+
+
+def encode_rows(rows: Iterable[Row], raw: Collection[str] = ()) -> bytes:
+    """Encode rows as a JSON array of objects keyed by column label.
+
+    Columns named in ``raw`` hold JSON text (see ``raw_json``) and are
+    spliced in verbatim.
+    """
+    members = None
+    objects = []
+    for row in rows:
+        if members is None:
+            members = [(b'"%s":' % key.encode(), key in raw) for key in row._fields]
+        objects.append(
+            b"{"
+            + b",".join(
+                prefix
+                + (value.encode() if is_raw and value is not None else dumps(value))
+                for (prefix, is_raw), value in zip(members, row)
+            )
+            + b"}"
+        )
+    return b"[" + b",".join(objects) + b"]"
+
+
+def encode_object(fields: dict, **encoded: bytes) -> bytes:
+    """Encode ``fields`` plus members that are already encoded JSON."""
+    extra = b"".join(
+        b',"%s":%s' % (key.encode(), value) for key, value in encoded.items()
+    )
+    return dumps(fields)[:-1] + extra + b"}"
@@ -0,0 +1,175 @@
+"""Normalized game result rows mirrored from the JSON columns on ``Game``.
+
+``game_results`` has one row per (game, team) and ``game_player_results``
+one row per (game, player), so aggregates can run as indexed ``GROUP BY``
+queries instead of deserializing every game in Python. ``Game`` keeps its
+JSON columns as the source of truth for the API and export format.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session as DBSession
+
+from database.orm_models import Game, GamePlayerResult, GameResult
+
+_REBUILD_BATCH_SIZE = 1000
+
+
+def _split_player_key(
+    key: str, team_player_map: dict[str, list[str]]
+) -> tuple[str | None, str]:
+    """Resolve ``(team_id, player_name)`` for a ``player_placements`` key.
+
+    Keys may be "teamId::playerName" (new) or "playerName" (legacy).
+    """
+    if "::" in key:
+        team_id, player_name = key.split("::", 1)
+        return team_id, player_name
+    for team_id, players in team_player_map.items():
+        if key in players:
+            return team_id, key
+    return None, key
+
+
+def _team_result_rows(
+    game_id: str,
+    session_id: str,
+    points: dict[str, int],
+    placements: dict[str, int],
+) -> list[dict]:
+    return [
+        {
+            "game_id": game_id,
+            "team_id": team_id,
+            "session_id": session_id,
+            "points": pts,
+            "placement": placements.get(team_id),
+        }
+        for team_id, pts in points.items()
+    ]
+
+
+def _player_result_rows(
+    game_id: str,
+    session_id: str,
+    player_placements: dict[str, int],
+    player_points: dict[str, int],
+    team_player_map: dict[str, list[str]],
+) -> list[dict]:
+    rows = []
+    for key, placement in player_placements.items():
+        team_id, player_name = _split_player_key(key, team_player_map)
+        rows.append({
+            "game_id": game_id,
+            "player_key": key,
+            "session_id": session_id,
+            "team_id": team_id,
+            "player_name": player_name,
+            "placement": placement,
+            "points": player_points.get(key, 0),
+        })
+    return rows
+
+
+def attach_game_results(game: Game) -> None:
+    """Populate a new game's result rows from its JSON columns.
+
+    The rows are flushed together with the game, which fills in ``game_id``
+    through the relationships.
+    """
+    game.team_results = [
+        GameResult(**row)
+        for row in _team_result_rows(
+            game.id, game.session_id, game.points or {}, game.placements or {}
+        )
+    ]
+    game.player_results = [
+        GamePlayerResult(**row)
+        for row in _player_result_rows(
+            game.id,
+            game.session_id,
+            game.player_placements or {},
+            game.player_points or {},
+            game.team_player_map or {},
+        )
+    ]
+
+
+def delete_game_results(db: DBSession, game_ids: Iterable[str]) -> None:
+    """Drop the result rows of ``game_ids``, whichever session they were in."""
+    game_ids = list(game_ids)
+    db.query(GameResult).filter(GameResult.game_id.in_(game_ids)).delete()
+    db.query(GamePlayerResult).filter(
+        GamePlayerResult.game_id.in_(game_ids)
+    ).delete()
+
+
+def rebuild_game_results(
+    db: DBSession, session_ids: Iterable[str] | None = None
+) -> int:
+    """Regenerate result rows for the given sessions (all when ``None``).
+
+    Reads games in batches and inserts with executemany. Returns the number
+    of games processed.
+    """
+    team_delete = db.query(GameResult)
+    player_delete = db.query(GamePlayerResult)
+    games_query = db.query(
+        Game.id,
+        Game.session_id,
+        Game.points,
+        Game.placements,
+        Game.player_placements,
+        Game.player_points,
+        Game.team_player_map,
+    )
+    if session_ids is not None:
+        session_ids = list(session_ids)
+        team_delete = team_delete.filter(GameResult.session_id.in_(session_ids))
+        player_delete = player_delete.filter(
+            GamePlayerResult.session_id.in_(session_ids)
+        )
+        games_query = games_query.filter(Game.session_id.in_(session_ids))
+    team_delete.delete()
+    player_delete.delete()
+
+    games = 0
+    team_rows: list[dict] = []
+    player_rows: list[dict] = []
+    for row in games_query.yield_per(_REBUILD_BATCH_SIZE):
+        team_rows.extend(
+            _team_result_rows(
+                row.id, row.session_id, row.points or {}, row.placements or {}
+            )
+        )
+        player_rows.extend(
+            _player_result_rows(
+                row.id,
+                row.session_id,
+                row.player_placements or {},
+                row.player_points or {},
+                row.team_player_map or {},
+            )
+        )
+        games += 1
+        if games % _REBUILD_BATCH_SIZE == 0:
+            _flush_rows(db, team_rows, player_rows)
+    _flush_rows(db, team_rows, player_rows)
+
+    # Any Game already in the identity map now has stale result collections.
+    for obj in list(db.identity_map.values()):
+        if isinstance(obj, Game):
+            db.expire(obj, ["team_results", "player_results"])
+    return games
+
+
+def _flush_rows(
+    db: DBSession, team_rows: list[dict], player_rows: list[dict]
+) -> None:
+    if team_rows:
+        db.execute(insert(GameResult.__table__), team_rows)
+        team_rows.clear()
+    if player_rows:
+        db.execute(insert(GamePlayerResult.__table__), player_rows)
+        player_rows.clear()
@@ -0,0 +1,58 @@
+"""HTTP validators (``ETag`` / ``Last-Modified``) from data version tokens.
+
+A GET handler calls ``not_modified`` before touching its data. When the
+client's ``If-None-Match`` matches the current version it gets a bodiless
+304 after a single primary-key lookup; otherwise the validators are set on
+the response and the handler builds the body as usual.
+"""
+
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session as DBSession
+
+from services.data_versions import get_data_version_info
+
+
+def _etag(version: str, query: str) -> str:
+    # Different query strings are different representations.
+    if not query:
+        return f'"{version}"'
+    digest = hashlib.sha1(query.encode()).hexdigest()[:12]
+    return f'"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag.removeprefix("W/") for tag in candidates)
+
+
+def not_modified(
+    request: Request, response: Response, db: DBSession, resource: str
+) -> Response | None:
+    """Return a 304 if the client is current, else set validators on ``response``.
+
+    Resources that have never been written have no version, and are served
+    without validators.
+    """
+    info = get_data_version_info(db, resource)
+    if info is None:
+        return None
+    version, updated_at = info
+    headers = {
+        "ETag": _etag(version, request.url.query),
+        "Last-Modified": format_datetime(
+            updated_at.replace(tzinfo=timezone.utc), usegmt=True
+        ),
+        "Cache-Control": "no-cache",
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,217 @@
+"""In-process background jobs with a bounded worker pool.
+
+Routers start long operations with ``start_job()`` and return the job at
+once; clients poll ``GET /api/jobs/{id}``. Each job runs in its own
+database session on a pool thread. The ``jobs`` row is written when a job is
+queued, started and finished. Progress in between stays in memory, because
+a progress write would have to wait behind the job's own open write
+transaction on SQLite.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session as DBSession, sessionmaker
+
+from database.orm_models import Job
+from models.schemas import JobResponse
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_MAX_PENDING = int(os.getenv("JOB_MAX_PENDING", "16"))
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested."""
+
+
+class JobQueueFull(Exception):
+    """Too many jobs are already queued or running."""
+
+
+@dataclass
+class _LiveJob:
+    cancel: threading.Event = field(default_factory=threading.Event)
+    progress: int = 0
+    total: int | None = None
+    future: Future | None = None
+
+
+class JobContext:
+    """Handed to a job function to report progress and honour cancellation."""
+
+    def __init__(self, live: _LiveJob):
+        self._live = live
+        self.timings_ms: dict[str, float] = {}
+
+    def report(self, progress: int, total: int | None = None) -> None:
+        self._live.progress = progress
+        if total is not None:
+            self._live.total = total
+
+    def check_cancelled(self) -> None:
+        """Raise ``JobCancelled`` if cancellation was requested."""
+        if self._live.cancel.is_set():
+            raise JobCancelled()
+
+
+JobFunction = Callable[[DBSession, JobContext], dict | None]
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobRunner:
+    def __init__(
+        self, max_workers: int = JOB_WORKERS, max_pending: int = JOB_MAX_PENDING
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._live: dict[str, _LiveJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, db: DBSession, kind: str, fn: JobFunction) -> Job:
+        """Queue ``fn`` as a job on ``db``'s engine; raises ``JobQueueFull``.
+
+        ``fn`` receives a fresh session and a ``JobContext``. It should
+        commit its own work; an exception rolls it back and fails the job.
+        """
+        with self._lock:
+            if len(self._live) >= self.max_pending:
+                raise JobQueueFull()
+            job = Job(kind=kind, status="queued", progress=0, timings_ms={})
+            db.add(job)
+            db.commit()
+            db.refresh(job)
+            live = _LiveJob()
+            self._live[job.id] = live
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="job"
+                )
+            # Job sessions share the caller's session class, and with it the
+            # app's session events (change tracking).
+            factory = sessionmaker(
+                bind=db.get_bind(), class_=type(db), autoflush=False
+            )
+            live.future = self._executor.submit(self._run, job.id, fn, factory, live)
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation; returns False if the job is not active here."""
+        with self._lock:
+            live = self._live.get(job_id)
+        if live is None:
+            return False
+        live.cancel.set()
+        return True
+
+    def wait(self, job_id: str, timeout: float | None = None) -> None:
+        """Block until the job finishes (no-op if it is not active here)."""
+        with self._lock:
+            live = self._live.get(job_id)
+        if live is not None and live.future is not None:
+            live.future.result(timeout)
+
+    def overlay(self, job: Job) -> Job:
+        """Copy live progress onto an active job row read from the database."""
+        with self._lock:
+            live = self._live.get(job.id)
+        if live is not None and job.status in ACTIVE_STATUSES:
+            job.progress = live.progress
+            job.total = live.total
+        return job
+
+    def _run(
+        self, job_id: str, fn: JobFunction, factory: sessionmaker, live: _LiveJob
+    ) -> None:
+        db = factory()
+        try:
+            job = db.get(Job, job_id)
+            if live.cancel.is_set():
+                self._finish(db, job, live, "cancelled", {})
+                return
+            job.status = "running"
+            job.started_at = _now()
+            db.commit()
+            queued_ms = (job.started_at - job.created_at).total_seconds() * 1000
+
+            context = JobContext(live)
+            start = time.perf_counter()
+            result, error = None, None
+            try:
+                result = fn(db, context)
+                db.commit()
+                status = "succeeded"
+            except JobCancelled:
+                db.rollback()
+                status = "cancelled"
+            except Exception as exc:
+                db.rollback()
+                status, error = "failed", str(exc) or type(exc).__name__
+            timings = {
+                **context.timings_ms,
+                "queued": round(max(queued_ms, 0.0), 1),
+                "run": round((time.perf_counter() - start) * 1000, 1),
+            }
+            job = db.get(Job, job_id)
+            job.result = result
+            job.error = error
+            self._finish(db, job, live, status, timings)
+        finally:
+            db.close()
+            with self._lock:
+                self._live.pop(job_id, None)
+
+    @staticmethod
+    def _finish(
+        db: DBSession, job: Job, live: _LiveJob, status: str, timings: dict
+    ) -> None:
+        job.status = status
+        job.progress = live.progress
+        job.total = live.total
+        job.timings_ms = timings
+        job.finished_at = _now()
+        db.commit()
+
+
+job_runner = JobRunner()
+
+
+def start_job(db: DBSession, kind: str, fn: JobFunction) -> JSONResponse:
+    """Queue ``fn`` as a background job and answer 202 with the job."""
+    try:
+        job = job_runner.submit(db, kind, fn)
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=503, detail="Too many background jobs, retry later"
+        )
+    content = jsonable_encoder(JobResponse.model_validate(job))
+    return JSONResponse(
+        content, status_code=202, headers={"Location": f"/api/jobs/{job.id}"}
+    )
+
+
+def fail_interrupted_jobs(db: DBSession) -> int:
+    """Mark jobs left active by a previous process as failed."""
+    count = (
+        db.query(Job)
+        .filter(Job.status.in_(ACTIVE_STATUSES))
+        .update(
+            {Job.status: "failed", Job.error: "Interrupted by restart"},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return count
@@ -0,0 +1,94 @@
+"""In-process fan-out of session events to Server-Sent Events subscribers.
+
+The game, penalty and session routers publish after they commit. Each
+event is encoded to an SSE frame once and handed to every subscriber's
+bounded queue on that subscriber's event loop. A subscriber whose queue is
+full is not keeping up (its socket is backed up): it is dropped with a
+final ``dropped`` event instead of buffering without limit or slowing the
+writer down, and the browser's ``EventSource`` reconnects and resyncs.
+
+Subscribers are per process; with several workers each one only sees
+writes handled by its own process.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from collections import defaultdict
+
+LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "64"))
+LIVE_KEEPALIVE_SECONDS = float(os.getenv("LIVE_KEEPALIVE_SECONDS", "15"))
+
+
+def encode_event(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+class LiveSubscriber:
+    """One connected viewer; ``None`` in the queue means it was dropped."""
+
+    def __init__(self, queue_size: int):
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[bytes | None] = asyncio.Queue(queue_size)
+        self.dropped = False
+
+    def offer(self, frame: bytes) -> None:
+        # Runs on the subscriber's loop, never concurrently with ``get``.
+        if self.dropped:
+            return
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.dropped = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class LiveEventBroker:
+    def __init__(self, queue_size: int = LIVE_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: dict[str, set[LiveSubscriber]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, session_id: str) -> LiveSubscriber:
+        """Register a subscriber; must be called on its event loop."""
+        subscriber = LiveSubscriber(self.queue_size)
+        with self._lock:
+            self._subscribers[session_id].add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, session_id: str, subscriber: LiveSubscriber) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(session_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[session_id]
+
+    def subscriber_count(self, session_id: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(session_id, ()))
+
+    def publish(self, session_id: str, event: str, data: dict) -> int:
+        """Queue ``event`` for every subscriber of ``session_id``; thread-safe.
+
+        Returns the number of subscribers it was offered to.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(session_id, ()))
+        if not subscribers:
+            return 0
+        frame = encode_event(event, data)
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.offer, frame)
+            except RuntimeError:
+                # Its loop has shut down without unsubscribing.
+                self.unsubscribe(session_id, subscriber)
+        return len(subscribers)
+
+
+live_events = LiveEventBroker()
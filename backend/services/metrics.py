@@ -0,0 +1,244 @@
+"""Per-request SQL and latency instrumentation, exported as Prometheus text.
+
+``RequestMetricsMiddleware`` opens a ``RequestStats`` for each HTTP request
+in a context variable. The engine hooks installed by ``instrument_engine``
+add each statement's count and duration to whichever request is current
+(the variable follows the request into threadpool workers). When the
+response starts, the totals are sent as a ``Server-Timing`` header; when it
+finishes, they are folded into per-route counters and a latency histogram
+served by ``GET /api/metrics``.
+
+The cost per statement is two ``perf_counter`` calls and a context variable
+lookup; per request it is one dict update under a lock.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import Engine, event
+
+from services.single_flight import single_flight
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    scope: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def route(self) -> str:
+        """``"METHOD /route/{template}"`` of the request."""
+        return f"{self.scope.get('method')} {route_template(self.scope)}"
+
+
+def route_template(scope: dict) -> str:
+    return getattr(scope.get("route"), "path", None) or "unmatched"
+
+
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> RequestStats | None:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, params, context, executemany):
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, params, context, executemany):
+    stats = _current.get()
+    if stats is None or context is None:
+        return
+    stats.queries += 1
+    stats.db_seconds += time.perf_counter() - context._metrics_started
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attribute ``engine``'s statements to the current request; idempotent."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@dataclass
+class _RouteMetrics:
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    count: int = 0
+    seconds: float = 0.0
+    queries: int = 0
+    db_seconds: float = 0.0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], _RouteMetrics] = {}
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        stats: RequestStats,
+    ) -> None:
+        with self._lock:
+            metrics = self._routes.get((method, route))
+            if metrics is None:
+                metrics = self._routes[(method, route)] = _RouteMetrics()
+            bucket = bisect_left(LATENCY_BUCKETS, seconds)
+            if bucket < len(LATENCY_BUCKETS):
+                metrics.buckets[bucket] += 1
+            metrics.count += 1
+            metrics.seconds += seconds
+            metrics.queries += stats.queries
+            metrics.db_seconds += stats.db_seconds
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            routes = sorted(self._routes.items())
+            routes = [(key, _copy(metrics)) for key, metrics in routes]
+
+        lines = [
+            "# HELP tournament_http_requests_total Requests by route and status.",
+            "# TYPE tournament_http_requests_total counter",
+        ]
+        for (method, route), m in routes:
+            for status, count in sorted(m.statuses.items()):
+                labels = _labels(method=method, route=route, status=str(status))
+                lines.append(f"tournament_http_requests_total{labels} {count}")
+
+        lines += [
+            "# HELP tournament_http_request_duration_seconds Request latency.",
+            "# TYPE tournament_http_request_duration_seconds histogram",
+        ]
+        for (method, route), m in routes:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, m.buckets):
+                cumulative += count
+                labels = _labels(method=method, route=route, le=f"{bound:g}")
+                lines.append(
+                    f"tournament_http_request_duration_seconds_bucket{labels} "
+                    f"{cumulative}"
+                )
+            labels = _labels(method=method, route=route, le="+Inf")
+            lines.append(
+                f"tournament_http_request_duration_seconds_bucket{labels} {m.count}"
+            )
+            labels = _labels(method=method, route=route)
+            lines.append(
+                f"tournament_http_request_duration_seconds_sum{labels} "
+                f"{m.seconds:.6f}"
+            )
+            lines.append(
+                f"tournament_http_request_duration_seconds_count{labels} {m.count}"
+            )
+
+        for name, help_text, attr, fmt in (
+            ("db_queries_total", "SQL statements executed.", "queries", "d"),
+            ("db_seconds_total", "Time in SQL statements.", "db_seconds", ".6f"),
+        ):
+            lines += [
+                f"# HELP tournament_http_request_{name} {help_text}",
+                f"# TYPE tournament_http_request_{name} counter",
+            ]
+            for (method, route), m in routes:
+                labels = _labels(method=method, route=route)
+                value = format(getattr(m, attr), fmt)
+                lines.append(f"tournament_http_request_{name}{labels} {value}")
+
+        lines += [
+            "# HELP tournament_single_flight_total Coalesced read outcomes.",
+            "# TYPE tournament_single_flight_total counter",
+        ]
+        for endpoint, counts in single_flight.metrics().items():
+            for outcome, count in counts.items():
+                labels = _labels(endpoint=endpoint, outcome=outcome)
+                lines.append(f"tournament_single_flight_total{labels} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _copy(metrics: _RouteMetrics) -> _RouteMetrics:
+    return _RouteMetrics(
+        buckets=list(metrics.buckets),
+        count=metrics.count,
+        seconds=metrics.seconds,
+        queries=metrics.queries,
+        db_seconds=metrics.db_seconds,
+        statuses=dict(metrics.statuses),
+    )
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    pairs = ",".join(f'{key}="{_label_value(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+metrics_registry = MetricsRegistry()
+
+
+def _server_timing(stats: RequestStats, seconds: float) -> bytes:
+    return (
+        f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.queries} queries", '
+        f"app;dur={seconds * 1000:.2f}"
+    ).encode()
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware; pure ASGI so streaming responses are not buffered."""
+
+    def __init__(self, app, registry: MetricsRegistry = metrics_registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope=scope)
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timing = _server_timing(stats, time.perf_counter() - started)
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"server-timing", timing),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            self.registry.record(
+                scope["method"],
+                route_template(scope),
+                status,
+                time.perf_counter() - started,
+                stats,
+            )
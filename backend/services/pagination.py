@@ -0,0 +1,126 @@
+"""Keyset pagination and field projection helpers for list endpoints.
+
+Cursors are opaque URL-safe tokens encoding the ``(sort_value, id)`` of the
+last row on a page. The next page starts strictly after that pair, so page
+cost stays constant however deep the client pages, unlike ``OFFSET``.
+"""
+
+import base64
+import json
+from collections.abc import Mapping
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import InstrumentedAttribute, Query
+
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    raw = json.dumps([sort_value.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Return ``(sort_value, id)``; raises ``ValueError`` on a bad cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), str(row_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def apply_keyset(
+    query: Query,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: str | None,
+    descending: bool = False,
+) -> Query:
+    """Order ``query`` by ``(sort_column, id_column)`` and seek past ``cursor``.
+
+    ``descending`` orders both columns newest first.
+    """
+    if cursor is not None:
+        sort_value, row_id = decode_cursor(cursor)
+        if descending:
+            query = query.filter(
+                or_(
+                    sort_column < sort_value,
+                    and_(sort_column == sort_value, id_column < row_id),
+                )
+            )
+        else:
+            query = query.filter(
+                or_(
+                    sort_column > sort_value,
+                    and_(sort_column == sort_value, id_column > row_id),
+                )
+            )
+    if descending:
+        return query.order_by(sort_column.desc(), id_column.desc())
+    return query.order_by(sort_column, id_column)
+
+
+def parse_fields(fields: str | None, allowed: tuple[str, ...]) -> list[str] | None:
+    """Parse a ``fields=a,b`` projection; ``id`` is always included.
+
+    Returns ``None`` when no projection was requested and raises
+    ``ValueError`` naming any unknown field.
+    """
+    if fields is None:
+        return None
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = sorted(set(requested) - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return ["id"] + [f for f in dict.fromkeys(requested) if f != "id"]
+
+
+def paginate(
+    query: Query,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    limit: int | None,
+    cursor: str | None,
+    descending: bool = False,
+) -> tuple[list, str | None]:
+    """Run a keyset-paginated ``query``; returns ``(rows, next_cursor)``.
+
+    Without ``limit`` every remaining row is returned and there is no next
+    cursor. Rows may be entities or column tuples, but must expose the sort
+    and id columns by name.
+    """
+    query = apply_keyset(query, sort_column, id_column, cursor, descending)
+    if limit is None:
+        return query.all(), None
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(
+        getattr(last, sort_column.key), getattr(last, id_column.key)
+    )
+
+
+def projected_response(
+    rows: list,
+    fields: list[str],
+    next_cursor: str | None,
+    headers: Mapping[str, str] | None = None,
+) -> JSONResponse:
+    """Serialize column rows as ``{field: value}`` dicts, bypassing the models.
+
+    ``headers`` (e.g. validators already set on the injected ``Response``)
+    are copied over, since a returned response replaces that one.
+    """
+    content = jsonable_encoder([{f: getattr(row, f) for f in fields} for row in rows])
+    headers = dict(headers or {})
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return JSONResponse(content, headers=headers)
@@ -0,0 +1,177 @@
+"""Opt-in cProfile capture of a single request.
+
+An admin adds ``X-Profile: 1`` (or ``?profile=1``) to a request along with
+``X-Admin-Token``. ``ProfilerMiddleware`` then arms a profile in a context
+variable, and ``ProfiledRoute`` runs the endpoint under it in the worker
+thread that executes it (cProfile only sees the thread that enables it).
+The stats are written as a pstats file under ``DATA_DIR/profiles`` with a
+JSON sidecar, and the profile ID is returned in ``X-Profile-Id``.
+
+Only sync endpoints are profiled: an async endpoint shares the event loop
+with other requests, whose coroutines would show up in its profile. Response
+model validation runs after the endpoint returns and is not included.
+"""
+
+import cProfile
+import functools
+import inspect
+import io
+import json
+import os
+import pstats
+import re
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from fastapi.routing import APIRoute
+
+from database.connection import DATA_DIR
+from services.admin import ADMIN_TOKEN_HEADER, is_admin_token
+
+PROFILE_DIR = DATA_DIR / "profiles"
+PROFILE_RETENTION = int(os.getenv("PROFILE_RETENTION", "50"))
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "x-profile-id"
+
+# UTC timestamp to the microsecond, so IDs sort in creation order. IDs
+# written before microseconds were added are still served.
+_PROFILE_ID = re.compile(r"\d{8}T\d{6}(\d{6})?-[0-9a-f]{8}")
+_TRUTHY = {"1", "true", "yes"}
+
+
+@dataclass
+class _Capture:
+    profile: cProfile.Profile = field(default_factory=cProfile.Profile)
+    seconds: float = 0.0
+    ran: bool = False
+
+
+_active: ContextVar[_Capture | None] = ContextVar("profile_capture", default=None)
+
+
+def profiled(endpoint):
+    """Wrap a sync endpoint so it runs under the request's armed profile."""
+    if inspect.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        capture = _active.get()
+        if capture is None:
+            return endpoint(*args, **kwargs)
+        capture.ran = True
+        started = time.perf_counter()
+        try:
+            return capture.profile.runcall(endpoint, *args, **kwargs)
+        finally:
+            capture.seconds += time.perf_counter() - started
+
+    return wrapper
+
+
+class ProfiledRoute(APIRoute):
+    """Route class for routers whose endpoints can be profiled on request."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, profiled(endpoint), **kwargs)
+
+
+def save_profile(capture: _Capture, method: str, path: str, status: int) -> str:
+    """Write ``capture`` under ``PROFILE_DIR`` and return its ID."""
+    now = datetime.now(timezone.utc)
+    profile_id = f"{now:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}"
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    capture.profile.dump_stats(PROFILE_DIR / f"{profile_id}.pstats")
+    info = {
+        "id": profile_id,
+        "method": method,
+        "path": path,
+        "status": status,
+        "duration_ms": round(capture.seconds * 1000, 3),
+        "created_at": now.isoformat(),
+    }
+    (PROFILE_DIR / f"{profile_id}.json").write_text(json.dumps(info))
+    _prune()
+    return profile_id
+
+
+def _prune() -> None:
+    sidecars = sorted(PROFILE_DIR.glob("*.json"), reverse=True)
+    for sidecar in sidecars[PROFILE_RETENTION:]:
+        sidecar.with_suffix(".pstats").unlink(missing_ok=True)
+        sidecar.unlink(missing_ok=True)
+
+
+def list_profiles() -> list[dict]:
+    """Metadata of the stored profiles, newest first."""
+    if not PROFILE_DIR.exists():
+        return []
+    return [
+        json.loads(sidecar.read_text())
+        for sidecar in sorted(PROFILE_DIR.glob("*.json"), reverse=True)
+    ]
+
+
+def get_profile_path(profile_id: str) -> Path | None:
+    if not _PROFILE_ID.fullmatch(profile_id):
+        return None
+    path = PROFILE_DIR / f"{profile_id}.pstats"
+    return path if path.exists() else None
+
+
+def render_profile(path: Path, sort: str = "cumulative", limit: int = 50) -> str:
+    """The pstats text report for a stored profile."""
+    out = io.StringIO()
+    pstats.Stats(str(path), stream=out).sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+
+def _profile_requested(scope) -> bool:
+    headers = dict(scope["headers"])
+    if not is_admin_token(_decode(headers.get(ADMIN_TOKEN_HEADER.encode()))):
+        return False
+    if _decode(headers.get(PROFILE_HEADER.encode()), "").lower() in _TRUTHY:
+        return True
+    query = parse_qs(scope.get("query_string", b"").decode())
+    return any(value.lower() in _TRUTHY for value in query.get("profile", ()))
+
+
+def _decode(value: bytes | None, default: str | None = None) -> str | None:
+    return value.decode("latin-1") if value is not None else default
+
+
+class ProfilerMiddleware:
+    """ASGI middleware arming a profile for requests that ask for one."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _profile_requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        capture = _Capture()
+        token = _active.set(capture)
+
+        async def send_with_profile_id(message):
+            # The endpoint has returned by the time the response starts.
+            if message["type"] == "http.response.start" and capture.ran:
+                profile_id = save_profile(
+                    capture, scope["method"], scope["path"], message["status"]
+                )
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (PROFILE_ID_HEADER.encode(), profile_id.encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            _active.reset(token)
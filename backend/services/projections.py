@@ -0,0 +1,322 @@
+"""Persisted read-model projections derived from sessions, games and penalties.
+
+``session_team_totals`` holds running per-team totals for every session.
+Game and penalty writes apply their deltas in the same transaction, so the
+scores endpoint is a keyed lookup.
+
+``team_standings`` holds the all-time leaderboard. A completed session
+contributes its per-team totals, one session played per team and one win
+for the top team. Writers retract a session's contribution before changing
+it and re-apply it afterwards (see ``track_session_standings``), so the
+leaderboard endpoint only ever reads the projection.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import func, insert, inspect as sa_inspect
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session as DBSession
+
+from database.orm_models import (
+    Game,
+    GameResult,
+    Penalty,
+    Session,
+    SessionTeamTotal,
+    TeamStanding,
+)
+from services.game_results import rebuild_game_results
+
+
+# --- Session totals ---
+
+
+def init_session_totals(db: DBSession, session: Session) -> None:
+    """Create zeroed totals rows for every team in a new session."""
+    for position, team_id in enumerate(dict.fromkeys(session.team_ids)):
+        db.add(
+            SessionTeamTotal(
+                session_id=session.id,
+                team_id=team_id,
+                position=position,
+                game_points=0,
+                penalty_points=0,
+                total=0,
+                games=0,
+            )
+        )
+
+
+def apply_game_totals(db: DBSession, game: Game, sign: int = 1) -> None:
+    """Add (``sign=1``) or retract (``sign=-1``) a game's team points.
+
+    Teams outside the session have no totals row, so their points are
+    ignored exactly as the original per-request aggregation did.
+    """
+    for team_id, pts in game.points.items():
+        db.query(SessionTeamTotal).filter(
+            SessionTeamTotal.session_id == game.session_id,
+            SessionTeamTotal.team_id == team_id,
+        ).update(
+            {
+                SessionTeamTotal.game_points: SessionTeamTotal.game_points
+                + sign * pts,
+                SessionTeamTotal.total: SessionTeamTotal.total + sign * pts,
+                SessionTeamTotal.games: SessionTeamTotal.games + sign,
+            },
+            synchronize_session=False,
+        )
+
+
+def apply_penalty_totals(db: DBSession, penalty: Penalty, sign: int = 1) -> None:
+    """Add (``sign=1``) or retract (``sign=-1``) a penalty's value."""
+    db.query(SessionTeamTotal).filter(
+        SessionTeamTotal.session_id == penalty.session_id,
+        SessionTeamTotal.team_id == penalty.team_id,
+    ).update(
+        {
+            SessionTeamTotal.penalty_points: SessionTeamTotal.penalty_points
+            + sign * penalty.value,
+            SessionTeamTotal.total: SessionTeamTotal.total + sign * penalty.value,
+        },
+        synchronize_session=False,
+    )
+
+
+def get_session_totals(db: DBSession, session_id: str) -> list[SessionTeamTotal]:
+    """Return a session's totals rows in ``team_ids`` order."""
+    return (
+        db.query(SessionTeamTotal)
+        .filter(SessionTeamTotal.session_id == session_id)
+        .order_by(SessionTeamTotal.position)
+        .all()
+    )
+
+
+def get_totals_for_sessions(
+    db: DBSession, session_ids: Iterable[str]
+) -> dict[str, list[SessionTeamTotal]]:
+    """Batched ``get_session_totals`` for many sessions in one query."""
+    session_ids = list(session_ids)
+    grouped: dict[str, list[SessionTeamTotal]] = {sid: [] for sid in session_ids}
+    if not session_ids:
+        return grouped
+    rows = (
+        db.query(SessionTeamTotal)
+        .filter(SessionTeamTotal.session_id.in_(session_ids))
+        .order_by(SessionTeamTotal.session_id, SessionTeamTotal.position)
+        .all()
+    )
+    for row in rows:
+        grouped[row.session_id].append(row)
+    return grouped
+
+
+def rebuild_session_totals(
+    db: DBSession, session_ids: Iterable[str] | None = None
+) -> int:
+    """Regenerate totals for the given sessions (all when ``None``).
+
+    Game and penalty sums come from ``GROUP BY`` queries over
+    ``game_results`` and ``penalties``; only each session's ``team_ids`` is
+    read back into Python. Returns the number of sessions rebuilt.
+    """
+    sessions_query = db.query(Session.id, Session.team_ids)
+    totals_query = db.query(SessionTeamTotal)
+    game_sums = db.query(
+        GameResult.session_id,
+        GameResult.team_id,
+        func.sum(GameResult.points),
+        func.count(),
+    ).group_by(GameResult.session_id, GameResult.team_id)
+    penalty_sums = db.query(
+        Penalty.session_id, Penalty.team_id, func.sum(Penalty.value)
+    ).group_by(Penalty.session_id, Penalty.team_id)
+    if session_ids is not None:
+        session_ids = list(session_ids)
+        sessions_query = sessions_query.filter(Session.id.in_(session_ids))
+        totals_query = totals_query.filter(
+            SessionTeamTotal.session_id.in_(session_ids)
+        )
+        game_sums = game_sums.filter(GameResult.session_id.in_(session_ids))
+        penalty_sums = penalty_sums.filter(Penalty.session_id.in_(session_ids))
+    totals_query.delete()
+
+    games_by_key = {
+        (session_id, team_id): (points, count)
+        for session_id, team_id, points, count in game_sums
+    }
+    penalties_by_key = {
+        (session_id, team_id): value for session_id, team_id, value in penalty_sums
+    }
+
+    rows = []
+    sessions = 0
+    for session_id, team_ids in sessions_query:
+        sessions += 1
+        for position, team_id in enumerate(dict.fromkeys(team_ids)):
+            game_points, games = games_by_key.get((session_id, team_id), (0, 0))
+            penalty_points = penalties_by_key.get((session_id, team_id), 0)
+            rows.append({
+                "session_id": session_id,
+                "team_id": team_id,
+                "position": position,
+                "game_points": game_points,
+                "penalty_points": penalty_points,
+                "total": game_points + penalty_points,
+                "games": games,
+            })
+    if rows:
+        db.execute(insert(SessionTeamTotal), rows)
+
+    for obj in list(db.identity_map.values()):
+        if isinstance(obj, Session):
+            db.expire(obj, ["team_totals"])
+    return sessions
+
+
+# --- Team standings ---
+
+
+def _apply_standings(db: DBSession, totals: dict[str, int], sign: int) -> None:
+    """Add (``sign=1``) or retract (``sign=-1``) one session's contribution."""
+    if not totals:
+        return
+    # Ties go to the first team in session order, matching max() semantics.
+    winner = max(totals, key=totals.get)
+    rows = [
+        {
+            "team_id": tid,
+            "total_points": sign * total,
+            "wins": sign if tid == winner else 0,
+            "sessions": sign,
+        }
+        for tid, total in totals.items()
+    ]
+    stmt = sqlite_insert(TeamStanding).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TeamStanding.team_id],
+        set_={
+            "total_points": TeamStanding.total_points + stmt.excluded.total_points,
+            "wins": TeamStanding.wins + stmt.excluded.wins,
+            "sessions": TeamStanding.sessions + stmt.excluded.sessions,
+        },
+    )
+    db.execute(stmt)
+
+
+def _session_standing_totals(db: DBSession, session_id: str) -> dict[str, int]:
+    # Column query rather than entities: the bulk UPDATEs above do not
+    # refresh totals rows already in the identity map.
+    rows = (
+        db.query(SessionTeamTotal.team_id, SessionTeamTotal.total)
+        .filter(SessionTeamTotal.session_id == session_id)
+        .order_by(SessionTeamTotal.position)
+        .all()
+    )
+    return dict(rows)
+
+
+@contextmanager
+def track_session_standings(db: DBSession, session: Session) -> Iterator[None]:
+    """Keep ``team_standings`` in step with changes made to ``session``.
+
+    Retracts the session's contribution on entry if it is completed, then
+    flushes on exit and re-applies it if the session still exists and is
+    (now) completed. Session totals must be updated inside the block;
+    everything runs in the caller's transaction.
+    """
+    if session.status == "completed":
+        _apply_standings(db, _session_standing_totals(db, session.id), -1)
+
+    yield
+
+    db.flush()
+    if sa_inspect(session).was_deleted or session.status != "completed":
+        return
+    _apply_standings(db, _session_standing_totals(db, session.id), 1)
+
+
+def rebuild_team_standings(db: DBSession) -> int:
+    """Regenerate ``team_standings`` from session totals. Returns the row count."""
+    db.query(TeamStanding).delete()
+    db.flush()
+
+    rows = (
+        db.query(
+            SessionTeamTotal.session_id,
+            SessionTeamTotal.team_id,
+            SessionTeamTotal.total,
+        )
+        .join(Session, Session.id == SessionTeamTotal.session_id)
+        .filter(Session.status == "completed")
+        .order_by(SessionTeamTotal.session_id, SessionTeamTotal.position)
+        .all()
+    )
+    by_session: dict[str, dict[str, int]] = {}
+    for session_id, team_id, total in rows:
+        by_session.setdefault(session_id, {})[team_id] = total
+
+    # Same rules as _apply_standings, accumulated in memory so the whole
+    # table is written with one executemany instead of an upsert per session.
+    standings: dict[str, dict] = {}
+    for totals in by_session.values():
+        winner = max(totals, key=totals.get)
+        for team_id, total in totals.items():
+            row = standings.setdefault(
+                team_id,
+                {"team_id": team_id, "total_points": 0, "wins": 0, "sessions": 0},
+            )
+            row["total_points"] += total
+            row["wins"] += team_id == winner
+            row["sessions"] += 1
+    if standings:
+        db.execute(insert(TeamStanding), list(standings.values()))
+    return len(standings)
+
+
+def rebuild_all(
+    db: DBSession, checkpoint: Callable[[], None] | None = None
+) -> dict[str, int]:
+    """Regenerate every projection from the source tables.
+
+    ``checkpoint`` is called between projections, e.g. to honour a job's
+    cancellation.
+    """
+    checkpoint = checkpoint or (lambda: None)
+    games = rebuild_game_results(db)
+    checkpoint()
+    sessions = rebuild_session_totals(db)
+    checkpoint()
+    teams = rebuild_team_standings(db)
+    return {
+        "game_results": games,
+        "session_team_totals": sessions,
+        "team_standings": teams,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from database.connection import SessionLocal, create_tables
+    from services.data_versions import LEADERBOARD_RESOURCE, bump_data_version
+
+    parser = argparse.ArgumentParser(description="Maintain read-model projections")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.parse_args()
+
+    create_tables()
+    db = SessionLocal()
+    try:
+        counts = rebuild_all(db)
+        bump_data_version(db, LEADERBOARD_RESOURCE)
+        db.commit()
+        print(
+            f"Rebuilt game_results for {counts['game_results']} games, "
+            f"session_team_totals for {counts['session_team_totals']} sessions "
+            f"and team_standings for {counts['team_standings']} teams"
+        )
+    finally:
+        db.close()
@@ -0,0 +1,154 @@
+"""Pre-serialized scoreboard snapshot for kiosk screens.
+
+The game and penalty routers rebuild the snapshot right after each write,
+so ``GET /api/kiosk/scoreboard`` only hands out the stored bytes, with no
+query, ORM or Pydantic work per viewer. Other writers (teams, sessions,
+import, reset, rebuild) just invalidate it and the next viewer rebuilds it.
+
+Snapshots are kept per engine, so every database (and test) has its own.
+Each process holds its own copy; ``KIOSK_SNAPSHOT_MAX_AGE`` bounds how long
+writes made by another worker process can go unseen.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import Engine, func
+from sqlalchemy.orm import Session as DBSession
+
+from database.orm_models import Game, Session, Team, TeamStanding
+from services.projections import get_totals_for_sessions
+
+KIOSK_SNAPSHOT_MAX_AGE = float(os.getenv("KIOSK_SNAPSHOT_MAX_AGE", "5"))
+
+
+@dataclass(frozen=True)
+class ScoreboardSnapshot:
+    body: bytes
+    etag: str
+    built_at: float
+
+
+_snapshots: "weakref.WeakKeyDictionary[Engine, ScoreboardSnapshot]" = (
+    weakref.WeakKeyDictionary()
+)
+# Builds are serialized so a slow build can never overwrite a newer one.
+_build_lock = threading.Lock()
+
+
+def _build_body(db: DBSession) -> bytes:
+    teams = {
+        team_id: {"name": name, "color": color, "tag": tag}
+        for team_id, name, color, tag in db.query(
+            Team.id, Team.name, Team.color, Team.tag
+        )
+    }
+    leaderboard = [
+        {"team_id": team_id, "total_points": total, "wins": wins, "sessions": played}
+        for team_id, total, wins, played in db.query(
+            TeamStanding.team_id,
+            TeamStanding.total_points,
+            TeamStanding.wins,
+            TeamStanding.sessions,
+        )
+        .filter(TeamStanding.sessions > 0)
+        .order_by(TeamStanding.total_points.desc(), TeamStanding.team_id)
+    ]
+
+    active = (
+        db.query(Session.id, Session.name, Session.date)
+        .filter(Session.status == "active")
+        .order_by(Session.date, Session.id)
+        .all()
+    )
+    active_ids = [row.id for row in active]
+    totals = get_totals_for_sessions(db, active_ids)
+    # Games may involve only some of a session's teams, so count them directly.
+    game_counts = dict(
+        db.query(Game.session_id, func.count(Game.id))
+        .filter(Game.session_id.in_(active_ids))
+        .group_by(Game.session_id)
+    ) if active_ids else {}
+    active_sessions = []
+    for row in active:
+        scores = [
+            {
+                "team_id": t.team_id,
+                "game_points": t.game_points,
+                "penalty_points": t.penalty_points,
+                "total": t.total,
+                "games_played": t.games,
+            }
+            for t in totals[row.id]
+        ]
+        # Stable sort keeps session team order for ties, as the scores API does.
+        scores.sort(key=lambda entry: entry["total"], reverse=True)
+        active_sessions.append({
+            "id": row.id,
+            "name": row.name,
+            "date": row.date.isoformat() if row.date else None,
+            "games": game_counts.get(row.id, 0),
+            "scores": scores,
+        })
+
+    return json.dumps({
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "teams": teams,
+        "leaderboard": leaderboard,
+        "active_sessions": active_sessions,
+    }).encode()
+
+
+def _store(engine: Engine) -> ScoreboardSnapshot:
+    # A short-lived session of its own: the connection goes back to the pool
+    # before the lock is released, so waiting viewers never pin connections.
+    with DBSession(bind=engine) as db:
+        body = _build_body(db)
+    snapshot = ScoreboardSnapshot(
+        body=body,
+        etag=f'"{hashlib.sha1(body).hexdigest()[:16]}"',
+        built_at=time.monotonic(),
+    )
+    _snapshots[engine] = snapshot
+    return snapshot
+
+
+def _is_fresh(snapshot: ScoreboardSnapshot | None) -> bool:
+    return (
+        snapshot is not None
+        and time.monotonic() - snapshot.built_at < KIOSK_SNAPSHOT_MAX_AGE
+    )
+
+
+def refresh_scoreboard(db: DBSession) -> ScoreboardSnapshot:
+    """Rebuild the snapshot from committed data; call after ``db.commit()``."""
+    engine = db.get_bind()
+    with _build_lock:
+        return _store(engine)
+
+
+def invalidate_scoreboard(db: DBSession) -> None:
+    with _build_lock:
+        _snapshots.pop(db.get_bind(), None)
+
+
+def get_scoreboard(db: DBSession) -> ScoreboardSnapshot:
+    """Return the current snapshot, building it if missing or too old.
+
+    Concurrent viewers that find it missing wait for a single rebuild.
+    """
+    engine = db.get_bind()
+    snapshot = _snapshots.get(engine)
+    if _is_fresh(snapshot):
+        return snapshot
+    with _build_lock:
+        snapshot = _snapshots.get(engine)
+        if _is_fresh(snapshot):
+            return snapshot
+        return _store(engine)
@@ -0,0 +1,83 @@
+"""Scoring configuration lookup with a process-wide, versioned cache.
+
+The parsed ``scoring``/``scoring_2p`` settings are cached per process and
+keyed by the ``settings`` data version, so every worker notices changes
+made elsewhere at the cost of one primary-key lookup per call.
+"""
+
+import json
+import threading
+
+from sqlalchemy.orm import Session as DBSession
+
+from database.orm_models import Setting
+from services.data_versions import get_data_version
+
+SETTINGS_RESOURCE = "settings"
+
+ScoringTables = tuple[dict[int, int], dict[int, int]]
+
+_cache: tuple[str, ScoringTables] | None = None
+_cache_lock = threading.Lock()
+
+
+def _load_scoring_config(db: DBSession) -> ScoringTables:
+    """Read scoring configuration from settings table.
+
+    Returns (standard_scoring, two_player_scoring) as {position: points} dicts.
+    Falls back to defaults if not configured.
+    """
+    default_std = {1: 4, 2: 3, 3: 2, 4: 1}
+    default_2p = {1: 4, 2: 1}
+
+    rows = {
+        row.key: row.value
+        for row in db.query(Setting).filter(
+            Setting.key.in_(("scoring", "scoring_2p"))
+        )
+    }
+
+    if "scoring" in rows:
+        raw = json.loads(rows["scoring"])
+        std = {1: raw.get("first", 4), 2: raw.get("second", 3),
+               3: raw.get("third", 2), 4: raw.get("fourth", 1)}
+    else:
+        std = default_std
+
+    if "scoring_2p" in rows:
+        raw = json.loads(rows["scoring_2p"])
+        two_p = {1: raw.get("first", 4), 2: raw.get("second", 1)}
+    else:
+        two_p = default_2p
+
+    return std, two_p
+
+
+def get_scoring_config(db: DBSession) -> ScoringTables:
+    """Return the scoring tables, reusing the cached copy when current."""
+    global _cache
+
+    version = get_data_version(db, SETTINGS_RESOURCE)
+    cached = _cache
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+
+    tables = _load_scoring_config(db)
+    if version is not None:
+        with _cache_lock:
+            _cache = (version, tables)
+    return tables
+
+
+def invalidate_scoring_cache() -> None:
+    """Drop this process's cached copy (other workers use the version)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def calculate_points(position: int, num_players: int, tables: ScoringTables) -> int:
+    std, two_p = tables
+    if num_players <= 2:
+        return two_p.get(position, two_p.get(2, 1))
+    return std.get(position, std.get(4, 1))
@@ -0,0 +1,79 @@
+"""Single-flight coalescing of identical concurrent reads.
+
+When several requests with the same key arrive while one is already being
+computed, they wait for that computation and share its result instead of
+repeating it. Keys include the data version(s) the result depends on, so a
+request that starts after a write never joins a computation that began
+before it. Nothing is kept once the computation finishes: this removes
+duplicate work during bursts and is not a cache.
+"""
+
+import threading
+from collections import Counter
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self._computed: Counter[str] = Counter()
+        self._coalesced: Counter[str] = Counter()
+
+    def run(self, name: str, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return ``fn()``, sharing one call among concurrent identical keys.
+
+        ``name`` labels the metrics (usually the endpoint). An exception
+        raised by ``fn`` is re-raised in every request that shared the call.
+        """
+        full_key = (name, key)
+        with self._lock:
+            flight = self._flights.get(full_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[full_key] = _Flight()
+                self._computed[name] += 1
+            else:
+                self._coalesced[name] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[full_key]
+            flight.done.set()
+        return flight.result
+
+    def metrics(self) -> dict[str, dict[str, int]]:
+        """``{name: {"computed": n, "coalesced": n}}`` since startup."""
+        with self._lock:
+            names = set(self._computed) | set(self._coalesced)
+            return {
+                name: {
+                    "computed": self._computed[name],
+                    "coalesced": self._coalesced[name],
+                }
+                for name in sorted(names)
+            }
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,174 @@
+"""Slow-query log with ``EXPLAIN QUERY PLAN`` capture.
+
+``install_slow_query_log`` (called by ``build_engine`` when
+``SLOW_QUERY_MS`` is set) times every statement on an engine. Statements
+slower than the threshold are logged with the shape of their parameters
+(types, never values), the route of the request that issued them, and
+their query plan. The plan comes from a read-only side connection, so the
+pooled connection running the statement is never disturbed; it is cached
+per statement text, so repeat offenders cost one ``EXPLAIN``. In-memory
+databases cannot be opened from a second connection and, like DDL and
+PRAGMAs, get no plan.
+
+The worst ``SLOW_QUERY_LOG_SIZE`` statements are kept for
+``GET /api/debug/slow-queries``.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import Engine, event
+
+from services.metrics import current_request_stats
+
+SLOW_QUERY_LOG_SIZE = int(os.getenv("SLOW_QUERY_LOG_SIZE", "50"))
+_PLAN_CACHE_SIZE = 256
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE", "WITH")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    statement: str
+    duration_ms: float
+    params_shape: str
+    route: str | None
+    plan: list[str] | None
+    recorded_at: datetime
+
+
+class SlowQueryLog:
+    """The ``size`` slowest statements seen, kept in a min-heap."""
+
+    def __init__(self, size: int = SLOW_QUERY_LOG_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._heap: list[tuple[float, int, SlowQuery]] = []
+        self._sequence = itertools.count()
+
+    def record(self, entry: SlowQuery) -> None:
+        item = (entry.duration_ms, next(self._sequence), entry)
+        with self._lock:
+            if len(self._heap) < self.size:
+                heapq.heappush(self._heap, item)
+            elif entry.duration_ms > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+
+    def entries(self) -> list[SlowQuery]:
+        """Slowest first."""
+        with self._lock:
+            items = sorted(self._heap, reverse=True)
+        return [entry for _, _, entry in items]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._heap.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+# Threshold per instrumented engine; also guards against double installs.
+_thresholds: "weakref.WeakKeyDictionary[Engine, float]" = weakref.WeakKeyDictionary()
+
+
+def params_shape(params, executemany: bool = False) -> str:
+    """Describe bound parameters by type only, e.g. ``(str, int)``."""
+    if executemany:
+        rows = list(params or ())
+        first = params_shape(rows[0]) if rows else "()"
+        return f"{len(rows)} x {first}"
+    if isinstance(params, dict):
+        inner = ", ".join(f"{key}: {type(v).__name__}" for key, v in params.items())
+        return "{" + inner + "}"
+    return "(" + ", ".join(type(value).__name__ for value in params or ()) + ")"
+
+
+class _Planner:
+    """``EXPLAIN QUERY PLAN`` on a side connection; successful plans are cached."""
+
+    def __init__(self, database: str | None):
+        self.database = database
+        self._lock = threading.Lock()
+        self._plans: dict[str, list[str] | None] = {}
+
+    def plan(self, statement: str, params) -> list[str] | None:
+        if not self.database or self.database == ":memory:":
+            return None
+        if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return None  # DDL and PRAGMAs have no query plan
+        with self._lock:
+            if statement in self._plans:
+                return self._plans[statement]
+        try:
+            side = sqlite3.connect(
+                f"file:{self.database}?mode=ro", uri=True, timeout=0.1
+            )
+            try:
+                rows = side.execute(f"EXPLAIN QUERY PLAN {statement}", params or ())
+                plan = [row[-1] for row in rows]
+            finally:
+                side.close()
+        except sqlite3.Error as exc:
+            # Often transient ("database is locked"); try again next time.
+            return [f"unavailable: {exc}"]
+        with self._lock:
+            if len(self._plans) >= _PLAN_CACHE_SIZE:
+                self._plans.clear()
+            self._plans[statement] = plan
+        return plan
+
+
+def install_slow_query_log(
+    engine: Engine, threshold_ms: float, log: SlowQueryLog = slow_query_log
+) -> None:
+    """Record ``engine``'s statements slower than ``threshold_ms`` in ``log``."""
+    if engine in _thresholds:
+        _thresholds[engine] = threshold_ms
+        return
+    _thresholds[engine] = threshold_ms
+    planner = _Planner(engine.url.database)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, params, context, executemany):
+        if context is not None:
+            context._slow_query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _check(conn, cursor, statement, params, context, executemany):
+        if context is None:
+            return
+        duration_ms = (time.perf_counter() - context._slow_query_started) * 1000
+        if duration_ms < _thresholds.get(engine, threshold_ms):
+            return
+        stats = current_request_stats()
+        first_params = next(iter(params), None) if executemany else params
+        entry = SlowQuery(
+            statement=statement,
+            duration_ms=round(duration_ms, 3),
+            params_shape=params_shape(params, executemany),
+            route=stats.route if stats is not None else None,
+            plan=planner.plan(statement, first_params),
+            recorded_at=datetime.now(timezone.utc),
+        )
+        log.record(entry)
+        logger.warning(
+            "slow query %.1f ms on %s params=%s plan=%s: %s",
+            entry.duration_ms,
+            entry.route or "(no request)",
+            entry.params_shape,
+            "; ".join(entry.plan or ()) or "-",
+            statement,
+        )
+
+
+def slow_query_threshold(engine: Engine) -> float | None:
+    return _thresholds.get(engine)
@@ -1,25 +1,57 @@
+from contextlib import contextmanager
+
 import pytest
-from sqlalchemy import StaticPool, create_engine
+from sqlalchemy import StaticPool, create_engine, event
 from sqlalchemy.orm import sessionmaker
 from starlette.testclient import TestClient
 
 from database.connection import Base, get_db
 from database.orm_models import *  # noqa: F401,F403 — ensure models registered
 from main import app
+from services.changes import track_changes
 
 
 @pytest.fixture()
-def client():
+def engine():
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
     Base.metadata.create_all(bind=engine)
-    TestSessionLocal = sessionmaker(bind=engine)
+    return engine
+
+
+@contextmanager
+def count_statements(engine):
+    """Collect the SQL statements ``engine`` executes inside the block."""
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
 
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture()
+def query_counter(engine):
+    """``with query_counter() as statements:`` counts the client's queries."""
+    return lambda: count_statements(engine)
+
+
+@pytest.fixture()
+def db_session_factory(engine):
+    return track_changes(sessionmaker(bind=engine))
+
+
+@pytest.fixture()
+def client(db_session_factory):
     def _override():
-        db = TestSessionLocal()
+        db = db_session_factory()
         try:
             yield db
         finally:
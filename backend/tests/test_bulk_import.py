@@ -0,0 +1,137 @@
+"""Tests for the set-based import engine behind POST /api/import."""
+
+import pytest
+
+from database.orm_models import Game, Penalty, Session, Team
+from models.schemas import ImportSession, ImportTeam
+from services.bulk_import import BulkImporter, ImportValidationError
+
+
+def _archive(sessions=3, games=4):
+    return {
+        "teams": [
+            {"id": "t1", "name": "Alpha", "players": ["A1", "A2"]},
+            {"id": "t2", "name": "Beta", "players": ["B1", "B2"]},
+        ],
+        "sessions": [
+            {
+                "id": f"s{i}",
+                "name": f"Round {i}",
+                "teamIds": ["t1", "t2"],
+                "status": "completed",
+                "games": [
+                    {
+                        "id": f"s{i}g{j}",
+                        "name": f"G{j}",
+                        "teamPlayerMap": {"t1": ["A1"], "t2": ["B1"]},
+                        "playerPlacements": {"t1::A1": 1, "t2::B1": 2},
+                        "points": {"t1": 4, "t2": 1},
+                    }
+                    for j in range(games)
+                ],
+                "penalties": [{"id": f"s{i}p", "teamId": "t2", "value": -1}],
+            }
+            for i in range(sessions)
+        ],
+    }
+
+
+def test_import_reports_counts_and_phase_timings(client):
+    resp = client.post("/api/import", json=_archive())
+    assert resp.status_code == 201
+    body = resp.json()
+    assert body["imported"] == {"teams": 2, "sessions": 3, "settings": 0}
+    assert {"teams", "sessions", "games", "penalties", "projections"} <= set(
+        body["timings_ms"]
+    )
+
+    leaderboard = client.get("/api/stats/leaderboard").json()
+    assert [(e["team_id"], e["total_points"], e["wins"]) for e in leaderboard] == [
+        ("t1", 48, 3),
+        ("t2", 9, 0),
+    ]
+
+
+def test_reimport_upserts_instead_of_duplicating(client):
+    client.post("/api/import", json=_archive())
+    archive = _archive()
+    archive["teams"][0]["name"] = "Alpha Renamed"
+    archive["sessions"][0]["games"][0]["points"] = {"t1": 10, "t2": 0}
+    assert client.post("/api/import", json=archive).status_code == 201
+
+    teams = client.get("/api/teams").json()
+    assert len(teams) == 2
+    assert {t["name"] for t in teams} == {"Alpha Renamed", "Beta"}
+    assert len(client.get("/api/sessions/s0").json()["games"]) == 4
+    scores = client.get("/api/sessions/s0/scores").json()
+    assert (scores[0]["team_id"], scores[0]["game_points"]) == ("t1", 22)
+
+
+def test_reimport_moves_games_and_penalties_between_sessions(client):
+    archive = _archive(sessions=2, games=1)
+    assert client.post("/api/import", json=archive).status_code == 201
+
+    # Move s0's game and penalty into s1.
+    s0, s1 = archive["sessions"]
+    s1["games"].append(s0["games"].pop())
+    s1["penalties"].append(s0["penalties"].pop())
+    resp = client.post("/api/import", json={"sessions": [s1]})
+    assert resp.status_code == 201
+
+    scores = {
+        sid: {e["team_id"]: e["total"] for e in client.get(
+            f"/api/sessions/{sid}/scores"
+        ).json()}
+        for sid in ("s0", "s1")
+    }
+    assert scores == {"s0": {"t1": 0, "t2": 0}, "s1": {"t1": 8, "t2": 0}}
+    leaderboard = client.get("/api/stats/leaderboard").json()
+    assert [(e["team_id"], e["total_points"]) for e in leaderboard] == [
+        ("t1", 8),
+        ("t2", 0),
+    ]
+
+
+def test_import_is_all_or_nothing(client):
+    archive = _archive()
+    archive["sessions"][-1]["teamIds"] = ["t1", "ghost"]
+    resp = client.post("/api/import", json=archive)
+    assert resp.status_code == 422
+    assert "ghost" in resp.json()["detail"]
+
+    assert client.get("/api/teams").json() == []
+    assert client.get("/api/sessions").json() == []
+
+
+def test_importer_writes_in_batches(db_session_factory):
+    archive = _archive(sessions=7, games=3)
+    db = db_session_factory()
+    importer = BulkImporter(db, batch_size=5)
+    importer.add_teams(ImportTeam(**t) for t in archive["teams"])
+    importer.add_sessions(ImportSession(**s) for s in archive["sessions"])
+    importer.finish()
+    db.commit()
+
+    assert db.query(Team).count() == 2
+    assert db.query(Session).count() == 7
+    assert db.query(Game).count() == 21
+    assert db.query(Penalty).count() == 7
+    db.close()
+
+
+def test_importer_validates_against_existing_teams(db_session_factory):
+    db = db_session_factory()
+    db.add(Team(id="existing", name="Existing"))
+    db.commit()
+
+    importer = BulkImporter(db)
+    importer.add_session(ImportSession(name="R", teamIds=["existing"]))
+    with pytest.raises(ImportValidationError, match="not in session"):
+        importer.add_session(
+            ImportSession(
+                name="R",
+                teamIds=["existing"],
+                games=[{"name": "G", "teamPlayerMap": {"other": ["X"]}}],
+            )
+        )
+    db.close()
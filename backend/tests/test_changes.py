@@ -0,0 +1,158 @@
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+from database.orm_models import Team
+from services.changes import backfill_change_versions
+from services.jobs import job_runner
+
+
+@pytest.fixture()
+def league(client):
+    client.post("/api/import", json={"teams": [
+        {"id": "t1", "name": "Alpha", "players": ["A"]},
+        {"id": "t2", "name": "Beta", "players": ["B"]},
+    ]})
+    sid = client.post(
+        "/api/sessions", json={"name": "R1", "team_ids": ["t1", "t2"]}
+    ).json()["id"]
+    game = client.post(f"/api/sessions/{sid}/games", json={
+        "name": "G1",
+        "player_placements": {"A": 1, "B": 2},
+        "team_player_map": {"t1": ["A"], "t2": ["B"]},
+    }).json()
+    penalty = client.post(
+        f"/api/sessions/{sid}/penalties", json={"team_id": "t2", "value": -1}
+    ).json()
+    return {"session": sid, "game": game["id"], "penalty": penalty["id"]}
+
+
+def _changes(client, since=0, limit=500):
+    resp = client.get("/api/changes", params={"since": since, "limit": limit})
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def test_changes_since_zero_returns_every_row(client, league):
+    feed = _changes(client)
+    versions = [c["version"] for c in feed["changes"]]
+    assert versions == sorted(set(versions))
+    assert feed["cursor"] == versions[-1]
+    assert not feed["has_more"]
+
+    upserts = {(c["resource"], c["id"]) for c in feed["changes"]}
+    assert {
+        ("team", "t1"),
+        ("team", "t2"),
+        ("session", league["session"]),
+        ("game", league["game"]),
+        ("penalty", league["penalty"]),
+    } <= upserts
+    game = next(c for c in feed["changes"] if c["resource"] == "game")
+    assert game["data"]["sessionId"] == league["session"]
+
+
+def test_changes_after_cursor_only_include_new_writes(client, league):
+    cursor = _changes(client)["cursor"]
+    assert _changes(client, cursor) == {
+        "changes": [], "cursor": cursor, "has_more": False
+    }
+
+    client.put("/api/teams/t1", json={"name": "Alpha Prime", "players": ["A"]})
+    client.put("/api/settings", json={"league_name": "Delta League"})
+
+    feed = _changes(client, cursor)
+    assert [(c["resource"], c["id"], c["op"]) for c in feed["changes"]] == [
+        ("team", "t1", "upsert"),
+        ("setting", "league_name", "upsert"),
+    ]
+    assert feed["changes"][0]["data"]["name"] == "Alpha Prime"
+    assert feed["changes"][1]["data"]["value"] == "Delta League"
+
+
+def test_deleting_a_session_records_tombstones(client, league):
+    cursor = _changes(client)["cursor"]
+    client.delete(f"/api/sessions/{league['session']}")
+
+    deletes = {
+        (c["resource"], c["id"])
+        for c in _changes(client, cursor)["changes"]
+        if c["op"] == "delete"
+    }
+    assert deletes == {
+        ("session", league["session"]),
+        ("game", league["game"]),
+        ("penalty", league["penalty"]),
+    }
+
+
+def test_changes_page_without_gaps_or_duplicates(client, league):
+    everything = _changes(client)["changes"]
+
+    paged, since = [], 0
+    while True:
+        feed = _changes(client, since, limit=2)
+        assert len(feed["changes"]) <= 2
+        paged.extend(feed["changes"])
+        since = feed["cursor"]
+        if not feed["has_more"]:
+            break
+    assert paged == everything
+
+
+def test_reset_and_bulk_import_are_tracked(client, league):
+    cursor = _changes(client)["cursor"]
+    client.request("DELETE", "/api/data/reset", json={"sessions": True})
+    feed = _changes(client, cursor)
+    assert [(c["resource"], c["op"]) for c in feed["changes"]] == [
+        ("session", "reset"),
+        ("game", "reset"),
+        ("penalty", "reset"),
+    ]
+
+    client.post("/api/import", json={"sessions": [
+        {"id": "s9", "name": "Imported", "teamIds": ["t1"], "games": [{"name": "G"}]}
+    ]})
+    feed = _changes(client, feed["cursor"])
+    assert [c["resource"] for c in feed["changes"]] == ["session", "game"]
+
+
+def test_backfill_stamps_untracked_rows(db_session_factory):
+    db = db_session_factory()
+    db.add_all([Team(id="a", name="A"), Team(id="b", name="B")])
+    db.commit()
+    db.execute(update(Team).values(change_version=None))
+    db.commit()
+
+    assert backfill_change_versions(db) == 2
+    db.commit()
+    versions = [v for (v,) in db.query(Team.change_version)]
+    assert None not in versions
+    assert len(set(versions)) == 2
+    db.close()
+
+
+def test_only_tracked_session_factories_stamp_changes(engine, db_session_factory):
+    tracked = db_session_factory()
+    tracked.add(Team(id="a", name="A"))
+    tracked.commit()
+    assert tracked.get(Team, "a").change_version is not None
+    tracked.close()
+
+    untracked = sessionmaker(bind=engine)()
+    untracked.add(Team(id="b", name="B"))
+    untracked.commit()
+    assert untracked.get(Team, "b").change_version is None
+    untracked.close()
+
+
+def test_background_job_sessions_stamp_changes(db_session_factory):
+    def add_team(db, context):
+        db.add(Team(id="job", name="Job"))
+
+    db = db_session_factory()
+    job = job_runner.submit(db, "add-team", add_team)
+    job_runner.wait(job.id, timeout=5)
+    db.expire_all()
+    assert db.get(Team, "job").change_version is not None
+    db.close()
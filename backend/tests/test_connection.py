@@ -0,0 +1,40 @@
+"""Tests for the SQLite engine tuning profiles."""
+
+import pytest
+from sqlalchemy import text
+
+from database.connection import build_engine
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_production_profile_applies_pragmas(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'prod.db'}", "production")
+    assert _pragma(engine, "journal_mode") == "wal"
+    assert _pragma(engine, "synchronous") == 1  # NORMAL
+    assert _pragma(engine, "busy_timeout") == 5000
+    assert _pragma(engine, "cache_size") == -64000
+    assert _pragma(engine, "temp_store") == 2  # MEMORY
+    assert engine.pool.size() == 10
+    engine.dispose()
+
+
+def test_legacy_profile_keeps_sqlite_defaults(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'legacy.db'}", "legacy")
+    assert _pragma(engine, "journal_mode") == "delete"
+    engine.dispose()
+
+
+def test_pragma_env_override(tmp_path, monkeypatch):
+    monkeypatch.setenv("SQLITE_PRAGMA_BUSY_TIMEOUT", "12345")
+    engine = build_engine(f"sqlite:///{tmp_path / 'override.db'}", "production")
+    assert _pragma(engine, "busy_timeout") == 12345
+    engine.dispose()
+
+
+def test_unknown_profile_rejected():
+    with pytest.raises(ValueError):
+        build_engine("sqlite:///:memory:", "turbo")
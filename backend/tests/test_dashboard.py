@@ -0,0 +1,113 @@
+import pytest
+
+
+@pytest.fixture()
+def league(client):
+    client.post("/api/import", json={"teams": [
+        {"id": "t1", "name": "Alpha", "players": ["Alice", "Bob"]},
+        {"id": "t2", "name": "Beta", "players": ["Carol", "Dave"]},
+    ]})
+    game = {
+        "name": "G1",
+        "player_placements": {"Alice": 1, "Bob": 2, "Carol": 3, "Dave": 4},
+        "team_player_map": {"t1": ["Alice", "Bob"], "t2": ["Carol", "Dave"]},
+    }
+    done = client.post(
+        "/api/sessions", json={"name": "Night 1", "team_ids": ["t1", "t2"]}
+    ).json()["id"]
+    client.post(f"/api/sessions/{done}/games", json=game)
+    client.post(f"/api/sessions/{done}/penalties", json={"team_id": "t1", "value": -2})
+    client.put(f"/api/sessions/{done}", json={"status": "completed"})
+
+    active = client.post(
+        "/api/sessions", json={"name": "Night 2", "team_ids": ["t1", "t2"]}
+    ).json()["id"]
+    client.post(f"/api/sessions/{active}/games", json=game)
+    client.post(f"/api/sessions/{active}/games", json=game)
+    return done, active
+
+
+def test_dashboard_empty(client):
+    resp = client.get("/api/dashboard")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["team_count"] == 0
+    assert data["session_counts"] == {"total": 0, "active": 0, "completed": 0}
+    assert data["total_games"] == 0
+    assert data["leaderboard"] == []
+    assert data["recent_sessions"] == []
+
+
+def test_dashboard_aggregates(client, league):
+    done, active = league
+    data = client.get("/api/dashboard").json()
+    assert data["team_count"] == 2
+    assert data["session_counts"] == {"total": 2, "active": 1, "completed": 1}
+    assert data["total_games"] == 3
+    # Completed session: t1 = 7 - 2, t2 = 3
+    assert data["completed_points"] == 8
+    assert data["leaderboard"][0]["team_id"] == "t1"
+
+    recent = {s["id"]: s for s in data["recent_sessions"]}
+    assert recent[done]["number"] == 1
+    assert recent[done]["winner_team_id"] == "t1"
+    assert recent[done]["game_points"] == 10
+    assert recent[done]["penalty_points"] == -2
+    assert recent[active]["number"] == 2
+    assert recent[active]["games"] == 2
+    assert recent[active]["scores"][0]["total"] == 14
+
+
+def test_dashboard_recent_filter_keeps_numbering(client, league):
+    done, _ = league
+    data = client.get("/api/dashboard?recent_status=completed").json()
+    assert [s["id"] for s in data["recent_sessions"]] == [done]
+    assert data["recent_sessions"][0]["number"] == 1
+    assert data["recent_matching"] == 1
+
+
+def test_history_includes_details_and_scores(client, league):
+    done, _ = league
+    data = client.get("/api/dashboard/history").json()
+    assert [s["id"] for s in data] == [done]
+    assert len(data[0]["games"]) == 1
+    assert len(data[0]["penalties"]) == 1
+    assert data[0]["scores"][0] == {
+        "team_id": "t1",
+        "game_points": 7,
+        "penalty_points": -2,
+        "total": 5,
+        "games_played": 1,
+    }
+
+
+def test_history_pages_newest_first(client, league):
+    done, active = league
+    client.put(f"/api/sessions/{active}", json={"status": "completed"})
+    for name in ("Night 3", "Night 4", "Night 5"):
+        sid = client.post(
+            "/api/sessions", json={"name": name, "team_ids": ["t1", "t2"]}
+        ).json()["id"]
+        client.put(f"/api/sessions/{sid}", json={"status": "completed"})
+    newest_first = [
+        s["id"] for s in sorted(
+            client.get("/api/sessions", params={"status": "completed"}).json(),
+            key=lambda s: (s["date"], s["id"]),
+            reverse=True,
+        )
+    ]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        resp = client.get("/api/dashboard/history", params=params)
+        assert resp.status_code == 200
+        seen.extend(s["id"] for s in resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == newest_first
+    assert len(seen) == 5
+
+    resp = client.get("/api/dashboard/history", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 422
@@ -0,0 +1,90 @@
+"""Tests for the normalized game_results / game_player_results tables."""
+
+import pytest
+
+from database.orm_models import GamePlayerResult, GameResult
+
+
+@pytest.fixture()
+def session_id(client):
+    client.post("/api/import", json={"teams": [
+        {"id": "t1", "name": "Team 1", "players": ["Alex", "Sam"]},
+        {"id": "t2", "name": "Team 2", "players": ["Alex", "Pat"]},
+    ]})
+    resp = client.post("/api/sessions", json={"name": "R1", "team_ids": ["t1", "t2"]})
+    return resp.json()["id"]
+
+
+GAME_BODY = {
+    "name": "Game",
+    "player_placements": {"t1::Alex": 1, "t2::Alex": 2, "t1::Sam": 3, "Pat": 4},
+    "team_player_map": {"t1": ["Alex", "Sam"], "t2": ["Alex", "Pat"]},
+}
+
+
+def test_add_game_writes_result_rows(client, db_session_factory, session_id):
+    game = client.post(f"/api/sessions/{session_id}/games", json=GAME_BODY).json()
+
+    db = db_session_factory()
+    teams = {
+        r.team_id: (r.points, r.placement)
+        for r in db.query(GameResult).filter(GameResult.game_id == game["id"])
+    }
+    players = {
+        r.player_key: (r.team_id, r.player_name, r.placement, r.points)
+        for r in db.query(GamePlayerResult).filter(
+            GamePlayerResult.game_id == game["id"]
+        )
+    }
+    db.close()
+
+    assert teams == {"t1": (6, 1), "t2": (4, 2)}
+    assert players["t2::Alex"] == ("t2", "Alex", 2, 3)
+    # Legacy plain-name keys resolve their team through team_player_map.
+    assert players["Pat"] == ("t2", "Pat", 4, 1)
+
+
+def test_remove_game_deletes_result_rows(client, db_session_factory, session_id):
+    game = client.post(f"/api/sessions/{session_id}/games", json=GAME_BODY).json()
+    client.delete(f"/api/sessions/{session_id}/games/{game['id']}")
+
+    db = db_session_factory()
+    assert db.query(GameResult).count() == 0
+    assert db.query(GamePlayerResult).count() == 0
+    db.close()
+
+
+def test_import_and_rebuild_populate_result_rows(client, db_session_factory):
+    client.post("/api/import", json={
+        "teams": [{"id": "a", "name": "A"}, {"id": "b", "name": "B"}],
+        "sessions": [{
+            "id": "s1",
+            "name": "Imported",
+            "teamIds": ["a", "b"],
+            "games": [{
+                "id": "g1",
+                "name": "G1",
+                "playerPlacements": {"X": 1, "Y": 2},
+                "playerPoints": {"X": 4, "Y": 1},
+                "teamPlayerMap": {"a": ["X"], "b": ["Y"]},
+                "points": {"a": 4, "b": 1},
+                "placements": {"a": 1, "b": 2},
+            }],
+        }],
+    })
+    db = db_session_factory()
+    assert db.query(GameResult).count() == 2
+    assert db.query(GamePlayerResult).count() == 2
+    db.close()
+
+    before = client.get("/api/sessions/s1/scores").json()
+    rebuilt = client.post("/api/stats/rebuild").json()["rebuilt"]
+    assert rebuilt["game_results"] == 1
+    assert client.get("/api/sessions/s1/scores").json() == before
+    assert before[0] == {
+        "team_id": "a",
+        "game_points": 4,
+        "penalty_points": 0,
+        "total": 4,
+        "games_played": 1,
+    }
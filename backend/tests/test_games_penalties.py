@@ -216,3 +216,35 @@ def test_session_scores_empty(client, session_id):
     assert resp.status_code == 200
     scores = resp.json()
     assert all(s["total"] == 0 for s in scores)
+
+
+def test_session_scores_track_removals(client, session_id):
+    game = client.post(f"/api/sessions/{session_id}/games", json=GAME_BODY).json()
+    client.post(f"/api/sessions/{session_id}/games", json=GAME_BODY)
+    penalty = client.post(
+        f"/api/sessions/{session_id}/penalties",
+        json={"team_id": "t2", "value": -1},
+    ).json()
+
+    scores = client.get(f"/api/sessions/{session_id}/scores").json()
+    t1 = next(s for s in scores if s["team_id"] == "t1")
+    t2 = next(s for s in scores if s["team_id"] == "t2")
+    assert (t1["game_points"], t1["games_played"]) == (14, 2)
+    assert (t2["penalty_points"], t2["total"]) == (-1, 5)
+
+    client.delete(f"/api/sessions/{session_id}/games/{game['id']}")
+    client.delete(f"/api/sessions/{session_id}/penalties/{penalty['id']}")
+    scores = client.get(f"/api/sessions/{session_id}/scores").json()
+    assert scores[0] == {
+        "team_id": "t1",
+        "game_points": 7,
+        "penalty_points": 0,
+        "total": 7,
+        "games_played": 1,
+    }
+    assert next(s for s in scores if s["team_id"] == "t2")["total"] == 3
+
+
+def test_session_scores_ties_keep_session_order(client, session_id):
+    scores = client.get(f"/api/sessions/{session_id}/scores").json()
+    assert [s["team_id"] for s in scores] == ["t1", "t2"]
@@ -0,0 +1,90 @@
+"""Conditional GETs: ETag / Last-Modified from per-resource data versions."""
+
+import pytest
+from sqlalchemy import event
+
+
+@pytest.fixture()
+def teams(client):
+    client.post("/api/import", json={"teams": [
+        {"id": "t1", "name": "Alpha", "players": ["A"]},
+        {"id": "t2", "name": "Beta", "players": ["B"]},
+    ]})
+    return ["t1", "t2"]
+
+
+def test_unwritten_resource_has_no_validators(client):
+    resp = client.get("/api/teams")
+    assert resp.status_code == 200
+    assert "etag" not in resp.headers
+
+
+def test_matching_etag_returns_304_after_one_lookup(client, engine, teams):
+    first = client.get("/api/teams")
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"].endswith("GMT")
+    assert first.headers["cache-control"] == "no-cache"
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        resp = client.get("/api/teams", headers={"If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+    assert len(statements) == 1
+    assert "data_versions" in statements[0]
+
+
+def test_write_changes_etag(client, teams):
+    etag = client.get("/api/teams").headers["etag"]
+    client.put("/api/teams/t1", json={"name": "Alpha 2", "players": ["A"]})
+
+    resp = client.get("/api/teams", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+    assert {t["name"] for t in resp.json()} == {"Alpha 2", "Beta"}
+
+
+def test_query_string_is_part_of_the_etag(client, teams):
+    plain = client.get("/api/teams").headers["etag"]
+    projected = client.get("/api/teams", params={"fields": "name"})
+    assert projected.headers["etag"] != plain
+
+    resp = client.get(
+        "/api/teams", params={"fields": "name"}, headers={"If-None-Match": plain}
+    )
+    assert resp.status_code == 200
+
+
+def test_sessions_and_leaderboard_follow_score_writes(client, teams):
+    sid = client.post(
+        "/api/sessions", json={"name": "R1", "team_ids": teams}
+    ).json()["id"]
+    penalty = {"team_id": "t1", "value": -1}
+    client.post(f"/api/sessions/{sid}/penalties", json=penalty)
+    sessions_etag = client.get("/api/sessions").headers["etag"]
+    board_etag = client.get("/api/stats/leaderboard").headers["etag"]
+
+    client.post(f"/api/sessions/{sid}/penalties", json=penalty)
+    sessions = client.get("/api/sessions", headers={"If-None-Match": sessions_etag})
+    board = client.get("/api/stats/leaderboard", headers={"If-None-Match": board_etag})
+    assert sessions.status_code == 304
+    assert board.status_code == 200
+
+    client.put(f"/api/sessions/{sid}", json={"status": "completed"})
+    sessions = client.get("/api/sessions", headers={"If-None-Match": sessions_etag})
+    assert sessions.status_code == 200
+
+
+def test_settings_etag_and_weak_or_listed_validators(client):
+    client.put("/api/settings", json={"league_name": "Cached League"})
+    etag = client.get("/api/settings").headers["etag"]
+
+    for header in (f"W/{etag}", f'"other", {etag}', "*"):
+        resp = client.get("/api/settings", headers={"If-None-Match": header})
+        assert resp.status_code == 304, header
@@ -0,0 +1,169 @@
+import threading
+
+import pytest
+
+from database.connection import Base, build_engine
+from database.orm_models import Job, Team
+from routers import data, stats
+from services.jobs import fail_interrupted_jobs, job_runner
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    # Jobs run on pool threads with their own connections; the shared
+    # in-memory StaticPool connection would interleave their transactions.
+    engine = build_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+ARCHIVE = {
+    "teams": [{"id": "t1", "name": "Alpha"}, {"id": "t2", "name": "Beta"}],
+    "sessions": [
+        {
+            "id": f"s{i}",
+            "name": f"Round {i}",
+            "teamIds": ["t1", "t2"],
+            "status": "completed",
+            "games": [{"name": "G1", "points": {"t1": 4, "t2": 1}}],
+        }
+        for i in range(3)
+    ],
+}
+
+
+def _run_to_completion(client, resp):
+    assert resp.status_code == 202
+    job = resp.json()
+    assert resp.headers["Location"] == f"/api/jobs/{job['id']}"
+    job_runner.wait(job["id"], timeout=10)
+    return client.get(f"/api/jobs/{job['id']}").json()
+
+
+def test_background_import_job(client):
+    resp = client.post("/api/import", params={"background": True}, json=ARCHIVE)
+    job = _run_to_completion(client, resp)
+
+    assert job["kind"] == "import"
+    assert job["status"] == "succeeded"
+    assert (job["progress"], job["total"]) == (3, 3)
+    assert job["result"]["imported"]["sessions"] == 3
+    assert {"queued", "run", "projections"} <= set(job["timings_ms"])
+    assert job["finished_at"] is not None
+    assert len(client.get("/api/sessions").json()) == 3
+
+
+def test_background_import_failure_rolls_back(client):
+    archive = {**ARCHIVE, "teams": ARCHIVE["teams"][:1]}
+    resp = client.post("/api/import", params={"background": True}, json=archive)
+    job = _run_to_completion(client, resp)
+
+    assert job["status"] == "failed"
+    assert job["error"] == "Unknown team_ids: t2"
+    assert client.get("/api/teams").json() == []
+
+
+def test_background_reset_and_rebuild_jobs(client):
+    client.post("/api/import", json=ARCHIVE)
+
+    resp = client.post("/api/stats/rebuild", params={"background": True})
+    job = _run_to_completion(client, resp)
+    assert job["result"]["rebuilt"]["session_team_totals"] == 3
+
+    resp = client.request(
+        "DELETE",
+        "/api/data/reset",
+        params={"background": True},
+        json={"sessions": True},
+    )
+    assert _run_to_completion(client, resp)["status"] == "succeeded"
+    assert client.get("/api/sessions").json() == []
+
+    listed = client.get("/api/jobs").json()
+    assert [j["kind"] for j in listed] == ["reset", "rebuild"]
+
+
+def test_cancel_running_job_rolls_back(client, db_session_factory):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_job(db, context):
+        db.add(Team(id="temp", name="Temp"))
+        db.flush()
+        started.set()
+        release.wait(5)
+        context.check_cancelled()
+        return {"done": True}
+
+    db = db_session_factory()
+    job = job_runner.submit(db, "slow", slow_job)
+    db.close()
+    assert started.wait(5)
+
+    resp = client.post(f"/api/jobs/{job.id}/cancel")
+    assert resp.status_code == 202
+    release.set()
+    job_runner.wait(job.id, timeout=5)
+
+    body = client.get(f"/api/jobs/{job.id}").json()
+    assert body["status"] == "cancelled"
+    assert body["result"] is None
+    assert client.get("/api/teams").json() == []
+    assert client.post(f"/api/jobs/{job.id}/cancel").status_code == 409
+
+
+@pytest.mark.parametrize(
+    ("module", "name", "method", "url", "body"),
+    [
+        (stats, "rebuild_all", "POST", "/api/stats/rebuild", None),
+        (data, "record_resets", "DELETE", "/api/data/reset", {"sessions": True}),
+    ],
+    ids=["rebuild", "reset"],
+)
+def test_cancel_rebuild_and_reset_jobs(
+    client, monkeypatch, module, name, method, url, body
+):
+    client.post("/api/import", json=ARCHIVE)
+    started, release = threading.Event(), threading.Event()
+    original = getattr(module, name)
+
+    def blocking(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, blocking)
+    resp = client.request(method, url, params={"background": True}, json=body)
+    job_id = resp.json()["id"]
+    assert started.wait(5)
+    assert client.post(f"/api/jobs/{job_id}/cancel").status_code == 202
+    release.set()
+    job_runner.wait(job_id, timeout=5)
+
+    assert client.get(f"/api/jobs/{job_id}").json()["status"] == "cancelled"
+    assert len(client.get("/api/sessions").json()) == 3
+
+
+def test_job_not_found(client):
+    assert client.get("/api/jobs/missing").status_code == 404
+    assert client.post("/api/jobs/missing/cancel").status_code == 404
+
+
+def test_job_queue_full(client, monkeypatch):
+    monkeypatch.setattr(job_runner, "max_pending", 0)
+    resp = client.post("/api/stats/rebuild", params={"background": True})
+    assert resp.status_code == 503
+
+
+def test_fail_interrupted_jobs(db_session_factory):
+    db = db_session_factory()
+    db.add_all([
+        Job(id="a", kind="import", status="running"),
+        Job(id="b", kind="import", status="succeeded"),
+    ])
+    db.commit()
+
+    assert fail_interrupted_jobs(db) == 1
+    assert db.get(Job, "a").status == "failed"
+    assert db.get(Job, "b").status == "succeeded"
+    db.close()
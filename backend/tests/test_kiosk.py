@@ -0,0 +1,105 @@
+import pytest
+from sqlalchemy import event
+
+
+@pytest.fixture()
+def live_session(client):
+    client.post("/api/import", json={"teams": [
+        {"id": "t1", "name": "Alpha", "players": ["A"], "tag": "ALP"},
+        {"id": "t2", "name": "Beta", "players": ["B"]},
+    ]})
+    return client.post(
+        "/api/sessions", json={"name": "Live", "team_ids": ["t1", "t2"]}
+    ).json()["id"]
+
+
+GAME = {
+    "name": "G1",
+    "player_placements": {"A": 1, "B": 2},
+    "team_player_map": {"t1": ["A"], "t2": ["B"]},
+}
+
+
+def _scoreboard(client, **headers):
+    return client.get("/api/kiosk/scoreboard", headers=headers)
+
+
+def test_scoreboard_matches_scores_and_leaderboard(client, live_session):
+    client.post(f"/api/sessions/{live_session}/games", json=GAME)
+    resp = _scoreboard(client)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+
+    board = resp.json()
+    assert board["teams"]["t1"]["tag"] == "ALP"
+    assert board["leaderboard"] == client.get("/api/stats/leaderboard").json()
+    [active] = board["active_sessions"]
+    assert active["id"] == live_session
+    assert active["games"] == 1
+    scores = client.get(f"/api/sessions/{live_session}/scores").json()
+    assert active["scores"] == scores
+
+
+def test_game_count_covers_games_of_disjoint_teams(client):
+    client.post("/api/import", json={"teams": [
+        {"id": f"t{i}", "name": f"Team {i}", "players": [f"P{i}"]}
+        for i in range(1, 5)
+    ]})
+    session_id = client.post(
+        "/api/sessions", json={"name": "Four", "team_ids": ["t1", "t2", "t3", "t4"]}
+    ).json()["id"]
+    # Each game involves only two of the four teams.
+    for a, b in ((1, 2), (3, 4)):
+        client.post(f"/api/sessions/{session_id}/games", json={
+            "name": f"t{a} vs t{b}",
+            "player_placements": {f"P{a}": 1, f"P{b}": 2},
+            "team_player_map": {f"t{a}": [f"P{a}"], f"t{b}": [f"P{b}"]},
+        })
+
+    [active] = _scoreboard(client).json()["active_sessions"]
+    session = client.get(f"/api/sessions/{session_id}").json()
+    assert active["games"] == len(session["games"]) == 2
+
+
+def test_reads_are_served_without_queries(client, engine, live_session):
+    client.post(f"/api/sessions/{live_session}/games", json=GAME)
+    first = _scoreboard(client)
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        again = _scoreboard(client)
+        cached = _scoreboard(client, **{"If-None-Match": first.headers["etag"]})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert again.content == first.content
+    assert cached.status_code == 304
+    assert statements == []
+
+
+def test_game_and_penalty_writes_regenerate_snapshot(client, live_session):
+    etag = _scoreboard(client).headers["etag"]
+    game = client.post(f"/api/sessions/{live_session}/games", json=GAME).json()
+    after_game = _scoreboard(client, **{"If-None-Match": etag})
+    assert after_game.status_code == 200
+    assert after_game.json()["active_sessions"][0]["games"] == 1
+
+    client.post(
+        f"/api/sessions/{live_session}/penalties", json={"team_id": "t2", "value": -2}
+    )
+    scores = _scoreboard(client).json()["active_sessions"][0]["scores"]
+    assert {s["team_id"]: s["penalty_points"] for s in scores}["t2"] == -2
+
+    client.delete(f"/api/sessions/{live_session}/games/{game['id']}")
+    assert _scoreboard(client).json()["active_sessions"][0]["games"] == 0
+
+
+def test_other_writes_invalidate_snapshot(client, live_session):
+    assert len(_scoreboard(client).json()["active_sessions"]) == 1
+    client.put(f"/api/sessions/{live_session}", json={"status": "completed"})
+    assert _scoreboard(client).json()["active_sessions"] == []
+
+    client.put("/api/teams/t2", json={"name": "Beta 2", "players": ["B"]})
+    assert _scoreboard(client).json()["teams"]["t2"]["name"] == "Beta 2"
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from main import app
+from services.live_events import LiveEventBroker, live_events
+
+
+@pytest.fixture()
+def session_id(client):
+    client.post("/api/import", json={"teams": [
+        {"id": "t1", "name": "Alpha", "players": ["A"]},
+        {"id": "t2", "name": "Beta", "players": ["B"]},
+    ]})
+    return client.post(
+        "/api/sessions", json={"name": "Live", "team_ids": ["t1", "t2"]}
+    ).json()["id"]
+
+
+async def _stream_until(session_id: str, write, stop_marker: bytes) -> bytes:
+    """Open the event stream, run ``write`` once subscribed, read to the marker."""
+    body = bytearray()
+    subscribed, done = asyncio.Event(), asyncio.Event()
+
+    async def receive():
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] != "http.response.body":
+            return
+        body.extend(message.get("body", b""))
+        if b"event: ready" in body:
+            subscribed.set()
+        if stop_marker in body:
+            done.set()
+
+    path = f"/api/sessions/{session_id}/events"
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    stream = asyncio.create_task(app(scope, receive, send))
+    await asyncio.wait_for(subscribed.wait(), 5)
+    await asyncio.to_thread(write)
+    await asyncio.wait_for(stream, 5)
+    return bytes(body)
+
+
+def test_writes_are_pushed_to_session_subscribers(client, session_id):
+    def write():
+        client.post(f"/api/sessions/{session_id}/games", json={
+            "name": "G1",
+            "player_placements": {"A": 1, "B": 2},
+            "team_player_map": {"t1": ["A"], "t2": ["B"]},
+        })
+        client.post(
+            f"/api/sessions/{session_id}/penalties",
+            json={"team_id": "t2", "value": -1},
+        )
+        client.put(f"/api/sessions/{session_id}", json={"status": "completed"})
+
+    body = asyncio.run(_stream_until(session_id, write, b"session.updated"))
+
+    events = [
+        line.removeprefix(b"event: ").decode()
+        for line in body.splitlines()
+        if line.startswith(b"event: ")
+    ]
+    assert events == ["ready", "game.added", "penalty.added", "session.updated"]
+    assert b'"status": "completed"' in body
+    assert live_events.subscriber_count(session_id) == 0
+
+
+def test_events_for_unknown_session_404(client):
+    assert client.get("/api/sessions/missing/events").status_code == 404
+
+
+def test_slow_subscriber_is_dropped():
+    async def scenario():
+        broker = LiveEventBroker(queue_size=2)
+        slow = broker.subscribe("s1")
+        for n in range(3):
+            assert broker.publish("s1", "game.added", {"n": n}) == 1
+        await asyncio.sleep(0)
+        return slow
+
+    slow = asyncio.run(scenario())
+    assert slow.dropped
+    assert slow.queue.qsize() == 1
+    assert slow.queue.get_nowait() is None
+
+
+def test_publish_without_subscribers_is_a_no_op():
+    assert LiveEventBroker().publish("nobody", "game.added", {}) == 0
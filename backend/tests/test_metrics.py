@@ -0,0 +1,56 @@
+import re
+
+import pytest
+
+from services.metrics import instrument_engine, metrics_registry
+
+
+@pytest.fixture(autouse=True)
+def instrumented(engine):
+    instrument_engine(engine)
+    metrics_registry.reset()
+
+
+def _server_timing(resp) -> tuple[float, int, float]:
+    match = re.fullmatch(
+        r'db;dur=([\d.]+);desc="(\d+) queries", app;dur=([\d.]+)',
+        resp.headers["server-timing"],
+    )
+    assert match, resp.headers["server-timing"]
+    return float(match[1]), int(match[2]), float(match[3])
+
+
+def test_server_timing_counts_request_queries(client):
+    client.post("/api/import", json={"teams": [{"id": "t1", "name": "Alpha"}]})
+
+    db_ms, queries, app_ms = _server_timing(client.get("/api/teams"))
+    assert queries == 2  # data version + teams
+    assert 0 <= db_ms <= app_ms
+
+    _, queries, _ = _server_timing(client.get("/api/metrics"))
+    assert queries == 0
+
+
+def test_metrics_aggregate_by_route_template(client):
+    client.get("/api/sessions/missing")
+    client.get("/api/sessions/other")
+    client.get("/api/teams")
+
+    body = client.get("/api/metrics").text
+    route = 'method="GET",route="/api/sessions/{session_id}"'
+    assert f'tournament_http_requests_total{{{route},status="404"}} 2' in body
+    assert f'tournament_http_request_duration_seconds_count{{{route}}} 2' in body
+    inf_bucket = f'{{{route},le="+Inf"}}'
+    assert f"tournament_http_request_duration_seconds_bucket{inf_bucket} 2" in body
+    assert f'tournament_http_request_db_queries_total{{{route}}} 2' in body
+    assert "/api/sessions/missing" not in body
+
+
+def test_metrics_histogram_is_cumulative(client):
+    for _ in range(3):
+        client.get("/api/teams")
+    body = client.get("/api/metrics").text
+    bucket = r'duration_seconds_bucket\{method="GET",route="/api/teams",le="[^"]+"\}'
+    counts = [int(value) for value in re.findall(bucket + r" (\d+)", body)]
+    assert counts == sorted(counts)
+    assert counts[-1] == 3
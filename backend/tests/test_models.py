@@ -65,3 +65,99 @@ def test_cascade_delete_session():
 
     assert db.query(Game).count() == 0
     assert db.query(Penalty).count() == 0
+
+
+# --- Query plans ---
+
+
+def _query_plan(db, query) -> str:
+    from sqlalchemy import text
+
+    compiled = query.statement.compile(
+        db.get_bind(), compile_kwargs={"literal_binds": True}
+    )
+    rows = db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return " | ".join(row[-1] for row in rows)
+
+
+def test_session_status_filter_uses_index():
+    db = _make_session()
+    plan = _query_plan(db, db.query(Session).filter(Session.status == "active"))
+    assert "USING INDEX ix_sessions_status" in plan
+
+
+def test_session_date_ordering_uses_index():
+    db = _make_session()
+    plan = _query_plan(db, db.query(Session).order_by(Session.date))
+    assert "ix_sessions_date" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_session_keyset_pages_need_no_sort():
+    from datetime import datetime
+
+    from services.pagination import apply_keyset, encode_cursor
+
+    db = _make_session()
+    cursor = encode_cursor(datetime(2026, 1, 1), "s1")
+    for query in (
+        db.query(Session),
+        db.query(Session).filter(Session.status == "completed"),
+    ):
+        for page_cursor in (None, cursor):
+            page = apply_keyset(query, Session.date, Session.id, page_cursor)
+            plan = _query_plan(db, page.limit(21))
+            assert "TEMP B-TREE" not in plan, plan
+            assert "ix_sessions_" in plan, plan
+
+
+def test_game_session_lookup_uses_index():
+    db = _make_session()
+    plan = _query_plan(db, db.query(Game).filter(Game.session_id == "s1"))
+    assert "USING INDEX ix_games_session_id" in plan
+
+
+def test_penalty_lookups_use_indexes():
+    db = _make_session()
+    by_session = _query_plan(
+        db, db.query(Penalty).filter(Penalty.session_id == "s1")
+    )
+    by_team = _query_plan(db, db.query(Penalty).filter(Penalty.team_id == "t1"))
+    assert "USING INDEX ix_penalties_session_id" in by_session
+    assert "USING INDEX ix_penalties_team_id" in by_team
+
+
+def test_remove_game_lookup_avoids_full_scan():
+    db = _make_session()
+    plan = _query_plan(
+        db,
+        db.query(Game).filter(Game.session_id == "s1", Game.id == "g1"),
+    )
+    assert "SCAN" not in plan
+
+
+def test_migrate_indexes_adds_missing_indexes(tmp_path, monkeypatch):
+    from sqlalchemy import inspect as sa_inspect, text
+
+    import database.connection as connection
+    from main import _migrate_indexes
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_games_session_id"))
+        conn.execute(text("DROP INDEX ix_sessions_status"))
+        conn.execute(text("DROP INDEX ix_sessions_status_date_id"))
+        conn.execute(text("CREATE INDEX ix_sessions_date ON sessions (date)"))
+    monkeypatch.setattr(connection, "engine", engine)
+
+    _migrate_indexes()
+
+    inspector = sa_inspect(engine)
+    assert "ix_games_session_id" in {
+        i["name"] for i in inspector.get_indexes("games")
+    }
+    session_indexes = {i["name"] for i in inspector.get_indexes("sessions")}
+    assert "ix_sessions_status" in session_indexes
+    assert "ix_sessions_status_date_id" in session_indexes
+    assert "ix_sessions_date" not in session_indexes
@@ -0,0 +1,80 @@
+import pstats
+
+import pytest
+
+import services.admin
+import services.profiler
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture(autouse=True)
+def profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(services.admin, "ADMIN_TOKEN", "secret")
+    monkeypatch.setattr(services.profiler, "PROFILE_DIR", tmp_path / "profiles")
+    return tmp_path / "profiles"
+
+
+def test_requests_are_not_profiled_by_default(client, profile_dir):
+    resp = client.get("/api/teams", headers=ADMIN)
+    assert "x-profile-id" not in resp.headers
+    assert not profile_dir.exists()
+
+
+def test_profile_requires_admin_token(client, profile_dir):
+    resp = client.get("/api/teams", headers={"X-Profile": "1"})
+    assert resp.status_code == 200
+    assert "x-profile-id" not in resp.headers
+
+    resp = client.get(
+        "/api/teams", headers={"X-Profile": "1", "X-Admin-Token": "wrong"}
+    )
+    assert "x-profile-id" not in resp.headers
+    assert client.get("/api/debug/profiles").status_code == 403
+    assert not profile_dir.exists()
+
+
+def test_profiled_request_is_stored_and_listed(client, profile_dir):
+    resp = client.get("/api/stats/leaderboard", headers={**ADMIN, "X-Profile": "1"})
+    assert resp.status_code == 200
+    profile_id = resp.headers["x-profile-id"]
+
+    stats = pstats.Stats(str(profile_dir / f"{profile_id}.pstats"))
+    assert any(name == "get_leaderboard" for _, _, name in stats.stats)
+
+    listed = client.get("/api/debug/profiles", headers=ADMIN).json()
+    assert [p["id"] for p in listed] == [profile_id]
+    assert listed[0]["method"] == "GET"
+    assert listed[0]["path"] == "/api/stats/leaderboard"
+    assert listed[0]["status"] == 200
+
+
+def test_profile_download_and_report(client):
+    profile_id = client.get(
+        "/api/teams", params={"profile": "1"}, headers=ADMIN
+    ).headers["x-profile-id"]
+
+    raw = client.get(f"/api/debug/profiles/{profile_id}", headers=ADMIN)
+    assert raw.status_code == 200
+    assert raw.headers["content-type"] == "application/octet-stream"
+
+    report = client.get(
+        f"/api/debug/profiles/{profile_id}", params={"format": "text"}, headers=ADMIN
+    )
+    assert "list_teams" in report.text
+
+    missing = client.get("/api/debug/profiles/tournament.db", headers=ADMIN)
+    assert missing.status_code == 404
+
+
+def test_old_profiles_are_pruned(client, monkeypatch):
+    monkeypatch.setattr(services.profiler, "PROFILE_RETENTION", 2)
+    ids = [
+        client.get("/api/teams", headers={**ADMIN, "X-Profile": "1"}).headers[
+            "x-profile-id"
+        ]
+        for _ in range(3)
+    ]
+    listed = client.get("/api/debug/profiles", headers=ADMIN).json()
+    # Created within the same second: the newest two survive, newest first.
+    assert [p["id"] for p in listed] == [ids[2], ids[1]]
@@ -0,0 +1,192 @@
+"""Regression tests: route SQL statement counts must not grow with data.
+
+Every route in ``ROUTE_BUDGETS`` is called once with 10 seeded sessions and
+again with 1,000; both calls must fit the budget, and the second may not
+issue more statements than the first. Path parameters target the newest
+seeded rows, so writes get a fresh target each time.
+"""
+
+import pytest
+from sqlalchemy import insert
+
+from database.orm_models import Game, Job, Penalty, Session, Team
+from main import app
+from routers.data import _import_progress, _update_import_progress
+from services.jobs import _LiveJob, job_runner
+from services.projections import rebuild_all
+
+SEEDED_SIZES = (10, 1000)
+# Filled with the newest seeded session number as ``{last}``.
+PATH_PARAMS = {
+    "team_id": "spare{last}",
+    "session_id": "s{last}",
+    "game_id": "s{last}g0",
+    "penalty_id": "s{last}p",
+    "job_id": "job{last}",
+    "import_id": "import{last}",
+}
+GAME_BODY = {
+    "name": "Budget game",
+    "player_placements": {"t1::A": 1, "t2::B": 2},
+    "team_player_map": {"t1": ["A"], "t2": ["B"]},
+}
+PENALTY_BODY = {"team_id": "t1", "value": -1}
+
+ROUTE_BUDGETS = [
+    ("GET", "/api/teams", None, 2),
+    ("GET", "/api/teams/{team_id}", None, 1),
+    ("POST", "/api/teams", {"name": "New"}, 4),
+    ("PUT", "/api/teams/{team_id}", {"name": "Renamed"}, 5),
+    ("DELETE", "/api/teams/{team_id}", None, 5),
+    ("GET", "/api/sessions", None, 2),
+    ("GET", "/api/sessions/{session_id}", None, 3),
+    ("GET", "/api/sessions/{session_id}?fast=true", None, 3),
+    ("POST", "/api/sessions", {"name": "New", "team_ids": ["t1", "t2"]}, 8),
+    ("PUT", "/api/sessions/{session_id}", {"name": "Renamed"}, 12),
+    ("DELETE", "/api/sessions/{session_id}", None, 18),
+    ("POST", "/api/sessions/{session_id}/games", GAME_BODY, 19),
+    ("DELETE", "/api/sessions/{session_id}/games/{game_id}", None, 19),
+    ("POST", "/api/sessions/{session_id}/penalties", PENALTY_BODY, 14),
+    ("DELETE", "/api/sessions/{session_id}/penalties/{penalty_id}", None, 14),
+    ("GET", "/api/sessions/{session_id}/scores", None, 2),
+    ("GET", "/api/stats/leaderboard", None, 2),  # data version + standings
+    ("GET", "/api/stats/coalescing", None, 0),
+    ("GET", "/api/export", None, 6),  # data versions + 5 reads
+    ("GET", "/api/settings", None, 2),
+    ("PUT", "/api/settings", {"league_name": "Budget"}, 5),
+    ("GET", "/api/dashboard", None, 8),
+    ("GET", "/api/dashboard/history", None, 4),
+    ("GET", "/api/jobs", None, 1),
+    ("GET", "/api/jobs/{job_id}", None, 1),
+    ("POST", "/api/jobs/{job_id}/cancel", None, 1),
+    ("GET", "/api/import/progress/{import_id}", None, 0),
+    ("GET", "/api/changes", None, 6),
+    ("GET", "/api/kiosk/scoreboard", None, 3),
+    ("GET", "/api/metrics", None, 0),
+]
+
+# Routes whose work is proportional to the data by design (whole-archive
+# jobs), that do not answer with a single response, or admin-only routes.
+UNBUDGETED_ROUTES = {
+    ("POST", "/api/import"),
+    ("POST", "/api/import/stream"),
+    ("DELETE", "/api/data/reset"),
+    ("POST", "/api/stats/rebuild"),
+    ("GET", "/api/sessions/{session_id}/events"),
+    ("GET", "/api/debug/profiles"),
+    ("GET", "/api/debug/profiles/{profile_id}"),
+    ("GET", "/api/debug/slow-queries"),
+    ("DELETE", "/api/debug/slow-queries"),
+    ("GET", "/"),
+}
+
+
+def _seed(db_session_factory, start: int, stop: int) -> None:
+    """Add completed sessions ``start``..``stop - 1`` and rebuild projections."""
+    db = db_session_factory()
+    if start == 0:
+        db.add_all([
+            Team(id="t1", name="Team 1", players=["A"]),
+            Team(id="t2", name="Team 2", players=["B"]),
+        ])
+    db.add(Team(id=f"spare{stop - 1}", name=f"Spare {stop - 1}"))
+    # A running job and a tracked import, both standing in for real ones.
+    db.add(Job(id=f"job{stop - 1}", kind="rebuild", status="running"))
+    job_runner._live[f"job{stop - 1}"] = _LiveJob()
+    _update_import_progress(f"import{stop - 1}", status="completed", records=1)
+    db.execute(insert(Session), [
+        {
+            "id": f"s{i}",
+            "name": f"Night {i}",
+            "team_ids": ["t1", "t2"],
+            "status": "completed",
+        }
+        for i in range(start, stop)
+    ])
+    db.execute(insert(Game), [
+        {
+            "id": f"s{i}g{g}",
+            "session_id": f"s{i}",
+            "name": f"Game {g}",
+            "player_placements": {"A": 1, "B": 2},
+            "player_points": {"A": 4, "B": 1},
+            "team_player_map": {"t1": ["A"], "t2": ["B"]},
+            "points": {"t1": 4, "t2": 1},
+            "placements": {"t1": 1, "t2": 2},
+        }
+        for i in range(start, stop)
+        for g in range(2)
+    ])
+    db.execute(insert(Penalty), [
+        {"id": f"s{i}p", "session_id": f"s{i}", "team_id": "t2", "value": -1}
+        for i in range(start, stop)
+    ])
+    rebuild_all(db)
+    db.commit()
+    db.close()
+
+
+@pytest.fixture(autouse=True)
+def _forget_seeded_jobs():
+    yield
+    for size in SEEDED_SIZES:
+        job_runner._live.pop(f"job{size - 1}", None)
+        _import_progress.pop(f"import{size - 1}", None)
+
+
+@pytest.fixture()
+def seeded_sessions(client, db_session_factory):
+    _seed(db_session_factory, 0, SEEDED_SIZES[-1])
+    return SEEDED_SIZES[-1]
+
+
+def _url(template: str, last: int) -> str:
+    return template.format(**PATH_PARAMS).replace("{last}", str(last))
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "body", "budget"),
+    ROUTE_BUDGETS,
+    ids=[f"{method} {path}" for method, path, _, _ in ROUTE_BUDGETS],
+)
+def test_route_query_count_is_constant(
+    client, db_session_factory, query_counter, method, path, body, budget
+):
+    counts = []
+    seeded = 0
+    for size in SEEDED_SIZES:
+        _seed(db_session_factory, seeded, size)
+        seeded = size
+        last = size - 1
+        with query_counter() as statements:
+            resp = client.request(method, _url(path, last), json=body)
+        assert resp.status_code < 300, resp.text
+        counts.append(len(statements))
+        assert len(statements) <= budget, statements
+    assert counts[-1] <= counts[0], f"statements grew with data: {counts}"
+
+
+def test_every_route_has_a_query_budget():
+    routes = {
+        (method.upper(), path)
+        for path, operations in app.openapi()["paths"].items()
+        for method in operations
+    }
+    budgeted = {(method, path.split("?")[0]) for method, path, _, _ in ROUTE_BUDGETS}
+    assert routes - budgeted - UNBUDGETED_ROUTES == set()
+
+
+def test_export_loads_every_seeded_session(client, seeded_sessions):
+    data = client.get("/api/export").json()
+    assert len(data["sessions"]) == seeded_sessions
+    assert all(len(s["games"]) == 2 for s in data["sessions"])
+
+
+def test_leaderboard_over_seeded_sessions(client, seeded_sessions):
+    data = client.get("/api/stats/leaderboard").json()
+    assert data[0] == {
+        "team_id": "t1",
+        "total_points": 8 * seeded_sessions,
+        "wins": seeded_sessions,
+        "sessions": seeded_sessions,
+    }
@@ -1,5 +1,9 @@
+from datetime import datetime
+
 import pytest
 
+from services import fast_json
+
 
 @pytest.fixture()
 def existing_team_ids(client):
@@ -147,3 +151,100 @@ def test_delete_session(client, existing_team_ids):
 def test_delete_session_not_found(client):
     resp = client.delete("/api/sessions/nonexistent")
     assert resp.status_code == 404
+
+
+def _create_sessions(client, team_id, count):
+    return [
+        client.post(
+            "/api/sessions", json={"name": f"R{i}", "team_ids": [team_id]}
+        ).json()["id"]
+        for i in range(count)
+    ]
+
+
+def test_list_sessions_keyset_pages(client, existing_team_ids):
+    created = _create_sessions(client, existing_team_ids[0], 5)
+
+    seen = []
+    resp = client.get("/api/sessions", params={"limit": 2})
+    while True:
+        assert resp.status_code == 200
+        seen.extend(s["id"] for s in resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        resp = client.get("/api/sessions", params={"limit": 2, "cursor": cursor})
+
+    assert sorted(seen) == sorted(created)
+    assert len(seen) == len(set(seen))
+    assert seen == [s["id"] for s in client.get("/api/sessions").json()]
+
+
+def test_list_sessions_limit_and_cursor_validation(client):
+    assert client.get("/api/sessions", params={"limit": 0}).status_code == 422
+    assert client.get("/api/sessions", params={"limit": 501}).status_code == 422
+    resp = client.get("/api/sessions", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 422
+
+
+def test_list_sessions_date_range(client, existing_team_ids):
+    _create_sessions(client, existing_team_ids[0], 2)
+    sessions = client.get("/api/sessions").json()
+    first_date = sessions[0]["date"]
+
+    resp = client.get("/api/sessions", params={"date_to": first_date})
+    assert [s["id"] for s in resp.json()] == [sessions[0]["id"]]
+    resp = client.get("/api/sessions", params={"date_from": "2999-01-01T00:00:00"})
+    assert resp.json() == []
+
+
+def test_list_sessions_field_projection(client, existing_team_ids):
+    _create_sessions(client, existing_team_ids[0], 3)
+
+    resp = client.get("/api/sessions", params={"fields": "name,status", "limit": 2})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert len(body) == 2
+    assert all(set(s) == {"id", "name", "status"} for s in body)
+
+    cursor = resp.headers["X-Next-Cursor"]
+    resp = client.get(
+        "/api/sessions", params={"fields": "name", "limit": 2, "cursor": cursor}
+    )
+    assert [set(s) for s in resp.json()] == [{"id", "name"}]
+
+
+def test_list_sessions_unknown_field_rejected(client):
+    resp = client.get("/api/sessions", params={"fields": "name,secret"})
+    assert resp.status_code == 422
+    assert "secret" in resp.json()["detail"]
+
+
+def test_get_session_fast_matches_default(client, existing_team_ids):
+    sid = client.post(
+        "/api/sessions", json={"name": "R1", "team_ids": list(existing_team_ids)}
+    ).json()["id"]
+    first, second = existing_team_ids
+    for n in range(3):
+        client.post(f"/api/sessions/{sid}/games", json={
+            "name": f"G{n}",
+            "player_placements": {"Alice": 1, "Bob": 2},
+            "team_player_map": {first: ["Alice"], second: ["Bob"]},
+        })
+    client.post(
+        f"/api/sessions/{sid}/penalties", json={"team_id": second, "value": -1}
+    )
+
+    fast = client.get(f"/api/sessions/{sid}", params={"fast": True})
+    assert fast.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.json() == client.get(f"/api/sessions/{sid}").json()
+    assert client.get("/api/sessions/missing?fast=true").status_code == 404
+
+
+def test_fast_json_fallback_encoder(monkeypatch):
+    monkeypatch.setattr(fast_json, "orjson", None)
+    value = {"when": datetime(2024, 5, 1, 12, 30), "name": "Équipe"}
+    assert fast_json.dumps(value) == (
+        '{"when":"2024-05-01T12:30:00","name":"Équipe"}'.encode()
+    )
@@ -138,3 +138,97 @@ def test_custom_scoring_2p_applied(client):
     data = resp.json()
     assert data["player_points"]["Alice"] == 6
     assert data["player_points"]["Bob"] == 2
+
+
+def _add_game_with_players(client, session_id, count):
+    players = [f"P{i}" for i in range(count)]
+    return client.post(f"/api/sessions/{session_id}/games", json={
+        "name": f"{count} players",
+        "player_placements": {p: i + 1 for i, p in enumerate(players)},
+        "team_player_map": {"t1": players[: count // 2], "t2": players[count // 2:]},
+    })
+
+
+def test_add_game_scoring_lookup_independent_of_player_count(client, engine):
+    """Scoring config costs the same number of queries for 4 or 64 players."""
+    from sqlalchemy import event
+
+    client.post("/api/import", json={"teams": [
+        {"id": "t1", "name": "Team 1"}, {"id": "t2", "name": "Team 2"},
+    ]})
+    client.put("/api/settings", json={"league_name": "Warm"})
+    session_id = client.post(
+        "/api/sessions", json={"name": "S", "team_ids": ["t1", "t2"]}
+    ).json()["id"]
+    _add_game_with_players(client, session_id, 2)  # warm the cache
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        counts = []
+        for players in (4, 64):
+            statements.clear()
+            resp = _add_game_with_players(client, session_id, players)
+            assert resp.status_code == 201
+            counts.append(sum("FROM settings" in s for s in statements))
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert counts == [0, 0]
+
+
+def test_scoring_cache_sees_changes_from_other_workers(client, db_session_factory):
+    """A settings write committed elsewhere invalidates the cached tables."""
+    import json
+
+    from database.orm_models import Setting
+    from services.data_versions import bump_data_version
+
+    client.post("/api/import", json={"teams": [
+        {"id": "t1", "name": "Team 1"}, {"id": "t2", "name": "Team 2"},
+    ]})
+    client.put("/api/settings", json={
+        "scoring": {"first": 10, "second": 7, "third": 5, "fourth": 2},
+    })
+    session_id = client.post(
+        "/api/sessions", json={"name": "S", "team_ids": ["t1", "t2"]}
+    ).json()["id"]
+    assert _add_game_with_players(client, session_id, 4).json()["points"]["t1"] == 17
+
+    # Simulate another process updating settings without touching our cache.
+    db = db_session_factory()
+    row = db.query(Setting).filter(Setting.key == "scoring").one()
+    row.value = json.dumps({"first": 1, "second": 1, "third": 1, "fourth": 1})
+    bump_data_version(db, "settings")
+    db.commit()
+    db.close()
+
+    assert _add_game_with_players(client, session_id, 4).json()["points"]["t1"] == 2
+
+
+def test_startup_versions_settings_seeded_before_versions(
+    db_session_factory, monkeypatch
+):
+    """Existing settings without a data version get one at startup."""
+    import main
+    from database import connection
+    from database.orm_models import Setting
+    from services.data_versions import get_data_version
+
+    db = db_session_factory()
+    db.add(Setting(key="league_name", value="Old League"))
+    db.commit()
+    assert get_data_version(db, "settings") is None
+
+    monkeypatch.setattr(connection, "SessionLocal", db_session_factory)
+    main._seed_default_settings()
+
+    assert get_data_version(db, "settings") is not None
+    assert [(s.key, s.value) for s in db.query(Setting)] == [
+        ("league_name", "Old League")
+    ]
+    db.close()
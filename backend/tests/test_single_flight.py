@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+
+from routers.data import _export_versions
+from services.single_flight import SingleFlight, single_flight
+
+
+def _run_concurrently(flight, key, fn, callers=8):
+    results, threads = [], []
+    for _ in range(callers):
+        thread = threading.Thread(
+            target=lambda: results.append(flight.run("endpoint", key, fn))
+        )
+        threads.append(thread)
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_identical_calls_share_one_computation():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return b"result"
+
+    threads, results = _run_concurrently(flight, "v1", compute)
+    # Wait until every follower has joined the leader's flight.
+    while flight.metrics().get("endpoint", {}).get("coalesced", 0) < 7:
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == [b"result"] * 8
+    assert flight.metrics() == {"endpoint": {"computed": 1, "coalesced": 7}}
+
+
+def test_different_keys_and_finished_flights_are_not_shared():
+    flight = SingleFlight()
+    assert flight.run("endpoint", "v1", lambda: 1) == 1
+    assert flight.run("endpoint", "v1", lambda: 2) == 2
+    assert flight.run("endpoint", "v2", lambda: 3) == 3
+    assert flight.metrics()["endpoint"] == {"computed": 3, "coalesced": 0}
+
+
+def test_errors_propagate_and_clear_the_flight():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.run("endpoint", "v1", fail)
+    assert flight.run("endpoint", "v1", lambda: "ok") == "ok"
+
+
+def test_endpoints_report_coalescing_metrics(client):
+    before = single_flight.metrics().get("leaderboard", {}).get("computed", 0)
+    resp = client.get("/api/stats/leaderboard")
+    assert resp.status_code == 200
+    assert resp.json() == []
+    assert client.get("/api/export").json()["teams"] == []
+
+    metrics = client.get("/api/stats/coalescing").json()
+    assert metrics["leaderboard"]["computed"] == before + 1
+    assert {"computed", "coalesced"} <= set(metrics["export"])
+
+
+def test_export_after_a_game_does_not_join_an_older_flight(
+    client, db_session_factory
+):
+    client.post("/api/teams", json={"name": "Alpha", "players": ["A"]})
+    client.post("/api/teams", json={"name": "Beta", "players": ["B"]})
+    team_ids = [t["id"] for t in client.get("/api/teams").json()]
+    session_id = client.post(
+        "/api/sessions", json={"name": "Night", "team_ids": team_ids}
+    ).json()["id"]
+
+    # Hold an export flight open on the versions from before the game.
+    db = db_session_factory()
+    versions = _export_versions(db)
+    db.close()
+    started, release = threading.Event(), threading.Event()
+
+    def stale_export():
+        started.set()
+        release.wait(5)
+        return b'{"stale": true}'
+
+    leader = threading.Thread(
+        target=single_flight.run, args=("export", versions, stale_export)
+    )
+    leader.start()
+    started.wait(5)
+    try:
+        client.post(f"/api/sessions/{session_id}/games", json={
+            "name": "G1",
+            "player_placements": {f"{team_ids[0]}::A": 1, f"{team_ids[1]}::B": 2},
+            "team_player_map": {team_ids[0]: ["A"], team_ids[1]: ["B"]},
+        })
+        data = client.get("/api/export").json()
+    finally:
+        release.set()
+        leader.join(5)
+
+    [session] = data["sessions"]
+    assert [g["name"] for g in session["games"]] == ["G1"]
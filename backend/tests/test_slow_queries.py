@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+
+import services.admin
+from database.connection import Base, build_engine
+from services.slow_queries import (
+    SlowQuery,
+    SlowQueryLog,
+    _Planner,
+    params_shape,
+    slow_query_log,
+)
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    # Every statement is "slow", so each one is recorded.
+    engine = build_engine(f"sqlite:///{tmp_path / 'slow.db'}", slow_query_ms=1e-6)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def admin(monkeypatch):
+    monkeypatch.setattr(services.admin, "ADMIN_TOKEN", "secret")
+    slow_query_log.reset()
+    yield
+    slow_query_log.reset()
+
+
+def _entry(duration_ms: float) -> SlowQuery:
+    return SlowQuery(
+        statement=f"SELECT {duration_ms}",
+        duration_ms=duration_ms,
+        params_shape="()",
+        route=None,
+        plan=None,
+        recorded_at=datetime.now(timezone.utc),
+    )
+
+
+def test_log_keeps_the_worst_entries():
+    log = SlowQueryLog(size=3)
+    for duration in (5, 1, 9, 3, 7, 2):
+        log.record(_entry(duration))
+    assert [e.duration_ms for e in log.entries()] == [9, 7, 5]
+
+
+def test_params_shape_hides_values():
+    assert params_shape(("secret", 3, None)) == "(str, int, NoneType)"
+    assert params_shape({"name": "x"}) == "{name: str}"
+    assert params_shape([("a", 1), ("b", 2)], executemany=True) == "2 x (str, int)"
+
+
+def test_slow_statement_records_route_and_plan(client):
+    client.post("/api/import", json={"teams": [{"id": "t1", "name": "Alpha"}]})
+    slow_query_log.reset()
+    client.get("/api/teams/t1")
+
+    entries = [e for e in slow_query_log.entries() if "FROM teams" in e.statement]
+    assert entries
+    entry = entries[0]
+    assert entry.route == "GET /api/teams/{team_id}"
+    assert entry.params_shape.startswith("(str")
+    assert any("teams" in step for step in entry.plan)
+
+
+def test_statements_outside_requests_have_no_route(engine):
+    slow_query_log.reset()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT count(*) FROM sessions WHERE name = :n"), {"n": "x"})
+    entry = next(e for e in slow_query_log.entries() if "sessions" in e.statement)
+    assert entry.route is None
+    assert any("SCAN sessions" in step for step in entry.plan)
+
+
+def test_in_memory_databases_have_no_plan():
+    engine = build_engine("sqlite://", slow_query_ms=1e-6)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert slow_query_log.entries()[0].plan is None
+
+
+def test_failed_plans_are_retried(tmp_path):
+    path = tmp_path / "late.db"
+    planner = _Planner(str(path))
+    statement = "SELECT name FROM teams WHERE id = ?"
+    assert planner.plan(statement, ("t1",))[0].startswith("unavailable:")
+
+    engine = build_engine(f"sqlite:///{path}", slow_query_ms=0)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    assert any("teams" in step for step in planner.plan(statement, ("t1",)))
+
+
+def test_admin_endpoint(client):
+    assert client.get("/api/debug/slow-queries").status_code == 403
+
+    client.get("/api/teams")
+    data = client.get("/api/debug/slow-queries", headers=ADMIN).json()
+    assert data["threshold_ms"] == 1e-6
+    durations = [q["duration_ms"] for q in data["queries"]]
+    assert durations and durations == sorted(durations, reverse=True)
+
+    assert client.delete("/api/debug/slow-queries", headers=ADMIN).status_code == 204
+    assert slow_query_log.entries() == []
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 
@@ -80,6 +82,69 @@ def test_leaderboard_ignores_active_sessions(client):
     assert resp.json() == []
 
 
+def test_leaderboard_tracks_changes_to_completed_session(client, populated_db):
+    sid = populated_db
+    # Extra penalty drops t1 below t2, which flips the session winner.
+    penalty = client.post(f"/api/sessions/{sid}/penalties", json={
+        "team_id": "t1", "value": -5, "reason": "Foul",
+    }).json()
+    data = client.get("/api/stats/leaderboard").json()
+    t1 = next(e for e in data if e["team_id"] == "t1")
+    t2 = next(e for e in data if e["team_id"] == "t2")
+    assert t1["total_points"] == 1
+    assert t1["wins"] == 0
+    assert t2["wins"] == 1
+    assert data[0]["team_id"] == "t2"
+
+    client.delete(f"/api/sessions/{sid}/penalties/{penalty['id']}")
+    data = client.get("/api/stats/leaderboard").json()
+    assert next(e for e in data if e["team_id"] == "t1")["wins"] == 1
+
+
+def test_leaderboard_drops_reopened_and_deleted_sessions(client, populated_db):
+    sid = populated_db
+    client.put(f"/api/sessions/{sid}", json={"status": "active"})
+    assert client.get("/api/stats/leaderboard").json() == []
+
+    client.put(f"/api/sessions/{sid}", json={"status": "completed"})
+    assert len(client.get("/api/stats/leaderboard").json()) == 2
+
+    client.delete(f"/api/sessions/{sid}")
+    assert client.get("/api/stats/leaderboard").json() == []
+
+
+def test_rebuild_stats_matches_incremental_leaderboard(client, populated_db):
+    before = client.get("/api/stats/leaderboard").json()
+    resp = client.post("/api/stats/rebuild")
+    assert resp.status_code == 200
+    assert resp.json()["rebuilt"]["team_standings"] == 2
+    assert client.get("/api/stats/leaderboard").json() == before
+
+
+def test_leaderboard_after_import_of_completed_session(client):
+    client.post("/api/import", json={
+        "teams": [
+            {"id": "a", "name": "A", "players": ["X"]},
+            {"id": "b", "name": "B", "players": ["Y"]},
+        ],
+        "sessions": [{
+            "id": "s1",
+            "name": "Archived",
+            "teamIds": ["a", "b"],
+            "status": "completed",
+            "games": [{
+                "id": "g1",
+                "name": "G1",
+                "teamPlayerMap": {"a": ["X"], "b": ["Y"]},
+                "points": {"a": 1, "b": 4},
+            }],
+        }],
+    })
+    data = client.get("/api/stats/leaderboard").json()
+    assert [e["team_id"] for e in data] == ["b", "a"]
+    assert data[0]["wins"] == 1
+
+
 # --- Export ---
 
 
@@ -104,6 +169,50 @@ def test_export_with_data(client, populated_db):
     assert "settings" in data
 
 
+def test_export_stream_matches_buffered_export(client, populated_db):
+    expected = client.get("/api/export").json()
+    resp = client.get("/api/export", params={"stream": True})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/json")
+    streamed = json.loads(resp.content)
+
+    def by_id(items):
+        return sorted(items, key=lambda item: item["id"])
+
+    assert by_id(streamed["teams"]) == by_id(expected["teams"])
+    assert by_id(streamed["sessions"]) == by_id(expected["sessions"])
+    assert streamed["settings"] == expected["settings"]
+
+
+def test_export_stream_empty_is_valid_json(client):
+    resp = client.get("/api/export", params={"stream": True})
+    assert json.loads(resp.content) == {
+        "teams": [],
+        "sessions": [],
+        "settings": client.get("/api/export").json()["settings"],
+    }
+
+
+def test_export_ndjson_records(client, populated_db):
+    resp = client.get("/api/export", params={"format": "ndjson"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["type"] for r in records] == ["team", "team", "session", "settings"]
+    assert len(records[2]["data"]["games"]) == 1
+
+
+def test_export_stream_roundtrips_through_import(client, populated_db):
+    streamed = json.loads(client.get("/api/export", params={"stream": True}).content)
+    client.request(
+        "DELETE", "/api/data/reset", json={"teams": True, "sessions": True}
+    )
+    resp = client.post("/api/import", json=streamed)
+    assert resp.status_code == 201
+    assert resp.json()["imported"]["sessions"] == 1
+    assert len(client.get("/api/sessions").json()) == 1
+
+
 # --- Import ---
 
 
@@ -259,3 +368,64 @@ def test_reset_no_categories_returns_422(client):
     """DELETE /api/data/reset with no categories returns 422."""
     resp = client.request("DELETE", "/api/data/reset", json={})
     assert resp.status_code == 422
+
+
+# --- Streaming import ---
+
+
+def test_import_stream_roundtrips_ndjson_export(client, populated_db):
+    ndjson = client.get("/api/export", params={"format": "ndjson"}).content
+    client.request(
+        "DELETE", "/api/data/reset", json={"teams": True, "sessions": True}
+    )
+
+    chunks = iter([ndjson[:7], ndjson[7:50], ndjson[50:]])
+    resp = client.post(
+        "/api/import/stream", params={"import_id": "restore-1"}, content=chunks
+    )
+    assert resp.status_code == 201
+    assert resp.json()["imported"] == {"teams": 2, "sessions": 1, "settings": 5}
+    assert len(client.get("/api/sessions").json()[0]["team_ids"]) == 2
+
+    progress = client.get("/api/import/progress/restore-1").json()
+    assert progress["status"] == "completed"
+    assert progress["records"] == 4
+    assert progress["games"] == 1
+
+
+def test_import_stream_rejects_invalid_record_without_writing(client):
+    lines = [
+        json.dumps({"type": "team", "data": {"id": "t1", "name": "Alpha"}}),
+        json.dumps({"type": "session", "data": {"name": "R1", "teamIds": ["nope"]}}),
+    ]
+    resp = client.post(
+        "/api/import/stream",
+        params={"import_id": "bad"},
+        content="\n".join(lines).encode(),
+    )
+    assert resp.status_code == 422
+    assert resp.json()["detail"].startswith("Line 2: Unknown team_ids")
+    assert client.get("/api/teams").json() == []
+    assert client.get("/api/import/progress/bad").json()["status"] == "failed"
+
+
+def test_import_stream_reports_schema_errors_by_line(client):
+    body = b'{"type": "team", "data": {"name": ""}}\nnot json\n'
+    resp = client.post("/api/import/stream", content=body)
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["loc"][:3] == ["body", 1, "name"]
+
+    resp = client.post("/api/import/stream", content=b"not json\n")
+    assert resp.json()["detail"] == "Line 1: expected a {type, data} JSON object"
+    assert client.post("/api/import/stream", content=b"\n").status_code == 422
+
+
+def test_import_stream_rejects_an_import_id_in_use(client):
+    line = json.dumps({"type": "team", "data": {"id": "t1", "name": "Alpha"}})
+    params = {"import_id": "restore-2"}
+    resp = client.post("/api/import/stream", params=params, content=line.encode())
+    assert resp.status_code == 201
+
+    resp = client.post("/api/import/stream", params=params, content=line.encode())
+    assert resp.status_code == 409
+    assert client.get("/api/import/progress/restore-2").json()["status"] == "completed"
@@ -179,3 +179,23 @@ def test_list_teams_returns_color_tag(client):
     assert resp.status_code == 200
     teams = resp.json()
     assert all("color" in t and "tag" in t for t in teams)
+
+
+def test_list_teams_keyset_pages_with_projection(client):
+    created = [
+        client.post("/api/teams", json={"name": f"T{i}"}).json()["id"]
+        for i in range(3)
+    ]
+
+    resp = client.get("/api/teams", params={"limit": 2, "fields": "name"})
+    assert resp.status_code == 200
+    first_page = resp.json()
+    assert [set(t) for t in first_page] == [{"id", "name"}] * 2
+
+    resp = client.get(
+        "/api/teams",
+        params={"limit": 2, "cursor": resp.headers["X-Next-Cursor"]},
+    )
+    assert "X-Next-Cursor" not in resp.headers
+    ids = [t["id"] for t in first_page] + [t["id"] for t in resp.json()]
+    assert sorted(ids) == sorted(created)
@@ -60,13 +60,30 @@ const API = (() => {
         return text || resp.statusText;
     }
 
+    // GET responses with an ETag, keyed by URL. Revalidating with
+    // If-None-Match turns an unchanged list into a bodiless 304.
+    const validatorCache = new Map();
+
+    function cloneJson(data) {
+        return typeof structuredClone === 'function' ? structuredClone(data) : JSON.parse(JSON.stringify(data));
+    }
+
+    // With `paged: true` the result is `{ items, nextCursor }`, where
+    // nextCursor comes from the X-Next-Cursor header (null on the last page).
     async function fetchJson(baseUrl, path, options = {}) {
+        const { paged = false, ...fetchOptions } = options;
         const url = `${baseUrl}${path}`;
+        const isGet = (fetchOptions.method || 'GET').toUpperCase() === 'GET';
+        const cached = isGet ? validatorCache.get(url) : null;
         const config = {
-            headers: { 'Content-Type': 'application/json' },
-            ...options,
+            headers: {
+                'Content-Type': 'application/json',
+                ...(cached ? { 'If-None-Match': cached.etag } : {}),
+            },
+            ...fetchOptions,
         };
         const resp = await fetch(url, config);
+        if (resp.status === 304 && cached) return cloneJson(cached.data);
         if (!resp.ok) {
             const detail = await parseErrorDetail(resp);
             const error = new Error(detail || `Request failed: ${resp.status}`);
@@ -75,7 +92,15 @@ const API = (() => {
             throw error;
         }
         if (resp.status === 204) return null;
-        return resp.json();
+        const body = await resp.json();
+        const data = paged ? { items: body, nextCursor: resp.headers.get('X-Next-Cursor') } : body;
+        const etag = resp.headers.get('etag');
+        if (isGet && etag) {
+            validatorCache.set(url, { etag, data: cloneJson(data) });
+        } else if (isGet) {
+            validatorCache.delete(url);
+        }
+        return data;
     }
 
     async function request(path, options = {}) {
@@ -140,10 +165,42 @@ const API = (() => {
     });
     const removePenalty = (sessionId, penaltyId) => request(`/sessions/${sessionId}/penalties/${penaltyId}`, { method: 'DELETE' });
 
+    // --- Live events (Server-Sent Events) ---
+    const SESSION_EVENT_TYPES = [
+        'game.added', 'game.removed', 'penalty.added', 'penalty.removed',
+        'session.updated', 'session.deleted',
+    ];
+
+    // Calls onEvent(type, data) for every change to the session. After a
+    // reconnect (network drop, or the server dropping a slow client) it
+    // calls onEvent('resync', {}) since events may have been missed.
+    // Returns a function that closes the stream.
+    function subscribeSessionEvents(sessionId, onEvent) {
+        if (typeof EventSource === 'undefined') return () => {};
+        const source = new EventSource(`${resolvedBaseUrl}/sessions/${sessionId}/events`);
+        let connected = false;
+        source.addEventListener('ready', () => {
+            if (connected) onEvent('resync', {});
+            connected = true;
+        });
+        SESSION_EVENT_TYPES.forEach((type) => {
+            source.addEventListener(type, (evt) => onEvent(type, JSON.parse(evt.data)));
+        });
+        return () => source.close();
+    }
+
     // --- Scores & Stats ---
     const getSessionScores = (sessionId) => request(`/sessions/${sessionId}/scores`);
     const getLeaderboard = () => request('/stats/leaderboard');
 
+    // --- Dashboard ---
+    const getDashboard = (recentStatus = 'all') => request(`/dashboard?recent_status=${recentStatus}`);
+    const getHistory = (cursor = null, limit = 20) => {
+        const qs = new URLSearchParams({ limit });
+        if (cursor) qs.set('cursor', cursor);
+        return request(`/dashboard/history?${qs}`, { paged: true });
+    };
+
     // --- Import / Export ---
     const exportData = () => request('/export');
     const importData = (data) => request('/import', {
@@ -167,7 +224,9 @@ const API = (() => {
         getSessions, getSession, createSession, updateSession, deleteSession,
         addGame, removeGame,
         addPenalty, removePenalty,
+        subscribeSessionEvents,
         getSessionScores, getLeaderboard,
+        getDashboard, getHistory,
         exportData, importData,
         getSettings, updateSettings, resetData,
     };
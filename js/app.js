@@ -4,6 +4,11 @@
 const App = (() => {
     let activeModalClass = '';
     let recentSessionsFilter = 'all';
+    // Event streams for the active sessions listed on the dashboard. Capped
+    // because browsers allow only six HTTP/1.1 connections per host.
+    const MAX_DASHBOARD_STREAMS = 3;
+    const dashboardSubscriptions = new Map();
+    let dashboardRefreshTimer = null;
     const TAB = Object.freeze({
         DASHBOARD: 'dashboard',
         TEAMS: 'teams',
@@ -264,30 +269,16 @@ const App = (() => {
     }
 
     async function refreshDashboard() {
-        const teams = await Store.getTeams();
-        const sessions = await Store.getSessions();
-        const activeSessions = await Store.getActiveSessions();
-
-        const totalTeams = teams.length;
-        const totalSessions = sessions.length;
-        const totalActive = activeSessions.length;
-
-        let totalGames = 0;
-        let totalPoints = 0;
-        for (const s of sessions) {
-            const full = await Store.getSession(s.id);
-            totalGames += full.games.length;
-        }
-
-        // Calculate avg points per game
-        const completed = await Store.getCompletedSessions();
-        for (const s of completed) {
-            const scores = await Store.getSessionScores(s.id);
-            for (const [, score] of Object.entries(scores)) {
-                totalPoints += score.total;
-            }
-        }
-        const avgPoints = totalGames > 0 ? Math.round(totalPoints / totalGames) : 0;
+        // Teams are still loaded to warm the name cache used by the renderers
+        await Store.getTeams();
+        const dashboard = await Store.getDashboard(recentSessionsFilter);
+
+        const totalTeams = dashboard.teamCount;
+        const totalSessions = dashboard.sessionCounts.total;
+        const totalGames = dashboard.totalGames;
+
+        // Avg points per game across completed sessions
+        const avgPoints = totalGames > 0 ? Math.round(dashboard.completedPoints / totalGames) : 0;
 
         animateCounter(document.getElementById('total-teams'), totalTeams);
         animateCounter(document.getElementById('total-sessions'), totalSessions);
@@ -295,15 +286,38 @@ const App = (() => {
         updateSessionEntryCtas(totalTeams);
 
         // Update nav badges
-        updateNavBadges(activeSessions);
+        updateNavBadges(dashboard.sessionCounts.active);
+
+        await renderLeaderboard(dashboard.leaderboard);
+        await renderRecentSessions(dashboard);
+        watchDashboardSessions(dashboard.recentSessions.filter(s => s.status === 'active').map(s => s.id));
+    }
+
+    function watchDashboardSessions(sessionIds) {
+        const wanted = new Set(sessionIds.slice(0, MAX_DASHBOARD_STREAMS));
+        dashboardSubscriptions.forEach((close, sessionId) => {
+            if (!wanted.has(sessionId)) {
+                close();
+                dashboardSubscriptions.delete(sessionId);
+            }
+        });
+        wanted.forEach((sessionId) => {
+            if (!dashboardSubscriptions.has(sessionId)) {
+                dashboardSubscriptions.set(sessionId, API.subscribeSessionEvents(sessionId, handleDashboardEvent));
+            }
+        });
+    }
 
-        await renderLeaderboard();
-        await renderRecentSessions();
+    function handleDashboardEvent() {
+        // Other tabs re-render the dashboard when they switch back to it.
+        if (getCurrentActiveTab() !== TAB.DASHBOARD) return;
+        clearTimeout(dashboardRefreshTimer);
+        dashboardRefreshTimer = setTimeout(refreshDashboard, 300);
     }
 
-    async function updateNavBadges(activeSessions) {
+    async function updateNavBadges(activeCount) {
         const sessionBadge = document.getElementById('session-badge');
-        if (activeSessions.length > 0) {
+        if (activeCount > 0) {
             sessionBadge.style.display = '';
         } else {
             sessionBadge.style.display = 'none';
@@ -333,8 +347,10 @@ const App = (() => {
         Session.showNewSessionModal();
     }
 
-    async function renderLeaderboard() {
-        const leaderboard = await Store.getAllTimeLeaderboard();
+    async function renderLeaderboard(leaderboard = null) {
+        if (!leaderboard) {
+            leaderboard = await Store.getAllTimeLeaderboard();
+        }
         const container = document.getElementById('leaderboard-content');
 
         if (leaderboard.length === 0) {
@@ -427,9 +443,7 @@ const App = (() => {
         container.innerHTML = html;
     }
 
-    async function renderRecentSessions() {
-        const allSessions = await Store.getSessions();
-        allSessions.sort((a, b) => new Date(b.date) - new Date(a.date));
+    async function renderRecentSessions(dashboard = null) {
         const filterSelect = document.getElementById('recent-session-filter');
         if (filterSelect && !['all', 'active', 'completed'].includes(recentSessionsFilter)) {
             recentSessionsFilter = 'all';
@@ -438,18 +452,18 @@ const App = (() => {
             filterSelect.value = recentSessionsFilter;
         }
 
-        const filteredSessions = allSessions.filter((session) => {
-            if (recentSessionsFilter === 'active') return session.status === 'active';
-            if (recentSessionsFilter === 'completed') return session.status === 'completed';
-            return true;
-        });
-        const recent = filteredSessions.slice(0, 6);
+        if (!dashboard) {
+            dashboard = await Store.getDashboard(recentSessionsFilter);
+        }
+        const totalSessions = dashboard.sessionCounts.total;
+        const filteredCount = dashboard.recentMatching;
+        const recent = dashboard.recentSessions;
 
         const tbody = document.getElementById('recent-sessions-body');
         const viewAll = document.getElementById('sessions-view-all');
 
         if (recent.length === 0) {
-            if (allSessions.length > 0) {
+            if (totalSessions > 0) {
                 const label = recentSessionsFilter === 'active' ? 'active sessions' : 'finalized sessions';
                 tbody.innerHTML = `<tr><td colspan="5" class="empty-state">No ${label} found yet.</td></tr>`;
                 viewAll.style.display = 'none';
@@ -478,11 +492,9 @@ const App = (() => {
         }
 
         const rows = [];
-        for (let i = 0; i < recent.length; i++) {
-            const session = recent[i];
-            const full = await Store.getSession(session.id);
-            const sessionNum = allSessions.length - allSessions.findIndex(item => item.id === session.id);
-            const dateObj = new Date(full.date);
+        for (const session of recent) {
+            const sessionNum = session.number;
+            const dateObj = new Date(session.date);
 
             // Determine if today/yesterday/other
             const now = new Date();
@@ -505,15 +517,13 @@ const App = (() => {
             let pointsHtml = '<span class="points-pending">Pending</span>';
             let penaltyHtml = '<span class="points-neutral">-</span>';
             let statusHtml = '';
+            const winnerTeam = Store.getTeamFromCache(session.winnerTeamId);
 
-            if (full.status === 'completed') {
-                const scores = await Store.getSessionScores(full.id);
-                const sorted = Object.entries(scores).sort((a, b) => b[1].total - a[1].total);
-                const winnerTeam = Store.getTeamFromCache(sorted[0]?.[0]);
+            if (session.status === 'completed') {
                 winnerName = winnerTeam ? winnerTeam.name : 'Unknown';
 
-                const totalPts = sorted.reduce((sum, [, s]) => sum + s.gamePoints, 0);
-                const totalPenalty = sorted.reduce((sum, [, s]) => sum + s.penaltyPoints, 0);
+                const totalPts = session.gamePoints;
+                const totalPenalty = session.penaltyPoints;
 
                 pointsHtml = `<span class="points-positive">+${totalPts.toLocaleString()}</span>`;
                 penaltyHtml = totalPenalty < 0
@@ -522,14 +532,10 @@ const App = (() => {
                 statusHtml = '<span class="status-badge status-finalized">Finalized</span>';
             } else {
                 // Active session
-                const scores = await Store.getSessionScores(full.id);
-                const sorted = Object.entries(scores).sort((a, b) => b[1].total - a[1].total);
-                const winnerTeam = Store.getTeamFromCache(sorted[0]?.[0]);
                 winnerName = winnerTeam ? winnerTeam.name : '-';
 
-                if (full.games.length > 0) {
-                    const totalPts = sorted.reduce((sum, [, s]) => sum + s.gamePoints, 0);
-                    pointsHtml = `<span class="points-positive">+${totalPts.toLocaleString()}</span>`;
+                if (session.games > 0) {
+                    pointsHtml = `<span class="points-positive">+${session.gamePoints.toLocaleString()}</span>`;
                 } else {
                     pointsHtml = '<span class="points-pending">Pending</span>';
                 }
@@ -559,7 +565,7 @@ const App = (() => {
 
         tbody.innerHTML = rows.join('');
 
-        if (filteredSessions.length > 0) {
+        if (filteredCount > 0) {
             viewAll.style.display = 'block';
         } else {
             viewAll.style.display = 'none';
@@ -573,7 +579,7 @@ const App = (() => {
                 : recentSessionsFilter === 'completed'
                     ? 'finalized sessions'
                     : 'sessions';
-            viewAllBtn.textContent = `View all ${filteredSessions.length} ${suffix}`;
+            viewAllBtn.textContent = `View all ${filteredCount} ${suffix}`;
             setTabSwitchTarget(
                 viewAllBtn,
                 recentSessionsFilter === 'active' ? TAB.SESSION : TAB.HISTORY
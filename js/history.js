@@ -86,11 +86,12 @@ const History = (() => {
     }
 
     async function renderSessionList() {
-        const completed = await Store.getCompletedSessions();
-        completed.sort((a, b) => new Date(b.date) - new Date(a.date));
+        // Completed sessions with games, penalties and scores, newest first,
+        // one page at a time
+        const { entries, nextCursor } = await Store.getSessionHistory();
         const container = document.getElementById('history-list');
 
-        if (completed.length === 0) {
+        if (entries.length === 0) {
             container.innerHTML = `
                 <div class="empty-state-hero-card">
                     <div class="empty-state-hero">
@@ -126,46 +127,60 @@ const History = (() => {
             return;
         }
 
-        // Fetch full session data for each completed session
-        const sessionsWithDetails = [];
-        for (const s of completed) {
-            const full = await Store.getSession(s.id);
-            const scores = await Store.getSessionScores(s.id);
-            sessionsWithDetails.push({ session: full, scores });
+        container.innerHTML = entries.map(renderSessionCard).join('') + renderLoadMore(nextCursor);
+    }
+
+    async function loadMore(cursor) {
+        const button = document.getElementById('history-load-more');
+        if (button) button.disabled = true;
+        let page;
+        try {
+            page = await Store.getSessionHistory(cursor);
+        } finally {
+            if (button) button.disabled = false;
         }
+        const { entries, nextCursor } = page;
+        button?.remove();
+        document.getElementById('history-list')
+            .insertAdjacentHTML('beforeend', entries.map(renderSessionCard).join('') + renderLoadMore(nextCursor));
+    }
 
-        container.innerHTML = sessionsWithDetails.map(({ session, scores }) => {
-            const sorted = Object.entries(scores).sort((a, b) => b[1].total - a[1].total);
-            const winnerTeam = Store.getTeamFromCache(sorted[0]?.[0]);
-            const winnerName = winnerTeam ? winnerTeam.name : 'Unknown';
-            const gameCount = session.games.length;
-            const teamCount = session.team_ids.length;
-
-            return `
-                <div class="history-session-card" data-session-id="${session.id}">
-                    <div class="history-session-header" onclick="History.toggleSession('${session.id}')">
-                        <div class="history-session-info">
-                            <h4>${escapeHtml(session.name)}</h4>
-                            <div class="history-session-meta">
-                                <span>📅 ${new Date(session.date).toLocaleDateString()}</span>
-                                <span>👥 ${teamCount} teams</span>
-                                <span>🎯 ${gameCount} games</span>
-                            </div>
-                        </div>
-                        <div style="display:flex;align-items:center;gap:16px;">
-                            <div class="history-session-winner">
-                                <span class="trophy">🏆</span>
-                                <span class="text-gold">${escapeHtml(winnerName)}</span>
-                            </div>
-                            <span class="expand-icon">▼</span>
+    function renderLoadMore(nextCursor) {
+        if (!nextCursor) return '';
+        return `<button class="btn btn-outline btn-block" id="history-load-more" onclick="History.loadMore('${nextCursor}')">Load more sessions</button>`;
+    }
+
+    function renderSessionCard({ session, scores }) {
+        const sorted = Object.entries(scores).sort((a, b) => b[1].total - a[1].total);
+        const winnerTeam = Store.getTeamFromCache(sorted[0]?.[0]);
+        const winnerName = winnerTeam ? winnerTeam.name : 'Unknown';
+        const gameCount = session.games.length;
+        const teamCount = session.team_ids.length;
+
+        return `
+            <div class="history-session-card" data-session-id="${session.id}">
+                <div class="history-session-header" onclick="History.toggleSession('${session.id}')">
+                    <div class="history-session-info">
+                        <h4>${escapeHtml(session.name)}</h4>
+                        <div class="history-session-meta">
+                            <span>📅 ${new Date(session.date).toLocaleDateString()}</span>
+                            <span>👥 ${teamCount} teams</span>
+                            <span>🎯 ${gameCount} games</span>
                         </div>
                     </div>
-                    <div class="history-session-detail" id="detail-${session.id}">
-                        ${renderSessionDetail(session, scores, sorted)}
+                    <div style="display:flex;align-items:center;gap:16px;">
+                        <div class="history-session-winner">
+                            <span class="trophy">🏆</span>
+                            <span class="text-gold">${escapeHtml(winnerName)}</span>
+                        </div>
+                        <span class="expand-icon">▼</span>
                     </div>
                 </div>
-            `;
-        }).join('');
+                <div class="history-session-detail" id="detail-${session.id}">
+                    ${renderSessionDetail(session, scores, sorted)}
+                </div>
+            </div>
+        `;
     }
 
     function renderSessionDetail(session, scores, sorted) {
@@ -242,5 +257,5 @@ const History = (() => {
         }
     }
 
-    return { render, toggleSession };
+    return { render, toggleSession, loadMore };
 })();
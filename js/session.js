@@ -4,6 +4,9 @@
 const Session = (() => {
     let currentSessionId = null;
     let renderVersion = 0;
+    let liveSessionId = null;
+    let closeLiveEvents = null;
+    let liveRenderTimer = null;
 
     function isRenderCurrent(renderToken, sessionIdSnapshot = currentSessionId) {
         if (renderToken !== renderVersion) {
@@ -15,7 +18,23 @@ const Session = (() => {
         return true;
     }
 
+    // Keep one event stream open for the session on screen, so changes made
+    // from other devices show up without polling.
+    function watchSession(sessionId) {
+        if (sessionId === liveSessionId) return;
+        if (closeLiveEvents) closeLiveEvents();
+        liveSessionId = sessionId;
+        closeLiveEvents = sessionId ? API.subscribeSessionEvents(sessionId, handleLiveEvent) : null;
+    }
+
+    function handleLiveEvent() {
+        // Coalesce bursts (a game plus its penalty) into a single re-render.
+        clearTimeout(liveRenderTimer);
+        liveRenderTimer = setTimeout(render, 150);
+    }
+
     function showNoActiveSession(activeSessions) {
+        watchSession(null);
         // Show "no active session" view
         document.getElementById('no-active-session').style.display = 'block';
         document.getElementById('active-session-panel').style.display = 'none';
@@ -78,6 +97,7 @@ const Session = (() => {
 
             document.getElementById('no-active-session').style.display = 'none';
             document.getElementById('active-session-panel').style.display = 'block';
+            watchSession(session.id);
 
             renderSessionHeader(session, context);
             renderScoreboard(session, context);
@@ -142,8 +142,7 @@ const Store = (() => {
         return activeConfig.standard[position] ?? activeConfig.standard[4] ?? 1;
     }
 
-    async function getSessionScores(sessionId) {
-        const scores = await API.getSessionScores(sessionId);
+    function toScoreMap(scores) {
         // Convert array to object keyed by team_id for backward compat
         const result = {};
         scores.forEach(s => {
@@ -151,14 +150,19 @@ const Store = (() => {
                 gamePoints: s.game_points,
                 penaltyPoints: s.penalty_points,
                 total: s.total,
+                gamesPlayed: s.games_played,
             };
         });
         return result;
     }
 
+    async function getSessionScores(sessionId) {
+        const scores = await API.getSessionScores(sessionId);
+        return toScoreMap(scores);
+    }
+
     // --- Stats ---
-    async function getAllTimeLeaderboard() {
-        const entries = await API.getLeaderboard();
+    function toLeaderboard(entries) {
         return entries.map(e => ({
             teamId: e.team_id,
             totalPoints: e.total_points,
@@ -167,16 +171,51 @@ const Store = (() => {
         }));
     }
 
+    async function getAllTimeLeaderboard() {
+        const entries = await API.getLeaderboard();
+        return toLeaderboard(entries);
+    }
+
     async function getTotalGamesPlayed() {
-        const sessions = await getSessions();
-        // Sessions list endpoint doesn't include games count,
-        // so we sum from the full session data for active ones
-        let total = 0;
-        for (const s of sessions) {
-            const full = await getSession(s.id);
-            total += full.games.length;
-        }
-        return total;
+        const dashboard = await API.getDashboard();
+        return dashboard.total_games;
+    }
+
+    // --- Dashboard (single aggregate request instead of per-session fan-out) ---
+    async function getDashboard(recentStatus = 'all') {
+        const data = await API.getDashboard(recentStatus);
+        return {
+            teamCount: data.team_count,
+            sessionCounts: data.session_counts,
+            totalGames: data.total_games,
+            completedPoints: data.completed_points,
+            leaderboard: toLeaderboard(data.leaderboard),
+            recentMatching: data.recent_matching,
+            recentSessions: data.recent_sessions.map(s => ({
+                id: s.id,
+                name: s.name,
+                date: s.date,
+                status: s.status,
+                number: s.number,
+                teamIds: s.team_ids,
+                games: s.games,
+                winnerTeamId: s.winner_team_id,
+                gamePoints: s.game_points,
+                penaltyPoints: s.penalty_points,
+                scores: toScoreMap(s.scores),
+            })),
+        };
+    }
+
+    // One page of completed sessions, newest first. Pass the returned
+    // nextCursor to fetch the next page; it is null on the last one.
+    async function getSessionHistory(cursor = null) {
+        const { items, nextCursor } = await API.getHistory(cursor);
+        const entries = items.map(({ scores, ...session }) => ({
+            session,
+            scores: toScoreMap(scores),
+        }));
+        return { entries, nextCursor };
     }
 
     // --- Export / Import ---
@@ -205,6 +244,7 @@ const Store = (() => {
         calculatePoints, getScoringConfig, getSessionScores,
         exportData, importData,
         getTotalGamesPlayed, getAllTimeLeaderboard,
+        getDashboard, getSessionHistory,
         invalidateTeamsCache, invalidateScoringCache,
     };
 })();